@@ -0,0 +1,82 @@
+// Generated by scripts/build/placeholders.py. Do not edit.
+window.CARD_PLACEHOLDERS = {
+"images/00_the_fool.png":"data:image/webp;base64,UklGRgwBAABXRUJQVlA4IAABAAAQCACdASogADUAPu1qrVCppaQipA2xMB2JQBZ2dDYpAIBh9IsIqHhWrDp/r4KH5gTws8pVefAnJB0PMWgttvLYY1TzFZYNlqMAAP3vgRZsMu1/guxchR02ClThYf2tDHDDdHVls9KFHg0VX2XHDOPXYnvHrs+mD08NkS3C5QWObGh4TZqoA2lZinf5O0oWFiqFsICOFS3M2hTX+TadNabnRJ1ZT6A5pVDy/ESWfoT5q/yq1NFEgOrj0CXg4B0+1s81upBqiDgKuZDevkebABY7WXdmkTnlREM9RjSK5JzFz3KrWPnW48W1tRVWRoMjSIAcrRp4mZcsmBUBr6OQAAAA",
+"images/01_the_magician.png":"data:image/webp;base64,UklGRjIBAABXRUJQVlA4ICYBAACwCACdASogADUAPuliqE2pJaQiM/ZqqSAdCWQArz/sPOEdKoAAgHyT1HIVxrpmnA8olLJuOW7XRKsFJI8YZ+SfI/ELy1F9j04Es91o8EAA7hNU9CGv2R14scqvFsXtaMOf7VDM22Fkaj7MkjZ8yxcTPyWTaUNRGuhJQc8IjD8KmsCdqmwiE5KRegDHmJp86Xx16RoV77WVbstiTP569h7z4+vudKC00bqTfXfvYITzbTUnxapWB4y+0o8K/aw7QnVvn+DYEpEhBgfZwt8uvtm9mHOtXcpLtMLeSbxrxhZD09PVEbkIEeC8t5Grs/jSdX+yQAXgxUO/3T0T5ILeKZepoy2igDj3VRdiWw1qzqlvaYvsI9unWu/mQxe1cfd5k28ZCMPBeAA=",
+"images/02_the_high_priestess.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAADwBwCdASogADUAPtFanE2oJaKiN/1cAQAaCWwAnTL2hyBCKVgRud1u/LW9qMO0jALoYSaHk6LPXIYsCggTIYhDrGqw5pqxhzAA/q/9uie6+mNGenlpRyflCtm4s4wgazHbw/YhrVNShzxQRPlb2b00VaQSVdq3kIWYN2MPKuRwTRntxIDEm3/D9PObE58DHXN2gWjTUBtH6Dd6w9BxEbchBiATLMpvnmN3JgfOwY2dR25gSuyUZtdOwy6nKQ8bbsBjVqcbFnOdTea0Rc27zQO3V0r5shfj2Xk+b6ik/XRIZRgbe/9kXFggirGgLpt0/sG+WB7UG0zGVMTTu6NUiYckSNiY8iJivtB5Zr611MAKAHhUkAA=",
+"images/03_the_empress.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAABwCACdASogADUAPu1kqU2ppaOiMBgMATAdiWYAnTlBU9V0ANxDRljSRxJVKVaWpIbWVfnwrGJCNPPuZy6EKb9ngvGx17TQkanraXj4AP6X+1Tk2wCfOaQYCYc02SAEUhwJoEMqnRqUpGhh3glCAbIHzdqwd5bLetDfvTGzkpC5P5a6SIpwNMV7sXxwdxxm2uIBa5i1jrFsOcLHmzAHbaZojSYJpk1qScKTbZvlPIrKQHebHk6Sf9y5e6G0LDLJIy4XOPlwbqcX6B3NjExPaRRDb1WHDfb/uZYyyWmfbazC5urLQ4gdGKmf2ASlfD9BaKbWHIqlxyYer9OkQZggSE5jYOw88rHwvDN0HHDfr1Q9WJdgAAA=",
+"images/04_the_emperor.png":"data:image/webp;base64,UklGRh4BAABXRUJQVlA4IBIBAABwCACdASogADUAPuViqE2pJaQiMBv8ASAciWoAvnuhjCgIArqgwBXl9lmtTpi8wEGm8DSn06COY4dfK7p0NX8f9t9uGcYHoLbrArOAAP3a3tcUtQSuvgf8bmiF1Snfryi3rWtMB2omCUykKl0TsE/3/r3n+058Nn1js2aBMhUcVpBxpsvklt8h9U3FMzCprmJVo5fy8RkL0stGNOR8ZpCjVhB0EZrMAsDbkYnxUX6co3TOwViyjXaSP2JQ10OKYWcCVEIBx1Odroznwiu9snlFUHfqFl1qGXJoAzdv8vWCZlKSPM8dHLZrTsR7IWGCuLyZsaJdlEk6465JwT0gCKjhcYFSgg3YorRPfAPing3OAAAA",
+"images/05_the_hierophant.png":"data:image/webp;base64,UklGRgoBAABXRUJQVlA4IP4AAACQCACdASogADUAPu1qrk8ppiSiKBgNUTAdiWIAvntyCBAKiRhMd8zBMkBLJyWQvHDUNYo6hgCupprXb9Vi7bWLiXY3vAeoGKlcsOyFAAD8q6gzLwKHX3eOr5bGXghyoPXbrDXi2MatgEbdkC7Dybz3g9Zw3sMJu1aNgufDzqlKnHrOfBygd5mUaU27cqKWOJLBsnE0upEbcUukvrvFN+gRaV2Ft+3GGtAiMLzwtQU0C3WSV+5D962g7mPROtA9yn5/eB6Hgqb7/+F0IYPoKBsgc0JGsK/YXHdoUbESe9R86M5BpYAz5QJzDaDZWrWNN+qXI7ywZVnOfJh3DEAAAA==",
+"images/06_the_lovers.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAABwBwCdASogADUAPu1gp04ppSMiMBgMATAdiWYAnTOgLPwk0MuHBP02XMSuNqOwvLqwQjCDMS62DgML6lGusvkr1Uw5gAD91OwUBzpv7IIGv3YsL+Jprf3Vf5KbwMXofGd9HMJpUyLvVYfzO8i0lfw23/eYZw2C8CyASmrOQd2bNmKaOkVvSqCMHx+YOUpRQIPrh0AMxHDbptGfCvp2lC55lxK8Ld2G+iwJIIGJwlfEwlsvuxUqlimwjPZmKFBv/0RzCw0O8pzyxFowLYrvvwS9073s71IjNNZAvMc/NXdBrXwsjdk6Dn5v7ReCCpdumdN872dk2KlwT6EoEJ7O28uRetgCdWKMmVKT7VZlK0r17q570AA=",
+"images/07_the_chariot.png":"data:image/webp;base64,UklGRjQBAABXRUJQVlA4ICgBAAAwCACdASogADUAPuVaqU2pJKQiMBv8ASAciWYAnTNMCYhnPkYZTE7xxQHtrzHopVJuP/Wsnjeh0FWjhSLT8YFGdIyn7tzJWsjvQAD91OwYi4ME0yfGmRKAsZJKdbzaNg7DnIEUjrHpsUda8EXrlaO32bauTR5jyrGQ9EOWsHadyhh0E/VaRgYegf6SzjomyUvau1ic4IY8QRsbSTIIA72G4D449TfSQ/cmA02GnKWz/oFpmYL5AMag53T7hYQWGhVtX6nOSj/I12FSNnH8JIQQDZ7frSA1ZJF2Rfu1N2JzCzGHnYyXQqcyfAmaP5thyx6Ee1yVa1E6IIZThgNMHiL5IhHH94vl/4L5E8luYCUWWDuq5AZA7JvXFFp28CZkhDif3z6CcAAAAA==",
+"images/08_strength.png":"data:image/webp;base64,UklGRhYBAABXRUJQVlA4IAoBAACwCACdASogADUAPu1ipU2ppaMiM/ZqqTAdiWIAnTMhTCilgc+mKCrHYs6Wgls831TzFHY8Ftg7zGjFIUXtQqq5Qj030uwPOBt2U4119gAA/pQ4UZvCvQoROu4fMwHOnqK6nGLWv4bNvRG9zQU/XZwJVYH1q1O0gLgAcpaYP3Bqw208ZWPHRRs2p/bwVPJVHgacVCUcqycgYXg53Cb7YwYXb5JFS0pVi6hmujkc/HXHr9zH1yha9WPb5ua/Rw+NcF0qGYACiAg7Qbuo6+0mOGphOOF/5SSf7B/LIVOS0LnWneRVPa/eH7yf7WCMODx9wFtqKAgKYeKn5zA/CN7ics4VM6vEBpRE1NqYAA==",
+"images/09_the_hermit.png":"data:image/webp;base64,UklGRkIBAABXRUJQVlA4IDYBAACwCACdASogADUAPuFeqE2opSQiM/maqRAcCWIAnTOTTjbg4Uo2WRC0RihvA3hel8wt4YoISDvS8JEQtQWf8+mWcDyk9yQCzLL9OLpKZaAA/dXckEiMK+hVGGC5pCSuGDuysxvn/zx68rSx0vj/Jmdw03NwIeh9D06zlcjl5GaOWzdrIsCb++kAlq5cIyrGuucm58pCSpqjX32L1gGOSruc76tIPiWrZZtLIiYnLY9hWt0lgddXQcbeXiLPUcbXaI24dnHy1mgUiKdD0ZbcI3HjDdrSpY0xe+m5PB9g5etWdidlLzjroRb5FwS/qN7+YihzfyGwtyhqDpdoK5L9qMDMXrnQCocjHEupeVParCe/lEmdCJK6xSB8I5lk9/t0V19jWmT6xfldBg0/TsBVFFxr7kj2TwAA",
+"images/10_wheel_of_fortune.png":"data:image/webp;base64,UklGRhYBAABXRUJQVlA4IAoBAACQCACdASogADUAPu1kpk4ppaMiM/M6qTAdiWYAsR+ASRflBZNhE0cCFnQ65B3ABgVsjaxqu1OOH+5m+li9nKJ3dq0WuLdD5gieEJ2EwAD+BKNLrbkFT5oPaiTfm/83tvGxkiuNpyyWhSj+cWDeP+KKPIH90tUZSBTizO384JDLKHcyC2wykl3utHrJhQITxGTMkhBL+4AaGYs/TOP8bcRj41aN8JxSzMMflmqSifBt1IwYYJBmQmaq9+U6TTln/yLttrJKAG0r6c9fY2PMr7xctC2FgTZtfUr6EHUIpjOcBdnMBCetjZAgzkwij8+IxvOmVJlteBDXMPImAl2JZyT3/ACqgXUgwokAAA==",
+"images/11_justice.png":"data:image/webp;base64,UklGRi4BAABXRUJQVlA4ICIBAADwBwCdASogADUAPuFgpU2opiOiN/VYARAcCWwApd/1rpSWoTtORKdPyDRKpF8ri66jrxrbAHErU0uVyu4NxvEtkFrDsAI59IAA/q3GfMrXMTnt9Ys9saWjJyYUHusMatPdgPOEAnSKDu2K+H6ftbcOrURWpIxPBrDy0ZiexLe6EWLs0dygrW1PayjNODma1LpoaDw6HffxBcobaJWFOTw3RN4PEJG6c/1EczLgHU2J3bbjX3M3EP0bJI+/09yQqQ1hLJoXWNnUKkNIWzaq/jseSqNFPEBGYT33FSiHQguNvGeNALkkJ6uHyVUBhXea6AR3FN9VyLHEgNLhU8QC2efkesa+rdW5fR5Gf7PJTygr5fmVdbNoGNkRtUPqRvCrdorgAA==",
+"images/12_the_hanged_man.png":"data:image/webp;base64,UklGRg4BAABXRUJQVlA4IAIBAAAQCACdASogADUAPu1qq1GppaOiqBgMATAdiUAWXaA4GDyqJjehKwAPM5EqKGhiwUOjHuqYb66vLpn5Anh5BHACEKHAvRLFgtQAAP3tisDhl6I+LlkeV9OafJ3GUpf/LM4V7LteKbh00qEdumOuPGPsDn8MNCUy3ay+2eLyBc9xoMr7ApVb4J9m7ZbCZtWjXVvMtr5xdC7LCFCZvqh0w78rMB0wJ2AAEpMF6zbariyagLMnXk8zYQYzmjR7Ok69jHJ2NEOx+jSxmc5Aa7BBa4E2T5LNPU14oBtME2jQUlKpwjESZZaNPxNgByAOBZp2grxd6f/hvn20+i93iQfshIuAAAA=",
+"images/13_death.png":"data:image/webp;base64,UklGRjYBAABXRUJQVlA4ICoBAAAwCQCdASogADUAPu1erFAppKQirBVcyTAdiWQAnTM8dyAxAMy4WjiAi4oJnvX43uR843bMu2V2aTswF8vA/gksxxIoj1qOHeNoDAXSsBYd1twAAPdFnVqmfSnHKN+6jVoVOqN+rIV1i8w265Y/IlOtf78ICfUovJDB/In4Wyuqz1M2w3gLyjub0FnOHYdIuKhjyc6XYptS/VUVncn2CTflQE6gnKW6g9hn4DwHmqoD69STa4/aLHEprrE2ETT2DDcfVZo94Y8c1WatIfaMpFxbeqWJYsqPjmwb5wM3gKLlOMVO/g7ZV3SdYi9DZX49XDw4BZLWPosXhtecaoi0zwtjP9IxOfHRJ0of5pgFP9ASkLGxZYZe49YyYA4kguUx8zhWYYNQdBkxgAAA",
+"images/14_temperance.png":"data:image/webp;base64,UklGRgIBAABXRUJQVlA4IPYAAAAwCACdASogADUAPu1apU2ppKMiMBv8ATAdiWRdm2ALE4YrlkioR8xKFtnhHn8h/Xs3wptIRRP1Z0/VAOHLe301IQu5ePLE5OqdIAD+4rKVxUK3mU4bZslfL4J+u0hpw/sjtmuXswcCFTuPgqrIBUIWwtFczOP8lT/dO1B2i9f715c5aiaeCRda6FKH1ywYIaB6/o9gzfsiyW65SLHhrEFsTLRaLwxJjcRFeax/pRHNhHNEz6w49resC+LMQXW2wHSGxCrKDweAsuwNzsrWxXwDjFds9L+Jz7WW9lAPQTqM0+hmYg4s4LdDNcVkjN6L43uhFrAAAAA=",
+"images/15_the_devil.png":"data:image/webp;base64,UklGRjIBAABXRUJQVlA4ICYBAACQCACdASogADUAPu1cqk6ppKOiLBqsyTAdiWYAnTMExnh/AdGq5Uue/JOHXt8RIpMRw3QNUAziOmPfwop6J57Ljjww7DW44ttbyw58BAD9v2iUM3vXn+6XrmyvkXPZ6O2L+I9WF7DLUVRMPwWTAbPSfIG6MG6hP/NCN0z9+/USociMvLyuQy6iNiUY3uXH3+OZQFlzQCTKSnsqrrwM1TqS+xTePSjZ9RX3+L2nzNX5XRvhYhz154LL0gjtPNRt73YsFBBiitpLjmvJ5zOZnJCIj2y0S129fpwj40L4Tlh7HbbgzlcaPUkOxSuoHdXmSeNrCtla5hKncn8RvWs/nK9W5eGPyVkl1PLPK/4nbTy3nNbvE19CGY2Ax3FQAiAPI2+QCwAAAAA=",
+"images/16_the_tower.png":"data:image/webp;base64,UklGRjQBAABXRUJQVlA4ICgBAADQCACdASogADUAPu1iqU+ppSOiLBqrMTAdiWQAtRuzQowxAZVyB7Tf6AoR7mmj9hOu5+q8m2Q/f1sPdZrSCq4V6dBaSNp9fiFpp1ZsSd0AAPiwrvNroKcXNxayxEbMEhU5YzSV6dbxrJ5ABtRjtcQx1JxXYl6stC7mbRu9/f+ZvnlQ4UR5i0dr90uPqEkXThvzBj3STnGgOtfIZXkQzgt5+0uOq/Gvh7k5DbfLBzFT+Wp9f3B97SpQggixhh+A+xJd6l7mpjnkQplsXDnaTFGaTBKSItK1kkpNLB6qJLvotHSDC3wTLdQA9bfQvm+qBunNcltL0yNgHKabCQiXFuTtYFErDqd9r2oxmSJn5sLkkMVE4NguYSqPNNMyAeIXlFAhyinDvgAAAA==",
+"images/17_the_star.png":"data:image/webp;base64,UklGRhoBAABXRUJQVlA4IA4BAACQBwCdASogADUAPu1ssFCppiSiqAqpMB2JZACsM13B2mzI79FWOFr8Fvplr90PoRZtu0HZgw0Ed/rZ1pTfiZggdpwaGRgA/mAL3C8gf1/4hW3PwvtdampnH69CMPutBVjAB0JpV1bYVlyMc42CnLW/f5FQDhp2xhDVZweokmhKLoHbJfnNUeJIDsvav0NkwZhpSU4UFg2xFcIPC4g8jhnIPHsTePlQFSYoEgeyIFARYbxZrDHNKErovsNkCr7rLBnJYiw+IPxv1mN5QRzhUx21m+NWa5yoHNN+bu3V0M/zrmFL7F25WB5bTx0Ulj9ja2ArXzc7VtTwh/sE0zHwta8AO8UbWkMQEwiyCZoAAAA=",
+"images/18_the_moon.png":"data:image/webp;base64,UklGRjIBAABXRUJQVlA4ICYBAABQCACdASogADUAPu1qsFKppaSiqBgJWTAdiWgArDM3rDA5iCg6bA7yxaF/ePnlkW/9gQx5DF3+qMo4k+TPv8My+J1z8LonFa114ZgA/q2dxS1k6GT1xxGesfDjW7W89+q+jVQSq1aU4wQTX/JACUpOQy2dJtCzWu4XUEM6fGUQttH/HTv8nH4Moy7rBDulrCbDFg+XMZHL9/DvOtoYwGiT41yxQkq7PUJpwOYSJ9g36q3tAg6szeRDRP8SMx/QgVVnPovndTRfFnotFAGWo5PH9fPVhVdcJeHGZRp31A+j/fDME6K51iV+iPKEkmjyuAIQ/mCZzwewKbGWDKqPXnSDPs8Q+O/6LP9g6J32stb4bGPBm0qU9nPXIFQsOq56FxZbAXwAAAA=",
+"images/19_the_sun.png":"data:image/webp;base64,UklGRj4BAABXRUJQVlA4IDIBAABQCACdASogADUAPu1qr1EppaQipAyRMB2JbACdMrQJUC47MGt25800gmB45e+D/NFZot+efOWASGeqATDJgKkZzUcXPRdQ66ZQqcAA/pDmlazWkycacSkie3R6xJPQPe34yxaGP9uuTfKNauTC9DM++5RtWPp7K/1B9ZTQHvh14QXhC0GL1b4irGFANS2tKmF3rwQ735OQC54rPvBntji3thp86chvRyku7/r6JLWbTHsL0r8hNoecArhBdrR6OeLOWtgP8zE/AGAyZlR03e1FbIL0//qs5VF5iPQ2op/L+YF1rnGZn3Wg5qaDNW6aqSojqoc1XS+SsHq1P/emBB+rwsJVomFUb0b6D6kwidxkL4pUGjBsHHPt6L7wCBAK0mOVVanvLiQifHhT5QnI0OMKgAA=",
+"images/20_judgement.png":"data:image/webp;base64,UklGRiYBAABXRUJQVlA4IBoBAADQCACdASogADUAPu1mq02ppaQiLBqsyTAdiWIAqo/R6VLWAK4g1uryYi/xP3H8+3v0bW+uTQZEP0bo9BoYo/V0yMVgz8Qv43zbu6eRRV/IAP60CDCZLEhESnhsO1Pz3efK/17/WF3U84rm8TLJy71Hg/WAwEgEGnmW1t1S5Qgrj6hr5uSfB61pgOjHSuAZ4RYw3ey7lDdrzEn2TtLmOkGQdiwgcCHo1Js41gDIUAQ/wZICBzoVYeHQqUkUVlOC1bH8PEqxgP6u1fkEWpTd4aAQAriexVwlF1Yx9/25paMQWQ7oIuF4ZTYvZ08mxWQCo/zfbv2ArO2h6NsLIznK/biuTf7L/iAOUGsgBuGQiteW0Xj3CGtKx2WAAAA=",
+"images/21_the_world.png":"data:image/webp;base64,UklGRhoBAABXRUJQVlA4IA4BAABQCQCdASogADUAPuVcpk2pJSOiM/maqSAciWgAqSfnfthXgMl+jf8nx2mOmTQppfWA7SArZGG4qhhJu61RbJxjbgtIvRIyckh3c2JP+zf+AFVLgAD+ZjHn/0LX2+8m5Lm/c8wATe1FinNdo5XXFfTS3ugy3bkT90e1LSvyBqRFJz/MkrFGvGbgWYp4NVBnxGKxKPFjysLzFu6QhvdhEK9W+8GXeodtmhCbwxFGIpO6AixtYkng5ehdGGikH3eXfo2HQ926UgaF4Z6EnR/W89K3gi5v1LaRhlc7Po1fdoQ/yqiSKf9gE8om+3H2gA5HM5EZCUgVHYDiCM3lhtlD0Rrh+xWyT9aC+RUDV4DxAAA=",
+"images/card_back.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAAAQCQCdASogADUAPt1eok2opaMiN/qoARAbiWwAqSd+9n3Vge0imP9KrS6n6hpk7ShKhrEIZuDGhXN391UnEAUJMdBhO9VP5TFUB1//LvFkXWAA/cPm9xVMdEBzqZYmHDN1GBkgax5+RI2R5w+VVXsl3Ax3fU7KPz615vj8Ar77TmI4uor8S4Q4WPUCGgbIZ4ULo4zHVbBZeh6toBsDKMpnw7SZ1VRgvGt5OQsuGX2/llwy+DzW5D065V7jmdaUF4Ik9AfWM76cKoqiSXWwDGlDnU6li7vsVxlLJUPCYMHwMPYsY0Fy/uv52sMIPuBAgcbL3FORHx2LgYQe+ub8l7Yq3C6PYfmkGdA1etlI65SMyAAAAAA=",
+"images/cups_01_ace.png":"data:image/webp;base64,UklGRgwBAABXRUJQVlA4IAABAAAwCACdASogADUAPulepU2pJSMiMBv8ASAdCWYAsR7exIBAAr2ljVTi1q0CEUTWVLv3nLO5NoL725BX/pGIspRO+aHAkgoEiumx4AD+VY8LCOn4fq4QFdd+zceNtn869gLo7qULXVQaNoJ99gTV3Hjrjc+swI9hIkHaHR+bMYDCOrFqpqJ26gHbWUfDYpEYOTgF73DNsx+zhcOav0iNnvc5X/TfUmObMZPTOb9MmlH13SiePG0eSzo42xcf3X/Nf93HmbQnot/jhFLJT+Ryltb2zLZpyz2TLe7e0yTtiPqgoHnjUV+WxEyO+rJUmjjBq7z580UorwEcb85GR/TUAAAA",
+"images/cups_02.png":"data:image/webp;base64,UklGRhgBAABXRUJQVlA4IAwBAAAwCQCdASogADUAPu1uqlAppqOirBVbMTAdiWQAnTMM+KETACzaEKbV1VIy7bqsoPhUGt/1S8ZdfRqshF+Nn27jqHfVmhzvZXUTQY6KlRGlqcQAAP3tififAHXCkLtNYCgcrK/lqdcPSafzmqxT3cBO/rsEApY0Xpk+gNNeKgbw+qHB/pCUYwGfVK5Z0BcSWvEwSttOTRaeyq/SkbhWxF0g46549RhrfVAEUdEoDEckCB2+CXctFvuhBUhtZJMvDtNQVGlI3kkria9BVvOerb5jQ7NNL3zmZoP2mpOZ8BJqt+ZU05CgNToupoEsk4eUpOPlQcnXYjC+niULH3U0EPy+HcwcJwxeJCnAAAAA",
+"images/cups_03.png":"data:image/webp;base64,UklGRhQBAABXRUJQVlA4IAgBAACwCQCdASogADUAPuFapU2opSOiM/zKqRAcCWgArDL2iVCmPnAhXvJO0hxqWhbqnPOunlEG9nvGaYqquNq0ahaV3eT7XSgT+fKt3hWNtyjYKTquG4mTAAD+jb+wi8aionGhs1s/68YQPbm7WjrETPTSDeA/8DlSAD79JrSDhh2/Ae5Qua0A+xOy4GH3ifU/Qi+cj+wgrEb1zIC4fZbWjjedNB352WinAb17j2w9mrNQjDQIqlgCo7t2/5maiLan7G3SQORhBhLr9EKA4gNr7eYTeGsaL7P6e0d4CS4glHoBcOuINGv4y2ERvWayUWLg6Osl23alxtdQijuOCG9XGv/9AgcAHGiQZAA=",
+"images/cups_04.png":"data:image/webp;base64,UklGRiYBAABXRUJQVlA4IBoBAAAwCACdASogADUAPu1orE6ppiQiKA1RMB2JZAC1G0E8ZCFvzOuYU8jh2VfxcC8Pf9eFsdyZV5DbQZv4k15G5pa/CD5Du/ri/COTYAD+VWN7vmaHVLBK4ClpPa+jqvr0IAv4KK3EW8k8VKISfFBRC5pGQ6b1v1brwXX2ndHdI+llUkPGFnmn6ZRUZ5Vn7Wvj3RmKE+J6hXANVsS8nICiITug9UnJkgB9c+8Ns19bZ8KbySruVjlsWI6+zK2QT+Ye94nlf+3oBST78FjduVvV+oJUgAyraQqMkm9BDdHWrXMUhMcRDRabqbqsVFJp4MoUTC6AxwHfcsrBdSFkb9XKmCNBDDnwntCPZH06/UiiQHoBAjBBc9UAg46gAAA=",
+"images/cups_05.png":"data:image/webp;base64,UklGRioBAABXRUJQVlA4IB4BAABwCACdASogADUAPu1sqk2ppqQiLBqsyTAdiWQAnTMuPOwhJ5R3XRqBMei7MHm+/YjcJ5q+awzXF+ubP+idOhsbpUYuH/QydIuoZ5YAAPagtDUlGrwGParKlqFGhIGGngsgZI8iepoJQzdB26avwuHY1hArPfcVaAP+kFT6Lzb4gW9905aIQbDJWBJ1fYT5osXNEQiUssNqenoZgLHFFsZWSoTydW7roJb1L8PhbhySDIFP0nMlgJ5oUCAZelImHGeMdXJRTtvCaqPb9CswAlpW33FR9OVFmcgUtvwpVTszW/IFALSL1yD4sRqyofzEOMFD93LpWyr3P8WPrhQmLDAtZhCtEpTq8Hk63/UbfylHskt3y0odQgHfcjCgAAAA",
+"images/cups_06.png":"data:image/webp;base64,UklGRhwBAABXRUJQVlA4IBABAACQBwCdASogADUAPu1uq1CppqOiqBgNUTAdiUAXZnZmUKLgBQlz6rfxq11vcGPKN++x3o94k428miEDnPRkUqZsH3b1SswAziiI8M7Oh772naNYnWb5nefm/qlDyKHu9re+Mgpa1ieP99JItoLawqwRUXVDp3vJHD7MCfJhE4FXzPESzU8lzMr1qKa3ZIsO1ogdhMEJeFezk894vTJMnEA5NxHKXBp/ZQEQSwLYWyJvKlKciskifQf+sh49gg5QIy1SN6wVBsaK53a3TOnu3aK0NajG6PMk2NMQpIe7BLXwIWlEqAb5u1u2MObT/9TpHed9WbfydPrntHSZhyyVYqIMdoggL/ymXCpFvLVUZXAAAA==",
+"images/cups_07.png":"data:image/webp;base64,UklGRhgBAABXRUJQVlA4IAwBAABQCACdASogADUAPuVep02pJSOiM/maqSAciWQAnTO0h2gfQCJwRUBUmiSZUUgXFxKgUYAZYHNZI4vK7MKnxXjs/HjqBYfuGDG45cAA/OnhTLkEyqiyaqw0WRz0eu5vlLj+QV/WBn2bTJg17vJYuos5zKfZ7x0CGBtQr2cArAxh3oSI2MAMFcx4LbK1CwcWFRIZglkrqXqdGXD4NuHUAK4Yvdf7mi6S/JwcQiE81DXOAbAhJc9ZCc4ct2ax7Y5uA8q+5B3csTQIOnzeHri2Rg8veppncQ4QDEnAInIaaaX1vOpqS+HzYCI5i2LxrhQ0bDuuobaDlt+CZTvAeCvptppPH4438Ar70SBqAAAA",
+"images/cups_08.png":"data:image/webp;base64,UklGRiIBAABXRUJQVlA4IBYBAAAwCACdASogADUAPu1krFGppKQiqBgMATAdiUATpmu1/QIWZr52JZywx3D1dS0M9k9TSo+LuHkO43aWGs2Zv+hJJrjhfV5OdXCFgAD8Hg6pVMw/bVwzc0vbDd8kFiyBEBB7OyXkcF2l4B3xw7e8voiLCY1qjf1XxIUWDUspLEQsQidfQ7MM8gdEbD9Lk2UPW8gzE6+OGoG9EGYHhSayTgYwUSBF5hpMdTHylUhHTfFmVKlL/MrW4YDMBJRB+T/xNImXR3q8OGp9gRxHl8xu/p0lGDDw2khZar5COiMvsJDDHWa12ArbM6olgarxUevv3UpYJqdklnL04iEGlf/7lMRT0Ll8RhK3g9Zqmco7fkbKIcLHvuuAAA==",
+"images/cups_09.png":"data:image/webp;base64,UklGRjYBAABXRUJQVlA4ICoBAADQCACdASogADUAPu1mqU2ppaQiMBgMATAdiWwAnTK0ACBCvcbdK7imxfK7SHnmeh/zbEKHlVdOLJbkryPbPV/rV1XIRENDfN2uv9PhrP7QAP3V3JXqwazz457oDyqW4N3kilT1FG/Nz45BNpE2AaKDGKUllzhhE1UeKm1UBYc4QayOYf6A/1h/k/owPv4IyWRmAGjm+4Ran1tFjBcZ2Q/2I30IOQlDwDKlP7RQWhQak50bb6GfQP9uANPiaXoddo8RTlY+26jkvqyKgyJXU5h/0PYvJkC9dFMxmZB76nkc7JMyyJFmj0iR1ArsMch6pAVZ2jJ5tGGzmH3Q0NFHMZg3/SqzA5NqgHvOrcdhbgd4P/xRRsTRdF6PjwKS6btBqwkHs/PwHMepUAAA",
+"images/cups_10.png":"data:image/webp;base64,UklGRgoBAABXRUJQVlA4IP4AAADwBgCdASogADUAPu1gp04ppSMiMBgMATAdiWYAnTLddkgk0ML8SO6UUfAJtq8WjlawkJiAtUMH4LZM7rYzGPv4APa3xqnBK3DTlwyC+ghzpyW8SDj+oaZMutYzxmdFWSQ/tgs95gZOlwMKk0F2rIXpMBfPl7LPT16hkKN296Hj88E5wVSIkD7ZL4dRsYP5FGVreqXc6tgSDgNp7YIg8h1uyVzNrWJBU08doI2yfqja9THqr+oI4FNAUw6jHfyxU0IAF67d6lBQTk7Q7LJieL8gIt++NrD+Gp7eywLec2K+VajI9lBTSDgynea6GB6hOS196by+EZVjXIaTuWAYAA==",
+"images/cups_11_page.png":"data:image/webp;base64,UklGRiQBAABXRUJQVlA4IBgBAADQCACdASogADUAPt1cpE2opaOiM+qpEBuJbACsOY3VfjSNc6QAbgAfPfZuCBbXNxdGAYqelz2iUqZgQKUu9XhG8nRPFWcPzGlz9y/QY+4AAP5oQWb31eh0Bxo+jvu5amiG3WCuxCcxT47RFHhgaGZEgGV2Ym4yXcA6yGzm6jl83vzqd8J+gBEO2qF+Y+lp+JOCAV5E5Psn8H+nJHlF2TTnE+Mt9o/O7YqZI6sZbMT1Ql5merbTgPV2Ch6fPKSlo7Mn++hYoQtZ66R5fGIyrut85+OQpk5fTIm+Dbq/FMI1Hqf8hvfq72ZVHgPcu06rQZG917jHkqY9z7OQmyFJEOsxC97Gd79b+YvVTRtIAVOTqLcP4mIwAAAA",
+"images/cups_12_knight.png":"data:image/webp;base64,UklGRhABAABXRUJQVlA4IAQBAAAQCACdASogADUAPt1coE2opSMiN/gMARAbiWIAqScRsHA3A6NVa07TKVPDVihXjZ1Npwhy6m+UedZhKz96mn6wjGI56DbMrYIAAP5koFMtB/CQ05QrzawKUJ9VizE4xGk/HXnK7MWxm1OAvMdtaOOPwFh+K4gyEhkBfHc553DhVOWZmuFRPzwcEZpsMifXXSsgwdqNvbNKs8BmCAsL45tsf2MPx/9/ksIIlHsSteAJjEoBIvYDWOjiEjiERerQIHO9t3kAmVfLWOED34KsiNTfPaTE7BpjkCc6UJ3xBXuOhjfJJKMsA+GeYFuotDxNKZ1PJXZNTRZUJxETmou9rBw/O4AAAA==",
+"images/cups_13_queen.png":"data:image/webp;base64,UklGRgwBAABXRUJQVlA4IAABAABwCACdASogADUAPuFao02opSMiN/gIARAcCWQArDN2xgfCAndr9abipC3aPGMH7wQyT3bl1t489ychkERcKv0AtDZcIQ2AwvNauhtAAP3Ujmd4hrQzc2Cf3pqOSfvVN1+Hy+L1rixct1DHlzcLDPOrONFcySwleJieN6EitnB3eENjiqL9W4uQ8uU385qXPVlvjvVxwOpruj37qEhUpD7Wq46sg6HnIMdfVSW01laQ2v6X+DvtuwhC25ugCwmxU/JzXodnah7TC3Ap2lEMvFnb/4pKlLfrFZKrvNBcM1HmZ10AaAtomRi2inHQBzeBO+MubjlLQepco3xqNoMzmYAA",
+"images/cups_14_king.png":"data:image/webp;base64,UklGRgABAABXRUJQVlA4IPQAAAAQCACdASogADUAPuVWok2pJCMiM/zKqSAciWoArDO8vOxJolwHDhqBFCh8XlwDAaj6kBHyxQnzAh86TKeyq7+k9mg9GdwUIxQAAP5Vjzsi5VpGWpMya6fXqRq9a0FgUqICoOLQXpLHo2PeIUGoeMJAQfFQdIgC+gZkWzcnUO8uhToXaZ/WUtV4ZleTTA90SnKKswKh2GvzRxjjVbS7B1PucgyPCtKRWjo3Ix0TprOopj0YDr09c0KrpnzYEahIkBB2eoTpA9yXT0RWcWoI6Emz74SwmRLGHQLtBaWTHIyc4iOico31gkAM1L2WEA9w2nUupgAA",
+"images/pentacles_01_ace.png":"data:image/webp;base64,UklGRhgBAABXRUJQVlA4IAwBAAAwCQCdASogADUAPu1crE2ppKSiM/ZqqTAdiWYAp0cuQBEPAFezdHIzD89TTGTQYayOFIjRYH2J2iy7LIfvcuOatOLqiirdb7Cdxa5QU1lrNy2AAP5VWtWUfBRqxMpAPPqjhsvzgljtOfvnuQrCMrAwZVRIiLg97Vafx3KVGfJ4FRHQTR/phhazvU5flL7QJoEhdoBieXNsi+9PuR7HjaMGEcCCtzfJRUe4KDcFIosTdFvvDtP2kP4eTvD69HFqGnfnGyKuHw4+Sc5Mx2Ej97oLeHNNw8rgzQoCVQ1JjK4PjplF0tujJtjGkzI4xxAKTDpWXRhejQcc+afk5NW6OcCjeI52qBX+OHDOQhwA",
+"images/pentacles_02.png":"data:image/webp;base64,UklGRhQBAABXRUJQVlA4IAgBAABwCACdASogADUAPu1srVCppiQipA2xMB2JQBWGdWDkCF5AAFuhAHc34iJRfScchYin9rPc1NCQHucVpDXl7BgI0SpeBmzTL4LIlesAAPv7DL6kOKKpXcZowzZkP0Vhq4regmVPCUFJcdgHU90bUkRoLE+QP6LViM+BUAXc+J8IOeLelE14klVADrg1h+XWD9nBv3CP6di+dqwJm730TT/8J3RP4g+zjFffQY9l2CUClRKajPfyilMYesoq4S46Am4lqFFo01beXAJ3y3IwwaUlKLCj6eGIaToC02UhnXRy39Bu1EcKQ0Pob7VL2VT1B+sEucpuDeT7Nt0rqbh7Dnx/PMMGS8crgAA=",
+"images/pentacles_03.png":"data:image/webp;base64,UklGRgABAABXRUJQVlA4IPQAAAAwCACdASogADUAPu1kqVEppSOirBVcyTAdiWIArk8RwN0igCzZoEjE1JNkRxxuKkYF+Son96cSBpjtqDHLQsa8GBUIvK4+k4crAAD92t6585fMHBpSlfuuDmaW5UOsS+JBhxVd9Byi6cYxTgQh1DPmrgGCQsj4GU6eeiB6ZM8Pc8Am0+P7M9c+vMEpz+9K29GtvVqy3d1Hkv+BZVwu6dYCgalK9hzrXEwMyHtPv5nCAk7UkRRfA8eUGQdHplbnw0twERzxyGcsCaBhW1Mjjev0+jmf0F5fk4YHzj1NYfK3Q5m+L37NmDdox3YCq1fnryhaigAA",
+"images/pentacles_04.png":"data:image/webp;base64,UklGRhgBAABXRUJQVlA4IAwBAACwCACdASogADUAPu1oq06ppiQiLBVcyTAdiWIArk72sFdZotWCCotry7hOi+p2VOCIVfHhi64W4gA1QWJZyMzpJTWDbicTaFBe32s0SAAA/CBy0c2+3Nr46Wx2qEHWkazFMLNz3kf7Vo1yqGWHIZEmKwUP2by08kcs7PM4VmkIkCrL9V3murPvg9DIJhtsHUWXTUvCAdIlQBPvrrPIqDPWfTLh0x60lpR8qptcqHnb4ker14yP2RBJ7UfNsQ4sYvFJ/nBq3pyGPzrqVKIAImH7M6VvsEz+eOJt35yPTe7ROXLREUYe6mUwRLbQcGEINtevJwDV34lGHw0bWzYr2lTF+90Sg3ALfbWdEAAA",
+"images/pentacles_05.png":"data:image/webp;base64,UklGRhgBAABXRUJQVlA4IAwBAACwBwCdASogADUAPu1qrFAppiQiqBgNUTAdiWQArDOzPTASiHcz3uzNHMh7Ppj+/XrH8/FkSb4EOPYAv72PZl/EObkjARrYAP3D00EMGfag4FlGZ78ntXtjVY5dBLplpKImkizLO5XdU/Zwlj2IApCtUTdjdYoFBm3XvW7JQs5H1+pvnz71fKh4VtRtRcDMbCGpWcB/LQHsuNfyXx96MvKFb5GRfTXReACs0wp6RPL4YpzcaExsf0AyP5ZpgQKZ6rr6IfdcccP8Y5v6yrGmBR4sY0LDCTvfjrf6LWri3RTcqgm14m3YdB0ExMR09anXE0y/s7+Jqf7LL4r52OBDGJh8lfjjo+SrZsaKAAAA",
+"images/pentacles_06.png":"data:image/webp;base64,UklGRh4BAABXRUJQVlA4IBIBAACwCACdASogADUAPu1qrVEppaQiqBgMATAdiUAU6Oe+S/lT1QAs2tLam1iaVxyj2wLTC8Hd+WogV0WfuE8AC2aiqkJihiqEDlqV7COLqVAA+/Ptw963Bs3cnUpIh+STIFD6wkl2+3sph/fkQreGVyVOmjkgAx8Be7o3wusCdWdT201uD06XB21/u/bZYJwHCWvlyy+QhHkmDYnQ8Qh05Daf8oZOL07/uRfGy16Fdn5DmlMP0sRMUebuK3DY86XGwVLrNn1t4pO+ymvqBjG7e19DA/X1RO8+48o9JK7jsTNEbd5ubZ/R2wAODFCDCgn+rgmB2MtnK0+CLX2t4fZlxSFMdxmJ9819w2BMBJOJMDFgAAAA",
+"images/pentacles_07.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAACwCACdASogADUAPuFcpU2opSOiN/VcARAcCWIAnTNwtoEYHKaDDkds6R1G98hu0f4V+Lcc1Pzf9w7/cLYnnCyG1gFIH3WXAE6URcD2wAAAzj3NLwkUWcKukChB5s2P8bGIZckrs9mA+kz5V81NNwTQF0RprK9nnLrGooDcdSubgs80ze7UmnkOufEdEctZ5WDB3CdbeMKOY4yTWaMVb5/AD9w3YGmS8gexPDSNij6IGL0AvjeKUTLQd41F34w/xqw/UwrpWrWeGawa2vqbYkWOFb4zzxf76Y1OZukbNx850hZcNfuvLyA8Yavz2c7ncCOviZB/BFkAOaUgwiI/jGZY9m+hx5PUzDWQDEy5BTkZV5BIAAA=",
+"images/pentacles_08.png":"data:image/webp;base64,UklGRjIBAABXRUJQVlA4ICYBAADQBwCdASogADUAPu1qr1CppaQiqBgMATAdiWIApd9nPLa3fGAEiiP7B1xYTiv8IaZmNfhiAzmJQ2wSsfOT2pzxdnDMGnfaQAD+ToB9+ZPbITJ8OQ5p4p5jvMaeNymZhS4Ob7dsBNl2sIDYvl2FVqNfKRUaaIkfeTDHAhkblfnDpIBhzinuIppHYN9hWHuuEwNZmklt7qoTajqRiayPRzvyszUzCZbdEJOdWhqCLfjlx8tXlc/2Qrh7QsJ92Tf6WsO0AcQXcF5tP0e5mO3BhbXohExOViUfGOOWWEjn4c58a5IP6yx7moLRL5ytk75nlOVjQDNY8OtUauPDbHFUeTQEC2HGF8BhqmK7ehzAIaJFeicqAt8N+39UJw35lteePxAY4m0AAAA=",
+"images/pentacles_09.png":"data:image/webp;base64,UklGRiwBAABXRUJQVlA4ICABAADQCACdASogADUAPu1krE8ppSQiLBVcyTAdiWIArDlBUnXZQHodXPR6+8OsVxrnpG3QdgIsRnGxKRILbpyMIesb/8HuLJaA8XjTj7wvEvacAP5kgC/k+N51WLLpjzkGSeZXRXuBsh+anpoOE2anRbhtviR9T3slRxSJYAy1lwTiefAxmIabRfY3D8+FcF7xBWgvlaXxeSssmPiqwgzxIbOsi+w5WWYfrxz+TZXbaJTz8ZccEGfBA3BEMv0UHabd2IZ5+XvScoEZidAYiCfibXFTYgRfbBUHvDozid1AOvhEIy0Z7qq2qzKVUj/W5aQ9ucN1xLMcaDddFIZVMQOqAmnBiSD6T6/lezGKOMnxSJpqerb/X0cj4O8GP4R4td4QAAA=",
+"images/pentacles_10.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAAAwCQCdASogADUAPu1ur1GppiQiqBgKqTAdiWQAnTNyCcBVvme6wGdU9+ipr6ozFoOhtCXa/3+Y79eg4mffr32vpyjQDBw8M7tUBCiWKv/cuhYAAP3a3sD7FCHAG3W+E8IsTYI++Tbn9buL3vHDUvHoJ1GNh5o+ByDKs4SQnnQueGBMShy5O34eWUKlS7n3KE3yW5ZIf3Tm5B3/zIs86eyfYSAwuN5ggK72+nvamjiMGR71kWEmwmaSYJeOUxHWqQ0G6HGJHjhXW+RZVUF2itM0OgbC8SI6EZgpRGSUK5pQeg6Wa62C+YL3iRvRqDw4rMUAa0UFai7kvvZzZK6FXEItTk3Yh+dy6SjOy70axdodwVCUAAA=",
+"images/pentacles_11_page.png":"data:image/webp;base64,UklGRioBAABXRUJQVlA4IB4BAACQCACdASogADUAPu1gqlCppKOirBVcyTAdiWQAnTOIgi3YACyTTDbfTm6iqWnlk+tNHN0RHLhXKl6r8dtdhPpUe8FaV/X3oPxtpgoWAAD8IIIkyHWzoJfPYHuDznWchWgdkXKAFOLT9B3ibX2Vy2ih+/RlCleejXVieHJilXJnnfP4/UhYYWvP9016kupM1ROEUeeaNwRcujXgUsruC2fur0Twy9M0MwsCJ+R+CQKXDClSXrUfqFbAVqkUY/Trdik9astrXj+JWm0MEvwRpRIcLAnMOGNWS/5+lTvZ4N7E0goDLyeiWd+JKUlutwbQkx9gkA6VhCejWA2Jhmokd72CHaQaRFHnKcrDUpgXvkqoMcNDdk5MvKeBmt8b2AAA",
+"images/pentacles_12_knight.png":"data:image/webp;base64,UklGRioBAABXRUJQVlA4IB4BAAAwCQCdASogADUAPuFipE2opiOiN/VYARAcCWIAnTMchJhEEMg3M0NdrE0BD950ppdBuE+dEOmBJetnLXkmQHowydJMVw2dx28d9IJCld3fTOIAAPyrqDW/aj06Et2qd8vuLEY2H7xjRRrrxAKd09vukIxZwBDrj1YQMJyME129mq6qb3RVhvQGH4TGOSSWb8OEJEkjM/RFo/aV92cETFFd9KtSBCRqow0DgihzNIxfIEMxJzM3X2c0AV+SJn4Uq54SlJMG8J1SjDYbBPOvquIbfPaKs6AnVfcknjzd4nMIeLE7ptlNQIyHK0PNMBp43U/dtq5irI63K4M4hFPaciQD/jsKmpua+1PjLwi2H6dM42Vm0RQCGeWqdICgoAAA",
+"images/pentacles_13_queen.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAACwCACdASogADUAPu1urFCppqQiqBgMATAdiWQAp0dogsBAAOzQjs9YX93DWek4gONqT+OSCi0wjG96T6KGbAZitdgQZC84yfeVxlWowAAA/lVcmbjIZ5l5BZyQfI8C39eUDakDL61PkjhMbX5SjTlGIT70D8L82HtjIFSYRx0t4mA065LOeVBSFxeGqhTh6H06f/2OYLYfO5FfLTvR6WSYwfEJzhMLMIgAIxtOAug+7j0KgYTfglvmaw+aIbLt+N9ZGlOVqXNsrSQp3wM9tkh5tZtgXR61TMcrDannkN5f1GS8JjhNx0P8SLCNhu+QETOoHlSYToZklnzTDUJw2unCGjN8siZKCPdKikNVcgHagz7gAAA=",
+"images/pentacles_14_king.png":"data:image/webp;base64,UklGRh4BAABXRUJQVlA4IBIBAACwCACdASogADUAPuVip02pJaOiMBv8ASAciWYAnTlBVZWwAW7XUqg9yA8BevyCVFqifoY17fj2hEVBRi9wAS86fLxHEiQetYwISxxhStgA/cPTTGLO4i44NuMLb8tPmwOXPMo+Wrk8vUjA4Zzje6yRlQ3Gipl5lyXNz/4Ume/lXvjnszjhK1fdc8qX7Yt+QclRzzLBtGqBjApWlyBJqSZNiGTo0Yx3f0yDbvaaCYuX7dH34V4yZRjw1TzXzSVgR6acJWCjhQ04vlU3F+Un5inZJjjE1k+AB4MBfiJjRLBAojVFc5pu0KnRQJlkgn/eba3W6VKUYpQLSCVLCtgcGBra0nJomSzR6nc7mt/RkQXldQgA",
+"images/swords_01_ace.png":"data:image/webp;base64,UklGRgYBAABXRUJQVlA4IPoAAADwCACdASogADUAPu1qr1CppaQiqBgMATAdiWQAnTMuN9UYACzbgE16rF5p/PERmkwzs6uG60rllTw4PvAouN5gXDjVyF7K031/5juG2w5kAAD+VY8ObMvyHO3DpRHpOd+3r0IHvqbAbX3QsQtT7YvLQpgBZDT7zp4Gr7u/YTv8vjvtTzFtcmpeYDleRQKw+diZTMJvstDugVVol6hvtAJA1EVIrR5UYdjm+eeDKYgpuf6//W8OQPyI4e3z0nVw5qJqUpBKPhbnE05EYmrrwCS5YYHod7GYhfb5Ooqqu0lv0tKMOCfV/XXvpn5ciw/Sh5Cw+tz9ubEEAAAA",
+"images/swords_02.png":"data:image/webp;base64,UklGRgwBAABXRUJQVlA4IAABAACwBwCdASogADUAPulkpk2pJaOiM/mYASAdCUAWI+/gPwbgAaz22bG4PHDnHQXhfCAi8C6a3My8cOcso7mdnSy38s87U6KoAP5VjxxGbwh17FuAwfDtMIs+7T9VeoUsDwc4kBOha2sqWCQen81434+NvXAT/AD9VzrQUh6uuDVKQ/8IkgTNj98FSovqd6pgp5+4+Duy1tXVxcEZLloyhRQwHs58MUOVo087w+9EhLE9q8X+3QV4er9rAnZNF81B0hn725jRIM4Dc9xKNAQ8q0sozceM4Tbto56a0zs1H9oTr0cet7WVddh+VHZud1YVHWmU/IdSfy+Bl93m2JMxgAAA",
+"images/swords_03.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAAAwCQCdASogADUAPulkpU2pJaMiM/ZqqSAdCWYAsR83xWEM+gAAv9uWoSXdd7mOdoyyUyLzuF+RFraEN0g/u4F+M5aPbxMN7D6Np7c92Tu+IzzgAP3tRHZO562em8smmkk7Lv16HfxtFVufnjVnwSPabiPg+6x9WAfpIM1MNsNRlFtvfBbHIq7s94C7RxtnHJiBFhnU/ccImtfYVcCTxAYMx2BRNmLOjsp9mbhjH7L75toxmuNT5IrlQlHCcU5O4fU2Yq1qbI67KrXvDjbHx86TCsRqYkQYC4rvQyG4nDUk93HJ3yAx33P13LLxWHM5KwrgddXq6M7suWMRueQ1nvDuRYhhs418C+Xy/oKBsvqniRAAAAA=",
+"images/swords_04.png":"data:image/webp;base64,UklGRhgBAABXRUJQVlA4IAwBAAAwCACdASogADUAPu1irVCppSQisBQKATAdiWIArk+IcO0AAChzOlObZmpBUE/d7DIs2I6vmII0x0LbZgDuZ1gRUvCpkuTr9Gn4gADh25onVTp9uZzlp7tKClj5l54bYB4V7fbmttaYYqGei7Hoh1riUSgGnE9dLjtvtwE2JoVxsz0gGvp1U16f+1zJ6eoMo1eoxefjBsTXOYZlO4nGl3M0niFm7vQBCA1myrYH4AIvUwUtCnuyvm5gfJ14F/0m+IEppJnw2holDib8TRo8NpkE6fuxTaQiP6Nn6Xv4tvAHew1IOxOfZqz9qf/EBHN16LzjfxXN7DQ6ZJm68WY+vvJohC5MT9B68M1zwAAA",
+"images/swords_05.png":"data:image/webp;base64,UklGRhoBAABXRUJQVlA4IA4BAADQCACdASogADUAPu1kq06ppaQiMBQMATAdiWIArDNKwN0gHKBB43V7HmfBdlP3iIJm3jIO9EDZ7cWmhZuTlseTfIlNXhIXqdGTbFoUfkCwAPx2NFVbkRyqerEaVCEL/y/v64UnzNt2wHgOlE7lvP9T6oANthWYZV1vVGgj0oC5wD9C7gM3cjQyxwrghbpfABTYX6coGcZ+dn+IGeRhTanGcHvZcFu5g7+RtTX5B6l/FIHxp+aSc4jiHt1f40B4UduCa8VkCRKh1/Ns56A+ttMOXLh+RY5qb9MQFjR4xsDvQG6/FARMnO9N81i/yHy/Gc5vD+5ONN4XBaGUj6mv7UfTI5TmbAUvw4hHSg4OAAA=",
+"images/swords_06.png":"data:image/webp;base64,UklGRgwBAABXRUJQVlA4IAABAADwCACdASogADUAPu1ur1KppiQipAtpMB2JQBOnKCqrzGIac9AC3bNDVJuv05oAaSjtU5prA3scBttrf/AAzWwtVrJaDvB56mLLO/jLWLavMAD92t6plm606+L82kXNZxuEHzTqS7aD1zRwwRODnN6Pft7mG/gMdqjoKCTVEDKs2tM7299ZyQJkg2l3oGDdDNuoZzbonrTJt9vvbqNQwhxQrJ03CThlmC1kNznSMAfWhqyl+oZR71as6v+hzyTh5fAY0RrqGPiQWrCzQgny7dvCNgH095m1Q3QeGUY7z1ojpvFDQCTL7/0GK//CCgWeSLJCpWHYSIIEOQcIXcouYAAA",
+"images/swords_07.png":"data:image/webp;base64,UklGRioBAABXRUJQVlA4IB4BAABQCACdASogADUAPu1gp08ppSMiM/M6qTAdiUAVJOBv16MQBO8Fl3dYQcITwsPGIgLZBWnfniQKk3x9XW8DXqIPKR3YL4i4FBkaKHAA/b6/FkoMWXapdrx9uUONB9f26ixATCwgKtB4OomhZoriHCmI/hjBRBMmVD1pKmYpbHWC7m6qwzPFfKR7dffRNkjg4p3gM4PxZl12B67hWiMUdB8xQnVCyLDra5HbYJgk76TIGanCmRtmcFJ/AmDPDNUeINSG7BDWvqyiAGxBjbEH/0Cr3HO2MwoktwWfoEeQlEwGQaKCjWIZwtfxARzoeAnH7sHGUJDWutR2i08U62S0Bj5b73RF0Z9bUPzZAHLRLDyhzggeaeEn5JSGzvdWx4AA",
+"images/swords_08.png":"data:image/webp;base64,UklGRgIBAABXRUJQVlA4IPYAAABwCACdASogADUAPu1qq1GppaOirBVZmTAdiUAYIe/fHgJMeJRYhje8OYeyRbaJXd9Kr1pZ9yGomsNAheH4/e7KKOyima8Sl8tRQhQAAPx2NPDXnBtnWLEwAFj2KvxPRzpQn6rS8uxsX0k2PP0sjiKaU0BvYt6l7sIEFqJ+glCl8AizGs6rnZvwYe5oQDYk4mNPhTybAxAX7lJseBTNJPuwvSRRh290vZjPmh3L/oyHO6aBfzHFqdasPSJtkGqjUN/xaxSXoixinaQO5GC42dWCN1XOkVYZUciufb0NsG1GBEbr/Ku8yQlts67Vd6pPfTCNXdZDAAA=",
+"images/swords_09.png":"data:image/webp;base64,UklGRhwBAABXRUJQVlA4IBABAABQCACdASogADUAPuVkqE2pJiQiM/ZqqSAciWIAqSeLr4AB5Q2XmGLHbLav7CxEexPSvVCKnuM31OdfDc+QHaaBtlOzLz2a7K6g6tgA289UGE1AL1tWE8d4bdHMYaGk/1vGsbvU4uGNMeU1eV+Ahh1LeozBAfCAfWi/ApZSOT3piHgGPm8MD7JcdfvYdcHk2ebxV10h466iwvtkvzms/4Ouz5LnJIFQqoo5ymz3QABh2zRYdVVzZ6kEhOrmFBkrLAMsF6pMFsR9U8e2jAgYuAQ0gNzDJ1OYRr6Ri3MEhpGbTlMyMcfFUNYL7NLyRWLmXr1pQX+5yL9Unu7apT5wQ4qhMQQKKqNzbw970vHEyh6QAA==",
+"images/swords_10.png":"data:image/webp;base64,UklGRiQBAABXRUJQVlA4IBgBAABQCQCdASogADUAPu1opU2ppqMiMBgMATAdiWoAnTO+B2gVJEYicU/k7Crl/PLWKBGj5t941etvm8sOJv20Pgquuj/jnz1pj5Y0lQTtxb3yTR5i4gD8Y6AzhS2FQkN9aKh4uPiqUXj5ovPo0vz3ZZkgJw/Hx7y3PrA51LSACIIaaXp+SIT53qetkNZgf5A+wxPUYY8Xnq5D6XE7Xb8icIxaOX9KPeSUfxgPcCcTRXxQDChhLdsl/BryW3ZNHJIZe+lAKk2d4HhdvFkzhVv3JQT5dTgjUFXLRbDblEpgzzA1Ea7TYw+8J/mMxmLfEYk1kFPyTbmB1h9dHUU9gDqKU7x+AcqBLbDePYLKkn/Ri8rV1AThQSYEwAAA",
+"images/swords_11_page.png":"data:image/webp;base64,UklGRjYBAABXRUJQVlA4ICoBAACQCACdASogADUAPu1mrVAppSQiqBgNUTAdiUAW/XLXeiKkWPAt3/4BXkqUvxR4AjScj2ZPc2slfUDKInaegCKcoWaug7mgMfZsnqNlAAD7+w0w1SYUGGt/j04yGUIQltakHMM3pEJTxekVWq/x8aXOBnI2i400C3sWpFhUW17coyQwPfgQ4jHmD4wg4N7FYTXc80z7OUxKcKXJsWS6vvXyYzsv5k0+N3y7zFQWk4ZkzB3YPKrzo2F6B6z0CGEV16TlS4sTUIP2EbKV2Jzg2VhBIlRVra2bZfhyhxDq+95cN3jKvSdH8EImYMC0VwWwsEbwrudJHVMlQLQQ6MsVtMyDVnzgFNC/cZy5pixgpbKDa1gWgtWnaiyyYByA2JA3giuoglYwFJB2AAAA",
+"images/swords_12_knight.png":"data:image/webp;base64,UklGRkQBAABXRUJQVlA4IDgBAADQCACdASogADUAPtleo02oJaMiN/qoAQAbCWIAsR91gN0bnIdGwWoZvhKR6UIx8ZObifMA69EPJWAI3zCfpnZoa1mRkfjPoNUcNrTSYIlAAP6JMFCDqRydrNvtxX1GLDDr/tvb7cH5ElVRgI5K6Tdc0JaWcnPLvGZ6ZCEL+QhumZ2i5A5HTNX+icxn6nF+3w+bIRbbe1zPnYmbuDH9eZU+5HitY+qciSkUoBtvrhdL96Gx0IbwOFZQvVA2+GaJXGZ5traPtbjfTvDHaheTEhlGLRX3WrClAaK2kPMYgXO/dNyiuBzG/faKTFm66gUP4R4UxK75ldDJ1LygN2WvfWtRU+0tzHifUanRwsj+EP7ClvysCpIkUrV8Jd/O5+6IF8mPkLfdZkfS4pUePsyI0U1+ebyzqczYoAA=",
+"images/swords_13_queen.png":"data:image/webp;base64,UklGRhYBAABXRUJQVlA4IAoBAADQCACdASogADUAPu1grE+ppSQiLBVcyTAdiWIArDmB1vWwVBEFeBQ4sDM2srRLrZmc9MtTV4XcjcomsHe+DBjtA7rx71AN5a6G+1y62HtAAPyGae/D1PlXi5dvLohoYapu57nRGZI3pljd5cZYGruJaKoGidI0fMrWCxvULq6AFgBYIkKZi3LD9iIWmslhrBP413i5QhVxEDf8fIbsWENX0zXDlXpXCoL0EX2ZUqrG1tIATPjcE8++esh9Eeh87V2MLboJysex5O7eKALcIVrIHvmKXKQMvyj1FKT9wtjUGlhHW3dbi2Bk8rnLLXsWABGevJHc89jxW7xpz9USofkBTAiWR7uKBMAAAA==",
+"images/swords_14_king.png":"data:image/webp;base64,UklGRiABAABXRUJQVlA4IBQBAACQCACdASogADUAPuVeqU2pJSQiMBv8ASAciWgAqSdieOHZgI/iyAzEig4ogTx/5e15vjUc6rsl4SirZrQJfxfFfgDJGB6CNOz7lPY6AAD91OwiYpl7ZZUaoFn4It+hZA0oSLnBnQwgVucapsRHNFnTOTv0ef25SQnxBoMcfNmuzdc+nzZtWu3UCmTOZ/jyaIf4/xF+9tGpOVEnsc8yEC5UOdHjKWJFFrBtbs7FluBs1+pPOUkEZaWApASIbf0tZ2yZKag626gS8UrcjyS3PTO3CArxiTPFHd0FfOc7m2oIQMsJVDsd8qzDxU4eM58rDujoi+f0w5apzksuwM8tYBj/6vfJxaRZHH8XKpnowBVeYETYAAA=",
+"images/wands_01_ace.png":"data:image/webp;base64,UklGRhYBAABXRUJQVlA4IAoBAACwCACdASogADUAPu1kqk8ppSOiMBQMATAdiWIAsR6vSqDA8SgCza1QjXVVYIByB32i+CAC/LtBY5pjCE46gPSHYq5cVPHWm4ifZqCeCAIA/lWPLzqBBLjPBVlGIvYcb/XaQ857uHte0uVEvHskKV7zT0OsJz9XfeZC/IsvW6qzGnk0K87oGuGkSQsA2z60eqtr9S/rIJBqVbcn/QVVCJN2y8DdgKp7EhMdyNXTwqGlI0D4ZOLxfBfs8Urk+jRGadV0RR18PY61kyzowyRkQURb3SfdztieXdtuUu/ebGLswTYV8sja2TjMkZVGzOU2MnfyQ7cLgRw0jlbGJCe2Cac176Ak7kPIfYAAAA==",
+"images/wands_02.png":"data:image/webp;base64,UklGRioBAABXRUJQVlA4IB4BAACwCACdASogADUAPuFeo02opSMiM/zKqRAcCWYAnTNHSRhwPm7dABxs6dOvOqX/auWRe+6DtisYqP+zCEvVPuB0d9Zol5OolHXVWuOhujgA/b/HJdNf/7CZYMFZ/J0cnuehuCeTDRbLKi9PRAcPsBVcC6FlGkw6IKvq1HIfkpVg7tGxWda3dIer1uXagYzpgI6wYWMwXmNLGwBC9tLh8W6zQZ2J7gfqhG1MsivT/3yCkWK/j+rl/m7FDePbPMGa4Rw5qkBiHaSPOF7hFP6KkF+XOIOJ3pqKUPvrD20vW9BmYCQKhiFp01BDdtDW/GnAcgFFsbojIUfsiRrreyuIk1ykx96OJ38iY5mnbjSjL59hxvNnUWJE8Q4b7ookAAAA",
+"images/wands_03.png":"data:image/webp;base64,UklGRhQBAABXRUJQVlA4IAgBAAAQCACdASogADUAPu1eq1CppKOirBVcyTAdiUAU6OznAyFwBQLtaWbeKhnX61hllb3ni38ykJtl/ItELlYgjHjNR5TQoyVpzJ8IAPwgctxMOL5osAxKZAa5IlMKEesJgAxZ7tZDH5MsrwZtmeLHdCjujp6Y61Dqiowy+sRndUlzu6X/iRznWINy6YVRTM//UffiNSw48F29BltSAWTJx/dZaTGFNY6Ile5ZWrHq0p+vTQor/1HA7QRFBuN9SQRM04WRKJpulPLnF3JcJbjAxGFvJBnEAbRGqVF7wq15PeZbkmG4rPNF26XS0V13f/v+UWBX5OPPlXeytB08rW/EwXLtC96bBCsoAAA=",
+"images/wands_04.png":"data:image/webp;base64,UklGRhABAABXRUJQVlA4IAQBAABQCACdASogADUAPt1gpE2opiOiN/gIARAbiWoArDL7TB9NDlNCyhE/ThVf/9nsTtj9X3kKtI1E53ECMXLx2E05Ma07V6KPbm5N5xAA/pcDYR7KOJa1yaUaA6Yq2z437sqMtVf128J/GhYAvlw10Nfo5qFhojRb9pz7+khx6JKot+b7Cx75vJmEoHZvfR0FV2yjTW9G1Cpv+wzbjrTkT+A85/EGrF3r59CZ2xAT3VNMfuNo/Q8vQ956iD3bajb86RB7VLvcmw5vWhXr2kCGhzUuwG2RN8euZzqW2q/FYbyoISOZt+M6c/xelXlXbYfjd+GuhlpvU934LDInGW+pM8iJsMAAAA==",
+"images/wands_05.png":"data:image/webp;base64,UklGRggBAABXRUJQVlA4IPwAAADwBwCdASogADUAPuFip02opiOiMAwBEBwJYgCdMwz9aReAsWrrxNlVrWli/MXKZMI4CsPVobTyLyR96Irn6CDfu4OKlH3qzAAA/mAL2f+HQa9MCAkB/m3PBmYD8pkTYDZKwdpdDDS+LcspKwX11M68Nh+PD5XTk1hXI03yEBpPwrYWGAGO95XR2P4ZGhMat9AYx7Wk+rY9PsCu9dXU5isvwEQ8EAKbKFbzZDZ2BayG+A+5qc5yNaOSlfGGt4tR7ZHp4fk0SRzCkBXkZBuz3f7ZDqtuHY2JmsSazXXz32xwbEXCrA1kjf/qLAd9+8H5bHCzbK1FUk3olwUAAAA=",
+"images/wands_06.png":"data:image/webp;base64,UklGRh4BAABXRUJQVlA4IBIBAADwCACdASogADUAPu1qrU6ppiSiLBqrMTAdiWQAnTlBV96BEHgMyr5TcV9KjDu4iQcvZepfq7bUopM2b8yi5SK/Hvtfk3vL0GA8XCrih5EoaAD+VVyqBJu/1stKrrOookzINvyNX79dYHCKj+Xnr+inkwae+vuUEihVieWFSpmIMHIfVNdsUnvcpbKMJyGKwNsmrA1XqhaaSw3R6lKe5ZbC005hwm59L9GcyvGiAg06Sp33Gm2LLjmgipA4Ommnv8SHTqhdhQd6WGx83IgCu9v/n+OhVHFVKob6HAeuvdaEFJrml9FIsIJ3JKQvg4BeRGqEc4BAPtYDngagTMnG5rwCQJkXaExWQIjyB5P8B2gM34AA",
+"images/wands_07.png":"data:image/webp;base64,UklGRhIBAABXRUJQVlA4IAYBAAAwCACdASogADUAPu1srlGppaQipAyRMB2JQBOmbOfgtrgLZSuaUDWOuTMEcWN189giV6Woz7vbTAV/CZrYNq0qUXLr+2ahNvG1QAD+iTBV7vUaOuNKbC5Ot5b5ry3X1qbfrIsYiQj3E1fHS/2aojzIcX6wXjYrlqvJHgth3fB0eena1Cc0TNDJQD0RTsXTh0uNm3xEwBUmnm1qL19wGQw2kGUXLp7XjzfjPIkMSyC+RpopElNV+M0CUVpUzzNYP/VlQ2EPSDuYgLfZkq5s6mz5UJ45GpX/iFd1vHdeuBQMGZe8VNNbqGx1EHCarHcANWAW+WfYV4VYu0/249Qz4QGK6rwNwAAA",
+"images/wands_08.png":"data:image/webp;base64,UklGRvIAAABXRUJQVlA4IOYAAAAQCACdASogADUAPu1srlCppiQiqBgMATAdiUAVhzga6rvcD0P72sKlHBuZtWgofVHc8/skDJsGBmZX55EdxxKC9l9SRdi9qNuAAPx2NJvwGzL2V+gPIr0UsWUbJmUpHAqLKHw0SGY35+mp5btIZ6vW88G/NNvb3buTQKOnmbmk67c39G938xCuSoLAaDk/ARVoFQDYAcmgbyq4lR6gkNoefOwEOeHsWUlbj/Nwr6z7FnAzhaNKW0UMMt9zUTMRaMY/1ClwkjAGTzcJWFwz5c/1iYHcHMri+8r8V70Y/XCQdKVZzfAAAA==",
+"images/wands_09.png":"data:image/webp;base64,UklGRhABAABXRUJQVlA4IAQBAADwBwCdASogADUAPu1wrlOppiOipApJMB2JQBTo7OceAmEcdP9BRKc1aOmUi2piVDtFddkN8DOqB3lsb9yWrSSNa+sfcI45vVAA/e+BETahX38gC0Tjfy9I7Q9VSNXjhEzlpVk2AtTo4WiTpiJfzjttj8K2DnRn30zla1YZnA07EYwnSzFfwf3lEIArmpynSDXv142bEB1z5eO51bK+fp8LqY4MZXB/BCp58lgqaqBz9h9gmUsY18kQpROJtavsgvDnmAOc6qLXXvahvfQBKc8QBFldlBCMJiLvpKm32xgLYxiYz74H0EgppDCA5w8cdohIt2bhcFUNO8TofqMYYyv/uAAAAA==",
+"images/wands_10.png":"data:image/webp;base64,UklGRjQBAABXRUJQVlA4ICgBAABwCACdASogADUAPu1kqk2ppaQiKA6pMB2JQBTo4c5g/RibHgsDwO8IArIT92tfWLgnwnrbQxI40dHjghv7jr7v8DzqdxHvcM1ixKKgAPa7qbi2ZVB9choYCNdawfRKSzLZ3SOlJagBDPYlPE9zTK8No9HKWB1mLTGzcIcH/ekUFgLm8dRBWBVN4WAMZJnG3cSrIe+BXMzaRShcgLXtWC2V5TDx6PolXZrR3tPi8vCzvKXn6paz3uxfK3NSeQdAzAxj1w1FRS8fzNP77GNzeNtbDiMtsrwXdqrYkaFKF8deWkgwyTsS+HuWPAl/A1uAX9OORh3Bab3vxDZggzLQpHqwbkhyS3ZpfyVigo4HkLlgOPTWGrKnsGVii/lgofdC29l/UIWS0AAAAA==",
+"images/wands_11_page.png":"data:image/webp;base64,UklGRiwBAABXRUJQVlA4ICABAACwBwCdASogADUAPu1iq1AppSOirBVcyTAdiWIAnTLrvCASaIySNP8o7iimdHHJ/8DKBgy1x8gQc/HOkUgHNlIcRgcKjxCAAP5Vjwnyj7mSWEybbPtQptvB039ia3KKjxaEGGgflFqA0PPi4sz8NiB9+6sBZ/Gw2ttlSlnyVkJnUXmxGBSaITWd53M7wqGhnoai0zcFMgO4Bi7aw4FxyJK0IAqIhmBb3uyW8dWyuAB0+qROpEzunky1GBZF3IQPtGS7sYTdTnNSRAwZKYnNnCqteNljQP4eXES3Aq/c7Xl53e1VSKbyhNRrfjGRTsT1oxhjZ60tEUCnqGbwB4TyjCLpvb8GE1mhx9LEBO5sPmb5wCsrh8XJGG2JkdQXw0gAAAA=",
+"images/wands_12_knight.png":"data:image/webp;base64,UklGRiIBAABXRUJQVlA4IBYBAADQCACdASogADUAPuFWpk2opKOiN/qoARAcCWQAnTLT/80MgJ3j22qPQkRUgjFvO2BrYOL6YjDKoRLYi/sDg24fOxHnhfmEylFR3GokaBEQAP5NG8KDUF0GD5zSl68PeKJsHztjF4qNJtFyDbZ9ZDLy5vlqUpNURdIUQxUXXjXT86vnBt9fuI5q+luTJ72VzurRreCIJDC2I3UXQFnl5XDVfqAjDCs+ItAcoYn8wV9/IA+tnLCXPgXlsQqtyegILuQd/sVDNiPFSJhIrJjTJIXGB0hr4ZKXCghgxgrwbzKMJ7CgltaoD2MAzc/mRJR1dU6GrNigLcdd2o8N77M/v3rxUp8NZezNZ2cyl1ZrIfQYq8ybQ7AQAA==",
+"images/wands_13_queen.png":"data:image/webp;base64,UklGRiQBAABXRUJQVlA4IBgBAACwCACdASogADUAPu1grE8ppSQiMBgKATAdiWYArDObdUQvgXDkAypeG3cMewGHRtD6boKphwjn5vMwMHRZOf7+BxCI6mVUbZQ+64znM4AA/dTsa4Hg0AGZrebSJWQwSRNxk8F2QK+ojTURWiePMUuwjqHmBi94OuFlFZ+d5cVoAlFRyUp4FP8EFjXSkzMZN57CX6CgxqhWhS77IDh3d/cAlHDH+tkxnP0Gpxh6hc+rbUMcxbxi9AnjW9QQafWGqAV8sU8wVvysFwsLKFAX4J18yXryCg1zd1w/Od6kGUN+O13W/xyrZ56saAWdfWO7yy2gsFxFex1HAOBnu3SCVDgSwFEFgukaeWerf5X1T3U8pOCG0BMoymAA",
+"images/wands_14_king.png":"data:image/webp;base64,UklGRhoBAABXRUJQVlA4IA4BAABQCACdASogADUAPt1co02opSMiN/qoARAbiWwAnTMqyJ21QF7tHhx9/HCRW3lgA8Ghp9ienXRHuv7PWr1tyISHgTOjbXLQB7Mx9IAA/b9o7mtackKAI7TSNjZYN91NvIkDCKP0GRrifRYTIKDY3XmFJukg64N58+z4DQCuU2a9JodJGi5UEyPYroOBkGGuz9oABOemXNusYweoXomV5ftoRDuCuuM75DJ2LoIXKSarYvf+BYYUsJ0R2X8ZUAwEohyPUW7su3Q244OaxtwP1uJm08E2r2ZZTODDkzldLMo5K8lYU1b9TtlNWavivcKIXDgV03OLtNTXMenTkVQcpbpr7wDK5C9idBbtsNwAAAA="
+};
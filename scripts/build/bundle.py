@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+
+"""
+Build a production bundle of index.html.
+
+The development page stays a single self-contained file. This tool splits it
+for deployment:
+
+- CSS rules that style the markup visible on first paint are inlined; the rest
+  go to a content-hashed stylesheet that loads without blocking render.
+- The inline script is split at its `// @module <name>` and `// @chunk <name>`
+  markers. Modules are deferred scripts loaded up front (before the unmarked
+  app code); chunks are fetched on first use through `loadChunk()`.
+- The card placeholder manifest (images/placeholders.js) gets a hashed name
+  and loads async, so it never holds up the app; cards render without
+  placeholders until it arrives.
+- Everything is minified, and each output is checked against a gzip size budget.
+
+Usage (from the repository root):
+    python scripts/build/bundle.py            # writes dist/
+    python scripts/build/bundle.py out_dir
+"""
+
+from html.parser import HTMLParser
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+
+SOURCE = 'index.html'
+ASSETS_DIR = 'assets'
+PLACEHOLDERS = 'images/placeholders.js'
+
+# Gzipped size budgets in bytes. Lazy chunks without an entry use 'chunk'.
+BUDGETS = {
+    'index.html': 4 * 1024,
+    'app.js': 14 * 1024,
+    'data.js': 4 * 1024,
+    'deferred.css': 3 * 1024,
+    'placeholders.js': 24 * 1024,
+    'chunk': 2 * 1024,
+}
+
+# Classes the page sets on <body> before first paint (the saved theme).
+PRE_PAINT_TOKENS = {'.dark'}
+
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input',
+             'link', 'meta', 'source', 'track', 'wbr'}
+
+CHUNK_LOADER = """const CHUNKS = %s;
+const chunkPromises = {};
+function loadChunk(name) {
+    if (!chunkPromises[name]) {
+        chunkPromises[name] = new Promise(function(resolve, reject) {
+            const s = document.createElement('script');
+            s.src = CHUNKS[name];
+            s.onload = function() { resolve(); };
+            s.onerror = function() {
+                delete chunkPromises[name];
+                reject(new Error('Failed to load chunk: ' + name));
+            };
+            document.head.appendChild(s);
+        });
+    }
+    return chunkPromises[name];
+}
+// Warm the HTTP cache once the page is idle so chunks load quickly later.
+(window.requestIdleCallback || function(fn) { setTimeout(fn, 2000); })(function() {
+    Object.keys(CHUNKS).forEach(function(name) {
+        const l = document.createElement('link');
+        l.rel = 'prefetch';
+        l.href = CHUNKS[name];
+        document.head.appendChild(l);
+    });
+});
+"""
+
+
+# --- Minifiers -------------------------------------------------------------
+
+_JS_REGEX_AFTER_PUNCT = set('(,=:[!&|?{};+-*%<>~^')
+_JS_REGEX_AFTER_WORD = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of',
+                        'instanceof', 'new', 'delete', 'void', 'throw',
+                        'yield', 'await'}
+# A line break can be dropped after these characters or before these tokens
+# without changing how automatic semicolon insertion reads the code.
+_JS_JOIN_AFTER = set('{([,;=:?&|<>*%!~^')
+_JS_JOIN_BEFORE = set('.,)]}')
+
+
+def _is_word_char(ch):
+    return ch.isalnum() or ch in '_$' or ord(ch) > 127
+
+
+def _scan_string(src, i):
+    """Return the index just past the string literal starting at src[i]."""
+    quote = src[i]
+    i += 1
+    while i < len(src):
+        if src[i] == '\\':
+            i += 2
+            continue
+        if src[i] == quote:
+            return i + 1
+        i += 1
+    raise ValueError('Unterminated string literal')
+
+
+def _scan_template(src, i):
+    """Return the index just past the template literal starting at src[i]."""
+    i += 1
+    while i < len(src):
+        ch = src[i]
+        if ch == '\\':
+            i += 2
+        elif ch == '`':
+            return i + 1
+        elif src.startswith('${', i):
+            depth = 1
+            i += 2
+            while depth:
+                ch = src[i]
+                if ch in '\'"':
+                    i = _scan_string(src, i)
+                    continue
+                if ch == '`':
+                    i = _scan_template(src, i)
+                    continue
+                depth += {'{': 1, '}': -1}.get(ch, 0)
+                i += 1
+        else:
+            i += 1
+    raise ValueError('Unterminated template literal')
+
+
+def _scan_regex(src, i):
+    """Return the index just past the regex literal (with flags) at src[i]."""
+    i += 1
+    in_class = False
+    while i < len(src):
+        ch = src[i]
+        if ch == '\\':
+            i += 2
+            continue
+        if ch == '[':
+            in_class = True
+        elif ch == ']':
+            in_class = False
+        elif ch == '/' and not in_class:
+            i += 1
+            while i < len(src) and _is_word_char(src[i]):
+                i += 1
+            return i
+        elif ch == '\n':
+            break
+        i += 1
+    raise ValueError('Unterminated regex literal')
+
+
+def minify_js(src):
+    """
+    Conservative JavaScript minifier.
+
+    Strips comments and indentation and collapses whitespace, but keeps every
+    line break that automatic semicolon insertion could depend on. Literals
+    (strings, templates, regexes) are copied verbatim.
+    """
+    out = []
+    last = ''
+    space = newline = False
+    i = 0
+    n = len(src)
+
+    def emit(tok):
+        nonlocal last, space, newline
+        if out:
+            prev = out[-1][-1]
+            if newline and not (prev in _JS_JOIN_AFTER or tok[0] in _JS_JOIN_BEFORE):
+                out.append('\n')
+            elif (space or newline) and (
+                    (_is_word_char(prev) and _is_word_char(tok[0]))
+                    or (prev in '+-/' and tok[0] == prev)):
+                out.append(' ')
+        out.append(tok)
+        last = tok
+        space = newline = False
+
+    while i < n:
+        ch = src[i]
+        if ch in ' \t\r\n':
+            if ch == '\n':
+                newline = True
+            else:
+                space = True
+            i += 1
+        elif src.startswith('//', i):
+            end = src.find('\n', i)
+            i = n if end == -1 else end
+        elif src.startswith('/*', i):
+            end = src.index('*/', i + 2) + 2
+            if '\n' in src[i:end]:
+                newline = True
+            else:
+                space = True
+            i = end
+        elif ch in '\'"':
+            end = _scan_string(src, i)
+            emit(src[i:end])
+            i = end
+        elif ch == '`':
+            end = _scan_template(src, i)
+            emit(src[i:end])
+            i = end
+        elif ch == '/' and (not last or last[-1] in _JS_REGEX_AFTER_PUNCT
+                            or last in _JS_REGEX_AFTER_WORD):
+            end = _scan_regex(src, i)
+            emit(src[i:end])
+            i = end
+        elif _is_word_char(ch):
+            end = i
+            while end < n and _is_word_char(src[end]):
+                end += 1
+            emit(src[i:end])
+            i = end
+        else:
+            emit(ch)
+            i += 1
+    return ''.join(out).strip()
+
+
+def minify_css(src):
+    """Strip comments and redundant whitespace from a stylesheet."""
+    parts = []
+    i = 0
+    n = len(src)
+    while i < n:
+        ch = src[i]
+        if ch in '\'"':
+            end = _scan_string(src, i)
+            parts.append(src[i:end])
+            i = end
+        elif src.startswith('/*', i):
+            i = src.index('*/', i + 2) + 2
+            parts.append(' ')
+        else:
+            end = i
+            while end < n and src[end] not in '\'"' and not src.startswith('/*', end):
+                end += 1
+            chunk = re.sub(r'\s+', ' ', src[i:end])
+            chunk = re.sub(r'\s*([{};,>])\s*', r'\1', chunk)
+            chunk = re.sub(r':\s+', ':', chunk)
+            parts.append(chunk)
+            i = end
+    css = ''.join(parts).strip()
+    return css.replace(';}', '}')
+
+
+def minify_html(src):
+    """Collapse whitespace runs between and inside text nodes to one space."""
+    return re.sub(r'\s+', ' ', src).strip()
+
+
+# --- Critical CSS ------------------------------------------------------------
+
+class _StaticMarkup(HTMLParser):
+    """Collect tag, class and id tokens of elements visible on first paint."""
+
+    def __init__(self):
+        super().__init__()
+        self.tokens = {'html', 'body'}
+        self.hidden_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        void = tag in VOID_TAGS
+        if self.hidden_depth:
+            if not void:
+                self.hidden_depth += 1
+            return
+        attrs = dict(attrs)
+        if 'display:none' in (attrs.get('style') or '').replace(' ', ''):
+            if not void:
+                self.hidden_depth = 1
+            return
+        self.tokens.add(tag)
+        if attrs.get('id'):
+            self.tokens.add('#' + attrs['id'])
+        for cls in (attrs.get('class') or '').split():
+            self.tokens.add('.' + cls)
+
+    def handle_endtag(self, tag):
+        if self.hidden_depth and tag not in VOID_TAGS:
+            self.hidden_depth -= 1
+
+
+def _selector_is_static(selector, present):
+    sel = re.sub(r'::?[\w-]+(\([^)]*\))?', '', selector)
+    sel = re.sub(r'\[[^\]]*\]', '', sel)
+    for compound in re.split(r'[\s>+~]+', sel.strip()):
+        for token in re.findall(r'[.#]?[\w-]+', compound):
+            if token not in present:
+                return False
+    return True
+
+
+def _css_blocks(css):
+    """Yield (prelude, body) for each top-level block of minified CSS."""
+    i = 0
+    while i < len(css):
+        start = css.index('{', i)
+        depth = 0
+        j = start
+        while True:
+            if css[j] in '\'"':
+                j = _scan_string(css, j)
+                continue
+            if css[j] == '{':
+                depth += 1
+            elif css[j] == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            j += 1
+        yield css[i:start], css[start + 1:j]
+        i = j + 1
+
+
+def split_critical_css(css, present):
+    """
+    Split minified CSS into (critical, deferred).
+
+    A rule is critical when one of its selectors only references tags, classes
+    and ids present in the first-paint markup. @media blocks are split rule by
+    rule; @keyframes follow the critical rules that reference them.
+    """
+    critical, deferred, keyframes = [], [], []
+    for prelude, body in _css_blocks(css):
+        if prelude.startswith('@keyframes'):
+            keyframes.append((prelude.split()[1], prelude, body))
+        elif prelude.startswith('@media'):
+            inner = {True: [], False: []}
+            for sel, decl in _css_blocks(body):
+                is_static = any(_selector_is_static(s, present) for s in sel.split(','))
+                inner[is_static].append(f'{sel}{{{decl}}}')
+            if inner[True]:
+                critical.append(f'{prelude}{{{"".join(inner[True])}}}')
+            if inner[False]:
+                deferred.append(f'{prelude}{{{"".join(inner[False])}}}')
+        elif any(_selector_is_static(s, present) for s in prelude.split(',')):
+            critical.append(f'{prelude}{{{body}}}')
+        else:
+            deferred.append(f'{prelude}{{{body}}}')
+
+    critical_css = ''.join(critical)
+    for name, prelude, body in keyframes:
+        target = critical if re.search(rf'animation[^;}}]*\b{re.escape(name)}\b', critical_css) else deferred
+        target.append(f'{prelude}{{{body}}}')
+    return ''.join(critical), ''.join(deferred)
+
+
+# --- Script splitting --------------------------------------------------------
+
+def split_script(script):
+    """
+    Split the inline script at its markers.
+
+    Returns (modules, app, chunks): ordered {name: source} for eager modules,
+    the unmarked app source, and {name: source} for lazy chunks. The
+    `@chunk-loader` region is dropped; the caller supplies the real loader.
+    """
+    modules, chunks = {}, {}
+    app = []
+    target = app
+    for line in script.splitlines(keepends=True):
+        marker = line.strip()
+        named = re.fullmatch(r'// @(module|chunk) (\w+)', marker)
+        if named:
+            group = modules if named.group(1) == 'module' else chunks
+            target = group.setdefault(named.group(2), [])
+        elif marker == '// @chunk-loader':
+            target = []
+        elif marker == '// @endchunk-loader':
+            app.append('// @chunk-loader\n')
+            target = app
+        elif marker in ('// @endmodule', '// @endchunk'):
+            target = app
+        else:
+            target.append(line)
+    join = lambda parts: ''.join(parts)
+    return ({k: join(v) for k, v in modules.items()}, join(app),
+            {k: join(v) for k, v in chunks.items()})
+
+
+# --- Build -------------------------------------------------------------------
+
+def content_name(name, ext, data):
+    digest = hashlib.sha256(data).hexdigest()[:10]
+    return f'{ASSETS_DIR}/{name}.{digest}.{ext}'
+
+
+def build(out_dir='dist'):
+    with open(SOURCE, encoding='utf-8') as f:
+        page = f.read()
+
+    style = re.search(r'<style>(.*?)</style>', page, re.S)
+    script = re.search(r'<script>(.*?)</script>', page, re.S)
+    body = re.search(r'<body>(.*?)<script>', page, re.S).group(1)
+    head = page[:style.start()]
+    head_rest = page[style.end():page.index('</head>')]
+
+    markup = _StaticMarkup()
+    markup.feed(body)
+    critical_css, deferred_css = split_critical_css(
+        minify_css(style.group(1)), markup.tokens | PRE_PAINT_TOKENS)
+
+    modules, app, chunks = split_script(script.group(1))
+    assets = {}
+
+    chunk_paths = {}
+    for name, src in chunks.items():
+        data = minify_js(src).encode()
+        chunk_paths[name] = content_name(name, 'js', data)
+        assets[chunk_paths[name]] = data
+
+    scripts = []
+    for name, src in modules.items():
+        data = minify_js(src).encode()
+        path = content_name(name, 'js', data)
+        assets[path] = data
+        scripts.append(path)
+    loader = CHUNK_LOADER % json.dumps(chunk_paths)
+    app_data = minify_js(app.replace('// @chunk-loader\n', loader, 1)).encode()
+    app_path = content_name('app', 'js', app_data)
+    assets[app_path] = app_data
+    scripts.append(app_path)
+
+    placeholders_path = None
+    if os.path.exists(PLACEHOLDERS):
+        with open(PLACEHOLDERS, encoding='utf-8') as f:
+            data = minify_js(f.read()).encode()
+        placeholders_path = content_name('placeholders', 'js', data)
+        assets[placeholders_path] = data
+    head_rest = re.sub(r'<script src="%s"[^>]*></script>' % re.escape(PLACEHOLDERS),
+                       f'<script src="{placeholders_path}" async></script>' if placeholders_path else '',
+                       head_rest)
+
+    css_data = deferred_css.encode()
+    css_path = content_name('deferred', 'css', css_data)
+    assets[css_path] = css_data
+
+    html = (minify_html(head)
+            + f'<style>{critical_css}</style>'
+            + f'<link rel="preload" href="{css_path}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+            + f'<noscript><link rel="stylesheet" href="{css_path}"></noscript>'
+            + minify_html(head_rest)
+            + ''.join(f'<script src="{p}" defer></script>' for p in scripts)
+            + '</head><body>' + minify_html(body) + '</body></html>')
+
+    assets_dir = os.path.join(out_dir, ASSETS_DIR)
+    if os.path.isdir(assets_dir):
+        shutil.rmtree(assets_dir)
+    os.makedirs(assets_dir)
+    for path, data in assets.items():
+        with open(os.path.join(out_dir, path), 'wb') as f:
+            f.write(data)
+    with open(os.path.join(out_dir, 'index.html'), 'w', encoding='utf-8') as f:
+        f.write(html)
+
+    images_out = os.path.join(out_dir, 'images')
+    os.makedirs(images_out, exist_ok=True)
+    for entry in os.scandir('images'):
+        if entry.is_file() and entry.path.replace(os.sep, '/') != PLACEHOLDERS:
+            shutil.copy2(entry.path, images_out)
+
+    outputs = {'index.html': (html.encode(), 'critical')}
+    for path, data in assets.items():
+        if path == css_path or path in scripts:
+            outputs[path] = (data, 'eager')
+        elif path == placeholders_path:
+            outputs[path] = (data, 'async')
+        else:
+            outputs[path] = (data, 'lazy')
+    return page.encode(), outputs
+
+
+def budget_for(path):
+    name = os.path.basename(path)
+    key = name if name == 'index.html' else '.'.join((name.split('.')[0], name.rsplit('.', 1)[1]))
+    return BUDGETS.get(key, BUDGETS['chunk'])
+
+
+def report(source, outputs):
+    """Print per-output sizes against their budgets; return True if all fit."""
+    gz = lambda data: len(gzip.compress(data, 9))
+    print(f"{'Output':<36} {'Load':<9} {'Raw':>9} {'Gzip':>8} {'Budget':>8}")
+    print("=" * 74)
+    ok = True
+    first_paint = 0
+    for path, (data, load) in outputs.items():
+        size, budget = gz(data), budget_for(path)
+        if load in ('critical', 'eager'):
+            first_paint += size
+        status = '✅' if size <= budget else '❌'
+        ok &= size <= budget
+        print(f"{path:<36} {load:<9} {len(data):>9,} {size:>8,} {budget:>8,} {status}")
+    print("=" * 74)
+    print(f"Source index.html: {len(source):,} bytes raw, {gz(source):,} gzip")
+    print(f"Before interaction (critical + eager): {first_paint:,} bytes gzip")
+    return ok
+
+
+if __name__ == "__main__":
+    out_dir = sys.argv[1] if len(sys.argv) > 1 else 'dist'
+    source, outputs = build(out_dir)
+    print(f"Bundle written to {out_dir}/\n")
+    if not report(source, outputs):
+        print("\n❌ Size budget exceeded")
+        sys.exit(1)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "pillow",
+# ]
+# ///
+
+"""
+Generate low-quality image placeholders for every card.
+
+Each image in images/ is reduced to 32x53, blurred slightly and encoded as a
+small WebP data URI (a few hundred bytes). The URIs are written to
+images/placeholders.js as `window.CARD_PLACEHOLDERS`, keyed by the same
+`images/...` paths index.html uses, so a card face paints its placeholder
+at once and crossfades to the full image once it has decoded. The manifest
+is a script rather than JSON so it also loads when index.html is opened from
+disk.
+
+Usage (from the repository root):
+    python scripts/build/placeholders.py
+"""
+
+from PIL import Image, ImageFilter
+import base64
+import glob
+import io
+import json
+
+PLACEHOLDER_SIZE = (32, 53)
+WEBP_QUALITY = 40
+MANIFEST = 'images/placeholders.js'
+
+
+def placeholder_uri(path):
+    """Return a blurred WebP data URI for one image."""
+    with Image.open(path) as img:
+        img = img.convert('RGBA' if img.mode in ('RGBA', 'LA', 'P') else 'RGB')
+        small = img.resize(PLACEHOLDER_SIZE, Image.Resampling.BOX)
+    small = small.filter(ImageFilter.GaussianBlur(1))
+    buf = io.BytesIO()
+    small.save(buf, 'WEBP', quality=WEBP_QUALITY, method=6)
+    return 'data:image/webp;base64,' + base64.b64encode(buf.getvalue()).decode('ascii')
+
+
+def build_manifest(pattern='images/*.png', output=MANIFEST):
+    placeholders = {path.replace('\\', '/'): placeholder_uri(path) for path in sorted(glob.glob(pattern))}
+    body = json.dumps(placeholders, indent=0, separators=(',', ':'))
+    with open(output, 'w') as f:
+        f.write('// Generated by scripts/build/placeholders.py. Do not edit.\n')
+        f.write(f'window.CARD_PLACEHOLDERS = {body};\n')
+    return placeholders
+
+
+if __name__ == "__main__":
+    placeholders = build_manifest()
+    sizes = [len(uri) for uri in placeholders.values()]
+    print(f"Wrote {len(placeholders)} placeholders to {MANIFEST}")
+    if sizes:
+        print(f"Average data URI: {sum(sizes) / len(sizes):.0f} bytes (max {max(sizes)})")
+        print(f"Manifest total: {sum(sizes) / 1024:.1f} KB")
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "pillow",
+#   "numpy",
+# ]
+# ///
+
+"""
+Compare remove_green_background (hard mask) with the chroma_key soft matte.
+
+Synthetic green-screen renders with a known ground-truth alpha are keyed by
+both implementations. The report covers throughput (serial legacy, serial
+engine, engine across processes) and matte quality:
+
+- alpha MAE: mean absolute alpha error (0-255), overall and on edge pixels
+- holes: opaque subject pixels that lost opacity (alpha < 250)
+- residue: background pixels left visible (alpha > 5)
+- fringe: mean green excess g - max(r, b) on visible edge pixels
+
+The run fails (exit status 1) if the soft matte leaves any holes or more
+fringe than the hard mask.
+
+Usage: python scripts/image_edit/benchmark_chroma_key.py [image_count]
+"""
+
+from PIL import Image
+import numpy as np
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from chroma_key import auto_thresholds, key_files, key_in_place
+from remove_background import remove_green_background
+
+SIZE = (1024, 1536)
+
+
+def make_test_image(seed, size=SIZE):
+    """Return (rgba, true_alpha) for a subject composited over uneven green."""
+    rng = np.random.default_rng(seed)
+    w, h = size
+    yy, xx = np.mgrid[0:h, 0:w].astype(np.float32)
+
+    # Subject: an ellipse whose border is a 1.5 px anti-aliased ramp, plus a
+    # wide soft band (hair/smoke) on one side
+    cx, cy = w * rng.uniform(0.4, 0.6), h * rng.uniform(0.4, 0.6)
+    dist = np.hypot((xx - cx) / (w * 0.3), (yy - cy) / (h * 0.35)) - 1
+    alpha = np.clip(0.5 - dist * min(w * 0.3, h * 0.35) / 1.5, 0, 1)
+    soft = np.clip(1 - np.abs(dist) * 40, 0, 1) * (xx > cx)
+    alpha = np.maximum(alpha, soft * 0.6)
+
+    fg = np.empty((h, w, 3), dtype=np.float32)
+    fg[..., 0] = 150 + 100 * np.sin(xx / 37 + seed) ** 2
+    fg[..., 1] = 60 + 60 * np.cos(yy / 53) ** 2
+    fg[..., 2] = 40 + 150 * np.sin((xx + yy) / 71) ** 2
+    # A patch of foliage that must survive keying
+    leaf = (np.abs(xx - cx) < w * 0.08) & (np.abs(yy - cy) < h * 0.05)
+    fg[leaf] = (50, 130, 60)
+
+    bg = np.empty_like(fg)
+    light = 0.8 + 0.2 * (yy / h)
+    bg[..., 0] = 30 * light
+    bg[..., 1] = 215 * light
+    bg[..., 2] = 45 * light
+    bg += rng.normal(0, 6, bg.shape)
+
+    rgb = fg * alpha[..., None] + bg * (1 - alpha[..., None])
+    rgba = np.empty((h, w, 4), dtype=np.uint8)
+    rgba[..., :3] = np.clip(rgb + 0.5, 0, 255)
+    rgba[..., 3] = 255
+    return rgba, (alpha * 255 + 0.5).astype(np.uint8)
+
+
+def matte_quality(keyed, true_alpha):
+    alpha = keyed[..., 3].astype(np.int16)
+    truth = true_alpha.astype(np.int16)
+    edge = (truth > 0) & (truth < 255)
+    visible_edge = edge & (alpha > 0)
+    rgb = keyed[..., :3].astype(np.int16)
+    excess = np.clip(rgb[..., 1] - np.maximum(rgb[..., 0], rgb[..., 2]), 0, None)
+    return {
+        'alpha_mae': float(np.abs(alpha - truth).mean()),
+        'edge_mae': float(np.abs(alpha - truth)[edge].mean()),
+        'holes': float(np.mean(alpha[truth == 255] < 250)),
+        'residue': float(np.mean(alpha[truth == 0] > 5)),
+        'fringe': float(excess[visible_edge].mean()) if visible_edge.any() else 0.0,
+    }
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run_benchmark(count=8):
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"Rendering {count} synthetic {SIZE[0]}x{SIZE[1]} green-screen images...")
+        truths, inputs = [], []
+        for i in range(count):
+            rgba, truth = make_test_image(i)
+            path = os.path.join(tmp, f'card_{i}_chroma.png')
+            Image.fromarray(rgba, 'RGBA').save(path, compress_level=1)
+            truths.append(truth)
+            inputs.append(path)
+
+        legacy_out = [p.replace('_chroma', '_legacy') for p in inputs]
+        soft_out = [p.replace('_chroma', '_soft') for p in inputs]
+
+        def legacy():
+            with contextlib.redirect_stdout(io.StringIO()):
+                for src, dst in zip(inputs, legacy_out):
+                    remove_green_background(src, dst)
+
+        timings = {
+            'legacy (serial)': _time(legacy),
+            'soft matte (serial)': _time(lambda: list(key_files(zip(inputs, soft_out), workers=1))),
+            'soft matte (parallel)': _time(lambda: list(key_files(zip(inputs, soft_out)))),
+        }
+
+        # Same per-image thresholds as the file path, found outside the timed region
+        arrays = [np.array(Image.open(p)) for p in inputs]
+        thresholds = [auto_thresholds(a) for a in arrays]
+        kernel = _time(lambda: [key_in_place(a, low, high) for a, (low, high) in zip(arrays, thresholds)])
+
+        quality = {'legacy': [], 'soft matte': []}
+        for truth, lpath, spath in zip(truths, legacy_out, soft_out):
+            quality['legacy'].append(matte_quality(np.array(Image.open(lpath)), truth))
+            quality['soft matte'].append(matte_quality(np.array(Image.open(spath)), truth))
+
+    megapixels = count * SIZE[0] * SIZE[1] / 1e6
+    print("\nTHROUGHPUT (decode + key + encode)")
+    print("=" * 60)
+    for name, seconds in timings.items():
+        print(f"{name:<24} {seconds:>7.2f}s {count / seconds:>7.2f} img/s {megapixels / seconds:>7.1f} MP/s")
+    print(f"{'soft matte kernel only':<24} {kernel:>7.2f}s {count / kernel:>7.2f} img/s {megapixels / kernel:>7.1f} MP/s")
+
+    print("\nMATTE QUALITY (mean over images; lower is better)")
+    print("=" * 60)
+    print(f"{'':<12} {'alpha MAE':>10} {'edge MAE':>10} {'holes':>8} {'residue':>8} {'fringe':>8}")
+    for name, rows in quality.items():
+        mean = {k: np.mean([r[k] for r in rows]) for k in rows[0]}
+        print(f"{name:<12} {mean['alpha_mae']:>10.2f} {mean['edge_mae']:>10.1f} "
+              f"{mean['holes']:>8.2%} {mean['residue']:>8.2%} {mean['fringe']:>8.1f}")
+    return timings, quality
+
+
+def check_quality(quality):
+    """Print pass/fail for the soft matte against the hard mask; True when it passes."""
+    def mean(name, key):
+        return float(np.mean([r[key] for r in quality[name]]))
+
+    failures = []
+    if mean('soft matte', 'holes') > 0:
+        failures.append(f"holes in the subject ({mean('soft matte', 'holes'):.2%})")
+    if mean('soft matte', 'fringe') > mean('legacy', 'fringe'):
+        failures.append(f"more fringe than the hard mask ({mean('soft matte', 'fringe'):.1f} > "
+                        f"{mean('legacy', 'fringe'):.1f})")
+    print()
+    for failure in failures:
+        print(f"❌ Soft matte: {failure}")
+    if not failures:
+        print("✅ Soft matte: no holes, fringe no worse than the hard mask")
+    return not failures
+
+
+if __name__ == "__main__":
+    import sys
+
+    _, quality = run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 8)
+    sys.exit(0 if check_quality(quality) else 1)
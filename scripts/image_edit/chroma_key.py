@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "pillow",
+#   "numpy",
+# ]
+# ///
+
+"""
+Soft-matte green-screen removal.
+
+Unlike the hard threshold in remove_background.remove_green_background, the
+key strength of each pixel is how far green exceeds the larger of red and
+blue. The key works in two passes:
+
+- Core matte: alpha ramps from opaque to transparent between `low` and
+  `high`. `low` sits well above the greens found in the card art, so the
+  subject stays opaque.
+- Edge pass: within a few pixels of keyed pixels, where the subject is mixed
+  with the screen, alpha is re-estimated linearly from zero key strength and
+  green spill is clamped to max(r, b). Interior greens are never touched.
+
+By default both bounds are derived from the measured strength of the backdrop.
+
+The core pass works in place on the uint8 RGBA array, a band of rows at a
+time, with preallocated scratch buffers. The edge pass uses one boolean mask
+of the image and gathers only the pixels next to keyed ones. Batches are
+spread over worker processes, and each worker writes its own output.
+"""
+
+from PIL import Image
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import os
+
+BAND_ROWS = 64
+
+# Ramp bounds as fractions of the backdrop's key strength (see auto_thresholds)
+LOW_FRAC = 0.55
+HIGH_FRAC = 0.8
+# `high` also stays below the dimmest part of the screen: this share of the
+# 1st percentile of border key strength
+FLOOR_MARGIN = 0.9
+MIN_SCREEN_STRENGTH = 60
+# Distance in pixels from keyed pixels that the edge pass refines
+EDGE_RADIUS = 2
+
+
+def _grow(mask, radius):
+    """Dilate a boolean mask by a (2 * radius + 1) square."""
+    grown = mask.copy()
+    height, width = mask.shape
+    for dy in range(-radius, radius + 1):
+        for dx in range(-radius, radius + 1):
+            if dy or dx:
+                grown[max(0, dy):height + min(0, dy), max(0, dx):width + min(0, dx)] |= \
+                    mask[max(0, -dy):height + min(0, -dy), max(0, -dx):width + min(0, -dx)]
+    return grown
+
+
+def refine_edges(data, high, radius=EDGE_RADIUS):
+    """
+    Edge pass of key_in_place: linear alpha and full despill next to keyed pixels.
+
+    Pixels there are a mix of subject and screen, so alpha is taken as
+    1 - strength / high and green is pulled down to max(r, b).
+    """
+    alpha = data[..., 3]
+    ys, xs = np.nonzero(_grow(alpha < 255, radius) & (alpha > 0))
+    px = data[ys, xs].astype(np.int32)
+    peak = np.maximum(px[:, 0], px[:, 2])
+    excess = px[:, 1] - peak
+    np.minimum(px[:, 3], np.clip(255 - excess * 255 // high, 0, 255), out=px[:, 3])
+    np.copyto(px[:, 1], peak, where=excess > 0)
+    px[px[:, 3] == 0] = 0
+    data[ys, xs] = px
+    return data
+
+
+def key_in_place(data, low=80, high=110, edge_radius=EDGE_RADIUS):
+    """
+    Key out green from an (H, W, 4) uint8 RGBA array in place.
+
+    Args:
+        data: RGBA pixels; modified in place and also returned
+        low: key strength (g - max(r, b)) at or below which pixels stay opaque
+        high: key strength at or above which pixels become fully transparent
+        edge_radius: width of the edge pass around keyed pixels (0 disables it)
+    """
+    span = high - low
+    height, width = data.shape[:2]
+    rows = min(BAND_ROWS, height)
+    peak = np.empty((rows, width), dtype=np.uint8)
+    key = np.empty((rows, width), dtype=np.int32)
+
+    for top in range(0, height, BAND_ROWS):
+        band = data[top:top + BAND_ROWS]
+        n = len(band)
+        r, g, b, a = band[..., 0], band[..., 1], band[..., 2], band[..., 3]
+        p, k = peak[:n], key[:n]
+
+        np.maximum(r, b, out=p)
+        np.subtract(g, p, out=k, dtype=np.int32)
+        k -= low
+        np.clip(k, 0, span, out=k)
+
+        # Opacity 0..255 from key strength, scaled by the existing alpha
+        k *= 255
+        k //= span
+        np.subtract(255, k, out=k)
+        k *= a
+        k += 127
+        k //= 255
+        np.copyto(a, k, casting='unsafe')
+
+        # Fully keyed pixels carry no colour, matching the hard-key output
+        band[a == 0] = 0
+    if edge_radius:
+        refine_edges(data, high, edge_radius)
+    return data
+
+
+def auto_thresholds(data, low_frac=LOW_FRAC, high_frac=HIGH_FRAC, border=8):
+    """
+    Derive (low, high) from the backdrop's key strength.
+
+    The median g - max(r, b) along the image border stands in for the screen
+    colour, so dim or unevenly lit screens key as cleanly as bright ones;
+    `high` is kept below the dimmest border pixels so no screen is left.
+    """
+    rgb = data[..., :3]
+    strips = [rgb[:border], rgb[-border:], rgb[:, :border], rgb[:, -border:]]
+    edge = np.concatenate([s.reshape(-1, 3) for s in strips]).astype(np.int16)
+    strengths = edge[:, 1] - np.maximum(edge[:, 0], edge[:, 2])
+    strength = float(np.median(strengths))
+    if strength < MIN_SCREEN_STRENGTH:
+        # No green screen on the border: only key unmistakable green
+        return int(255 * low_frac), int(255 * high_frac)
+    low = int(strength * low_frac)
+    high = min(strength * high_frac, np.percentile(strengths, 1) * FLOOR_MARGIN)
+    return low, max(low + 1, int(high))
+
+
+def remove_green_background_soft(input_path, output_path, low=None, high=None):
+    """
+    Key one image file and save the result.
+
+    low/high default to auto_thresholds(). Returns (output_path, transparent_ratio).
+    """
+    data = np.array(Image.open(input_path).convert('RGBA'))
+    if low is None or high is None:
+        low, high = auto_thresholds(data)
+    key_in_place(data, low, high)
+    Image.fromarray(data, 'RGBA').save(output_path)
+    return output_path, float(np.mean(data[..., 3] == 0))
+
+
+def _key_job(job):
+    input_path, output_path, low, high = job
+    return (input_path,) + remove_green_background_soft(input_path, output_path, low, high)
+
+
+def key_files(pairs, low=None, high=None, workers=None):
+    """
+    Key many images across worker processes.
+
+    Args:
+        pairs: iterable of (input_path, output_path)
+        low, high: fixed ramp bounds; per-image auto_thresholds() when None
+        workers: process count (defaults to the CPU count)
+
+    Yields (input_path, output_path, transparent_ratio) as each image is saved.
+    """
+    jobs = [(src, dst, low, high) for src, dst in pairs]
+    if not jobs:
+        return
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) == 1:
+        for job in jobs:
+            yield _key_job(job)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        # Small chunks keep results streaming back while later images are keyed
+        yield from pool.map(_key_job, jobs, chunksize=max(1, len(jobs) // (workers * 4)))
+
+
+def chroma_output_path(input_file):
+    """Output naming used by remove_background.py: *_chroma* -> images/*_transparent*."""
+    output_file = input_file.replace("_chroma", "_transparent")
+    return output_file.replace("generated_images/", "images/")
+
+
+if __name__ == "__main__":
+    import glob
+    import sys
+
+    files = sys.argv[1:] or (glob.glob("generated_images/*_chroma_*.png")
+                             + glob.glob("images/*_chroma*.png"))
+    count = 0
+    for src, dst, transparent in key_files((f, chroma_output_path(f)) for f in files):
+        print(f"Processed: {src} -> {dst} ({transparent:.1%} transparent)")
+        count += 1
+    print(f"Processed {count} files")
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "pillow",
+#   "numpy",
+# ]
+# ///
+
+"""
+Decoded deck cache for whole-deck analysis.
+
+The deck is decoded once into a memory-mapped (N, H, W, 4) uint8 array
+(.cache/deck/deck.npy) with a JSON sidecar listing each card's path, content
+digest and real size. Cards smaller than the largest card are stored top-left
+aligned with zero padding; cards are ordered so that every size group is a
+contiguous slice, which lets the batched statistics below work on views
+instead of copies. Changed files are re-decoded in place; a changed file list
+or a card larger than the array triggers a full rebuild.
+"""
+
+from PIL import Image
+import numpy as np
+import glob
+import hashlib
+import json
+import os
+
+CACHE_DIR = '.cache/deck'
+
+
+def file_digest(path):
+    """Content hash used to invalidate cached pixels."""
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'blake2b').hexdigest()
+
+
+def _decode(path):
+    return np.asarray(Image.open(path).convert('RGBA'))
+
+
+def _build(entries, array_path, index_path):
+    height = max(e['height'] for e in entries)
+    width = max(e['width'] for e in entries)
+    tmp_path = array_path + '.tmp'
+    pixels = np.lib.format.open_memmap(
+        tmp_path, mode='w+', dtype=np.uint8, shape=(len(entries), height, width, 4))
+    for i, entry in enumerate(entries):
+        pixels[i, :entry['height'], :entry['width']] = _decode(entry['path'])
+    pixels.flush()
+    del pixels
+    os.replace(tmp_path, array_path)
+    with open(index_path, 'w') as f:
+        json.dump({'entries': entries}, f, indent=1)
+
+
+def load_deck(pattern='images/*.png', cache_dir=CACHE_DIR, verbose=True):
+    """
+    Return (pixels, entries) for every image matching pattern.
+
+    pixels is a read-only memmap of shape (N, H, W, 4); entries[i] is a dict
+    with 'path', 'digest', 'width' and 'height' for pixels[i].
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    array_path = os.path.join(cache_dir, 'deck.npy')
+    index_path = os.path.join(cache_dir, 'deck.json')
+
+    paths = sorted(glob.glob(pattern))
+    if not paths:
+        raise FileNotFoundError(f'No images match {pattern}')
+    digests = {path: file_digest(path) for path in paths}
+
+    cached = []
+    if os.path.exists(array_path) and os.path.exists(index_path):
+        with open(index_path) as f:
+            cached = json.load(f)['entries']
+
+    if cached and sorted(e['path'] for e in cached) == paths:
+        pixels = np.load(array_path, mmap_mode='r+')
+        stale = [i for i, e in enumerate(cached) if e['digest'] != digests[e['path']]]
+        for i in stale:
+            entry = cached[i]
+            img = _decode(entry['path'])
+            h, w = img.shape[:2]
+            if h > pixels.shape[1] or w > pixels.shape[2] or (h, w) != (entry['height'], entry['width']):
+                # Size changed: group order and padding no longer hold
+                cached = []
+                break
+            pixels[i, :h, :w] = img
+            entry['digest'] = digests[entry['path']]
+        if cached:
+            if stale:
+                pixels.flush()
+                with open(index_path, 'w') as f:
+                    json.dump({'entries': cached}, f, indent=1)
+                if verbose:
+                    print(f"Deck cache: refreshed {len(stale)} changed card(s)")
+            del pixels
+            return np.load(array_path, mmap_mode='r'), cached
+
+    entries = []
+    for path in paths:
+        with Image.open(path) as img:
+            width, height = img.size
+        entries.append({'path': path, 'digest': digests[path], 'width': width, 'height': height})
+    entries.sort(key=lambda e: (e['height'], e['width'], e['path']))
+    if verbose:
+        print(f"Deck cache: decoding {len(entries)} images into {array_path}...")
+    _build(entries, array_path, index_path)
+    return np.load(array_path, mmap_mode='r'), entries
+
+
+def iter_size_groups(pixels, entries):
+    """Yield (start, stop, batch) with batch a view of equally sized cards."""
+    start = 0
+    while start < len(entries):
+        size = (entries[start]['height'], entries[start]['width'])
+        stop = start
+        while stop < len(entries) and (entries[stop]['height'], entries[stop]['width']) == size:
+            stop += 1
+        yield start, stop, pixels[start:stop, :size[0], :size[1]]
+        start = stop
+
+
+def _edge_strips(rgb, edge_width):
+    """Top, bottom, left and right strips, as detect_black_edges extracts them."""
+    return (rgb[:, :edge_width], rgb[:, -edge_width:],
+            rgb[:, :, :edge_width], rgb[:, :, -edge_width:])
+
+
+def batch_edge_stats(batch, threshold=50, edge_width=10):
+    """
+    Vectorized detect_black_edges over a (n, h, w, 4) batch.
+
+    Returns (black_percentage, avg_rgb) with shapes (n,) and (n, 3).
+    """
+    strips = _edge_strips(batch[..., :3], edge_width)
+    total = sum(s.shape[1] * s.shape[2] for s in strips)
+    black = sum((s <= threshold).all(axis=-1).sum(axis=(1, 2)) for s in strips)
+    rgb_sum = sum(s.sum(axis=(1, 2), dtype=np.uint64) for s in strips)
+    return black * 100.0 / total, rgb_sum / total
+
+
+def batch_light_edge_percentage(batch, threshold=200, edge_width=10):
+    """Vectorized detect_light_edges: percentage of edge pixels with mean RGB > threshold."""
+    strips = _edge_strips(batch[..., :3], edge_width)
+    total = sum(s.shape[1] * s.shape[2] for s in strips)
+    # mean(rgb) > t  <=>  sum(rgb) > 3t, which keeps the test in integers
+    light = sum((s.sum(axis=-1, dtype=np.uint16) > 3 * threshold).sum(axis=(1, 2)) for s in strips)
+    return light * 100.0 / total
+
+
+def batch_check_corners(batch, threshold=50, corner_size=20):
+    """
+    Vectorized check_corners.
+
+    Returns {corner_name: (black_ratio, avg_brightness)} with (n,) arrays.
+    """
+    rgb = batch[..., :3]
+    corners = {
+        'top_left': rgb[:, :corner_size, :corner_size],
+        'top_right': rgb[:, :corner_size, -corner_size:],
+        'bottom_left': rgb[:, -corner_size:, :corner_size],
+        'bottom_right': rgb[:, -corner_size:, -corner_size:],
+    }
+    stats = {}
+    for name, corner in corners.items():
+        black = (corner <= threshold).all(axis=-1).mean(axis=(1, 2))
+        stats[name] = (black, corner.mean(axis=(1, 2, 3)))
+    return stats
+
+
+def batch_brightness(batch):
+    """
+    Mean and standard deviation of grey level per card (alpha ignored).
+
+    Computed for the whole batch at once from exact integer sums of r+g+b and
+    its square, which avoids materialising a float copy of the deck.
+    """
+    grey3 = batch[..., 0].astype(np.uint16) + batch[..., 1] + batch[..., 2]
+    count = grey3.shape[1] * grey3.shape[2]
+    s1 = grey3.sum(axis=(1, 2), dtype=np.uint64)
+    s2 = np.einsum('ijk,ijk->i', grey3, grey3, dtype=np.uint64)
+    # var * 9 * count^2 = count * s2 - s1^2, exact in uint64 for card-sized images
+    mean = s1 / (3 * count)
+    std = np.sqrt((count * s2 - s1 * s1).astype(np.float64)) / (3 * count)
+    return mean, std
+
+
+def deck_edge_report(pattern='images/*.png', threshold=50, edge_width=10):
+    """
+    Black-edge statistics for the whole deck from the cache.
+
+    Returns {path: (black_percentage, edge_stats)} where edge_stats has the
+    same keys as detect_black_edges() produces, plus the whole card's grey
+    level as 'card_brightness' and 'card_brightness_std'.
+    """
+    pixels, entries = load_deck(pattern)
+    report = {}
+    for start, stop, batch in iter_size_groups(pixels, entries):
+        black_pct, avg_rgb = batch_edge_stats(batch, threshold, edge_width)
+        strips = _edge_strips(batch, edge_width)
+        total = sum(s.shape[1] * s.shape[2] for s in strips)
+        black_count = np.rint(black_pct * total / 100).astype(int)
+        corners = batch_check_corners(batch, threshold)
+        card_mean, card_std = batch_brightness(batch)
+        for k, entry in enumerate(entries[start:stop]):
+            report[entry['path']] = (float(black_pct[k]), {
+                'avg_rgb': avg_rgb[k].tolist(),
+                'avg_brightness': float(avg_rgb[k].mean()),
+                'black_pixel_count': int(black_count[k]),
+                'total_edge_pixels': total,
+                'card_brightness': float(card_mean[k]),
+                'card_brightness_std': float(card_std[k]),
+                'corners': {name: {'black_ratio': float(ratio[k]), 'avg_brightness': float(bright[k])}
+                            for name, (ratio, bright) in corners.items()},
+            })
+    return report
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    pattern = sys.argv[1] if len(sys.argv) > 1 else 'images/*.png'
+    t0 = time.perf_counter()
+    pixels, entries = load_deck(pattern)
+    t1 = time.perf_counter()
+    print(f"Loaded {len(entries)} cards as {pixels.shape} in {t1 - t0:.2f}s")
+
+    print(f"{'Card':<28} {'Black edge %':>12} {'Light edge %':>12} {'Brightness':>10} {'Std':>6}")
+    print("=" * 72)
+    for start, stop, batch in iter_size_groups(pixels, entries):
+        black_pct, _ = batch_edge_stats(batch)
+        light_pct = batch_light_edge_percentage(batch)
+        mean, std = batch_brightness(batch)
+        for k, entry in enumerate(entries[start:stop]):
+            print(f"{os.path.basename(entry['path']):<28} {black_pct[k]:>12.1f} {light_pct[k]:>12.1f} "
+                  f"{mean[k]:>10.1f} {std[k]:>6.1f}")
+    print(f"\nAudit time (excluding cache load): {time.perf_counter() - t1:.2f}s")
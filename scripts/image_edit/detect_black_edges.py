@@ -9,9 +9,10 @@
 
 from PIL import Image
 import numpy as np
-import glob
 import os
 
+from deck_cache import deck_edge_report
+
 def detect_black_edges(image_path, threshold=50, edge_width=10, black_pixel_ratio=0.3):
     """
     Detect if an image has black edges.
@@ -97,20 +98,22 @@ def check_corners(img_array, threshold, corner_size=20):
     
     return corner_stats
 
-def analyze_all_cards():
+def analyze_all_cards(black_pixel_ratio=0.3):
     """Analyze all tarot cards for black edges."""
-    image_files = sorted(glob.glob("images/*.png"))
+    # Batched over the decoded deck cache instead of decoding each PNG
+    report = deck_edge_report("images/*.png")
     
-    print(f"Analyzing {len(image_files)} images for black edges...")
+    print(f"Analyzing {len(report)} images for black edges...")
     print("=" * 80)
     
     problematic_images = []
     borderline_images = []
     clean_images = []
     
-    for img_path in image_files:
+    for img_path in sorted(report):
         filename = os.path.basename(img_path)
-        has_black_edges, black_percentage, edge_stats = detect_black_edges(img_path)
+        black_percentage, edge_stats = report[img_path]
+        has_black_edges = black_percentage > (black_pixel_ratio * 100)
         
         if has_black_edges:
             problematic_images.append((filename, black_percentage, edge_stats))
@@ -134,6 +137,8 @@ def analyze_all_cards():
         print("\nImages that need fixing (black edges detected):")
         for filename, percentage, stats in problematic_images:
             print(f"  - {filename} ({percentage:.1f}% black)")
+            # A dark edge on a dark card may be artwork rather than a border
+            print(f"    Card brightness: {stats['card_brightness']:.1f} ± {stats['card_brightness_std']:.1f}")
             # Check which edges are worst
             corners = stats.get('corners', {})
             worst_corners = [name for name, data in corners.items() if data['black_ratio'] > 0.5]
@@ -11,6 +11,8 @@ from PIL import Image
 import numpy as np
 import os
 
+from deck_cache import batch_light_edge_percentage, iter_size_groups, load_deck
+
 def detect_light_edges(image_path, threshold=200, edge_width=10):
     """
     Detect if an image has white/light edges.
@@ -137,20 +139,21 @@ def process_specific_cards():
         # Add any other cards with white edges here
     ]
     
-    # First check all cards for light edges
+    # First check all cards for light edges, batched over the deck cache
     print("Checking all cards for white/light edges...")
-    import glob
-    all_cards = glob.glob("images/*.png")
-    
-    for card_path in all_cards:
-        if "backup" in card_path or "test" in card_path:
-            continue
-        filename = os.path.basename(card_path)
-        has_light = detect_light_edges(card_path)
-        if has_light:
-            print(f"  Found light edges: {filename}")
-            if filename not in cards_to_fix:
-                cards_to_fix.append(filename)
+    pixels, entries = load_deck("images/*.png")
+    
+    for start, stop, batch in iter_size_groups(pixels, entries):
+        light_percentage = batch_light_edge_percentage(batch)
+        for entry, percentage in zip(entries[start:stop], light_percentage):
+            card_path = entry['path']
+            if "backup" in card_path or "test" in card_path:
+                continue
+            filename = os.path.basename(card_path)
+            if percentage > 30:  # Same cut-off as detect_light_edges
+                print(f"  Found light edges: {filename}")
+                if filename not in cards_to_fix:
+                    cards_to_fix.append(filename)
     
     print(f"\nProcessing {len(cards_to_fix)} cards with edge issues...")
     print("=" * 60)
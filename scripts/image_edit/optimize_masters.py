@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "pillow",
+#   "numpy",
+# ]
+# ///
+
+"""
+Normalize and losslessly recompress the master deck.
+
+For each card in images/:
+1. Normalize to the canonical 600x1000 size (LANCZOS, as fix_white_edges does)
+2. Reduce the mode where it loses nothing: drop an all-opaque alpha channel,
+   store greyscale as L and images with at most 256 colours as a palette
+3. Encode with zlib level 9 under each candidate strategy and keep the smallest
+4. Decode the result and verify it pixel-for-pixel against the normalized image
+
+Backups in images/backup_* get steps 2-4 only, so they stay originals.
+Files are processed across a process pool. Without --apply, results go to
+.cache/optimized/ for review (kept out of images/ so the deck and phash
+index never pick them up).
+
+Usage:
+    python optimize_masters.py                      # dry run into .cache/optimized/
+    python optimize_masters.py --apply              # replace masters in place
+    python optimize_masters.py --apply --backups    # also recompress images/backup_*
+"""
+
+from PIL import Image
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import glob
+import io
+import os
+
+TARGET_SIZE = (600, 1000)
+# zlib strategies: default and filtered (the others never win on card art)
+STRATEGIES = (0, 1)
+OUTPUT_DIR = '.cache/optimized'
+
+
+def reduce_mode(img):
+    """Return the smallest lossless equivalent of img (L, P, RGB or RGBA)."""
+    if img.mode not in ('RGB', 'RGBA'):
+        img = img.convert('RGBA')
+    data = np.asarray(img)
+    if img.mode == 'RGBA' and data[..., 3].min() == 255:
+        img = img.convert('RGB')
+        data = data[..., :3]
+
+    rgb = data[..., :3]
+    if img.mode == 'RGB' and (rgb[..., 0] == rgb[..., 1]).all() and (rgb[..., 1] == rgb[..., 2]).all():
+        return Image.fromarray(np.ascontiguousarray(rgb[..., 0]), 'L')
+
+    colors = img.getcolors(256)
+    if colors is None:
+        return img
+    palette = [color for _, color in colors]
+    channels = len(palette[0])
+    lookup = {color: i for i, color in enumerate(palette)}
+    flat = data.reshape(-1, channels)
+    codes = np.zeros(len(flat), dtype=np.uint8)
+    for color, index in lookup.items():
+        codes[(flat == color).all(axis=1)] = index
+    result = Image.fromarray(codes.reshape(data.shape[:2]), 'P')
+    result.putpalette([c for color in palette for c in color[:3]])
+    if channels == 4:
+        result.info['transparency'] = bytes(color[3] for color in palette)
+    return result
+
+
+def encode_smallest(img):
+    """Encode img as PNG with every strategy in STRATEGIES; return the smallest bytes."""
+    best = None
+    params = {}
+    if img.mode == 'P' and 'transparency' in img.info:
+        params['transparency'] = img.info['transparency']
+    for strategy in STRATEGIES:
+        buf = io.BytesIO()
+        img.save(buf, 'PNG', compress_level=9, compress_type=strategy, **params)
+        if best is None or buf.tell() < len(best):
+            best = buf.getvalue()
+    return best
+
+
+def _pixels(img):
+    return np.asarray(img.convert('RGBA'))
+
+
+def optimize_image(job):
+    """
+    Optimize one image; job is (input_path, output_path, normalize).
+
+    Returns a dict describing the result. The output is only written when the
+    re-decoded pixels match and the file either shrinks or was normalized.
+    """
+    input_path, output_path, normalize = job
+    original_size = os.path.getsize(input_path)
+    src = Image.open(input_path)
+    src.load()
+    info = {'path': input_path, 'before': original_size, 'mode_before': src.mode,
+            'size_before': src.size, 'resized': False}
+
+    img = src if src.mode in ('RGB', 'RGBA') else src.convert('RGBA')
+    if normalize and img.size != TARGET_SIZE:
+        img = img.resize(TARGET_SIZE, Image.Resampling.LANCZOS)
+        info['resized'] = True
+
+    reference = _pixels(img)
+    reduced = reduce_mode(img)
+    data = encode_smallest(reduced)
+
+    decoded = Image.open(io.BytesIO(data))
+    info['verified'] = bool(np.array_equal(_pixels(decoded), reference))
+    info['mode_after'] = reduced.mode
+    info['after'] = len(data)
+
+    changed = info['resized'] or reduced.mode != src.mode
+    info['written'] = info['verified'] and (changed or len(data) < original_size)
+    if info['written']:
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+        tmp_path = output_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, output_path)
+    else:
+        info['after'] = original_size
+    return info
+
+
+def optimize_deck(apply=False, backups=False, workers=None):
+    """Optimize the master deck (and optionally backups); print a savings report."""
+    jobs = []
+    for path in sorted(glob.glob('images/*.png')):
+        out = path if apply else os.path.join(OUTPUT_DIR, os.path.basename(path))
+        jobs.append((path, out, True))
+    if backups:
+        for path in sorted(glob.glob('images/backup_*/*.png')):
+            out = path if apply else os.path.join(OUTPUT_DIR, os.path.relpath(path, 'images'))
+            jobs.append((path, out, False))
+
+    print(f"Optimizing {len(jobs)} images{' in place' if apply else f' into {OUTPUT_DIR}/'}...")
+    print("=" * 80)
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for info in pool.map(optimize_image, jobs):
+            results.append(info)
+            name = os.path.relpath(info['path'], 'images')
+            saved = info['before'] - info['after']
+            notes = []
+            if info['resized']:
+                notes.append(f"{info['size_before'][0]}x{info['size_before'][1]} -> {TARGET_SIZE[0]}x{TARGET_SIZE[1]}")
+            if info['mode_after'] != info['mode_before']:
+                notes.append(f"{info['mode_before']} -> {info['mode_after']}")
+            if not info['verified']:
+                print(f"❌ {name}: pixel verification failed, left unchanged")
+            elif info['written']:
+                print(f"✅ {name}: {info['before'] / 1024:,.0f} KB -> {info['after'] / 1024:,.0f} KB "
+                      f"({saved / info['before']:.1%}) {', '.join(notes)}")
+            else:
+                print(f"   {name}: already optimal")
+
+    before = sum(r['before'] for r in results)
+    after = sum(r['after'] for r in results)
+    print("\n" + "=" * 80)
+    print("SIZE REPORT")
+    print("=" * 80)
+    print(f"Images:    {len(results)} ({sum(r['written'] for r in results)} rewritten, "
+          f"{sum(r['resized'] for r in results)} resized, "
+          f"{sum(not r['verified'] for r in results)} failed verification)")
+    print(f"Before:    {before / 1024 / 1024:.1f} MB")
+    print(f"After:     {after / 1024 / 1024:.1f} MB")
+    if before:
+        print(f"Saved:     {(before - after) / 1024 / 1024:.1f} MB ({(before - after) / before:.1%})")
+    if not apply:
+        print(f"\nReview {OUTPUT_DIR}/, then re-run with --apply to replace the masters.")
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    optimize_deck(apply='--apply' in sys.argv, backups='--backups' in sys.argv)
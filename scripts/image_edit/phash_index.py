@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# dependencies = [
+#   "pillow",
+#   "numpy",
+# ]
+# ///
+
+"""
+Perceptual-hash index over every deck asset.
+
+Each PNG under images/ (backups and variants included) and generated_images/
+gets a 64-bit dHash (gradient) and a 64-bit pHash (low DCT frequencies). The
+index lives in .cache/phash/index.npz and is updated incrementally: only files
+whose size or mtime changed are decoded again. Distances are the summed
+Hamming distance of both hashes (0-128), computed with vectorized XOR and
+popcount, so a query over thousands of assets takes milliseconds.
+
+Usage:
+    python phash_index.py                           # update index, list near-duplicates
+    python phash_index.py --nearest images/13_death.png [k]
+    python phash_index.py --snapshot                # record the current deck as baseline
+    python phash_index.py --drift [threshold]       # compare the deck against the baseline
+"""
+
+from PIL import Image
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+import glob
+import json
+import os
+
+CACHE_DIR = '.cache/phash'
+INDEX_PATH = os.path.join(CACHE_DIR, 'index.npz')
+BASELINE_PATH = os.path.join(CACHE_DIR, 'baseline.json')
+ASSET_PATTERNS = ('images/**/*.png', 'generated_images/**/*.png')
+DECK_PATTERN = 'images/*.png'
+
+DUPLICATE_THRESHOLD = 10   # near-identical art (re-encodes, resizes, variants)
+DRIFT_THRESHOLD = 24       # same card, visibly different art
+
+_BITS = 1 << np.arange(64, dtype=np.uint64)
+
+
+def _dct_matrix(n=32):
+    k = np.arange(n)[:, None]
+    m = np.cos(np.pi * (2 * np.arange(n)[None, :] + 1) * k / (2 * n)) * np.sqrt(2 / n)
+    m[0] /= np.sqrt(2)
+    return m
+
+
+_DCT = _dct_matrix()
+
+
+def _pack(bits):
+    """Pack (n, 64) booleans into (n,) uint64."""
+    return (bits.astype(np.uint64) * _BITS).sum(axis=1, dtype=np.uint64)
+
+
+def thumbnails(path):
+    """Greyscale 9x8 (dHash) and 32x32 (pHash) thumbnails of one image."""
+    with Image.open(path) as img:
+        if img.mode in ('RGBA', 'LA', 'P'):
+            # Hash what is visible: transparent areas composite onto black
+            img = img.convert('RGBA')
+            backdrop = Image.new('RGBA', img.size, (0, 0, 0, 255))
+            img = Image.alpha_composite(backdrop, img)
+        grey = img.convert('L')
+        small = np.asarray(grey.resize((9, 8), Image.Resampling.BOX), dtype=np.int16)
+        large = np.asarray(grey.resize((32, 32), Image.Resampling.BOX), dtype=np.float32)
+    return small, large
+
+
+def hash_thumbnails(small, large):
+    """Vectorized dHash and pHash for stacked (n, 8, 9) and (n, 32, 32) thumbnails."""
+    dhash = _pack((small[:, :, 1:] > small[:, :, :-1]).reshape(len(small), 64))
+    coeffs = np.einsum('ij,njk,lk->nil', _DCT, large, _DCT)[:, :8, :8].reshape(len(large), 64)
+    median = np.median(coeffs[:, 1:], axis=1, keepdims=True)
+    phash = _pack(coeffs > median)
+    return dhash, phash
+
+
+def hamming(a, b):
+    """Elementwise Hamming distance between uint64 arrays (broadcasting)."""
+    x = np.bitwise_xor(a, b)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x).astype(np.int32)
+    return np.unpackbits(x[..., None].view(np.uint8), axis=-1).sum(axis=-1, dtype=np.int32)
+
+
+def _empty_index():
+    return {'paths': np.array([], dtype=str), 'sizes': np.array([], dtype=np.int64),
+            'mtimes': np.array([], dtype=np.int64), 'dhash': np.array([], dtype=np.uint64),
+            'phash': np.array([], dtype=np.uint64)}
+
+
+def load_index():
+    if not os.path.exists(INDEX_PATH):
+        return _empty_index()
+    with np.load(INDEX_PATH) as data:
+        return {key: data[key] for key in data.files}
+
+
+def save_index(index):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = INDEX_PATH + '.tmp.npz'
+    np.savez(tmp_path, **index)
+    os.replace(tmp_path, INDEX_PATH)
+
+
+def update_index(patterns=ASSET_PATTERNS, workers=None, verbose=True):
+    """Rescan assets, hash new or changed files and return the saved index."""
+    paths = sorted({p for pattern in patterns for p in glob.glob(pattern, recursive=True)})
+    stats = [os.stat(p) for p in paths]
+    old = load_index()
+    known = {p: i for i, p in enumerate(old['paths'])}
+
+    dhash = np.zeros(len(paths), dtype=np.uint64)
+    phash = np.zeros(len(paths), dtype=np.uint64)
+    todo = []
+    for i, (path, st) in enumerate(zip(paths, stats)):
+        j = known.get(path)
+        if j is not None and old['sizes'][j] == st.st_size and old['mtimes'][j] == st.st_mtime_ns:
+            dhash[i], phash[i] = old['dhash'][j], old['phash'][j]
+        else:
+            todo.append(i)
+
+    if todo:
+        if verbose:
+            print(f"Hashing {len(todo)} new or changed image(s)...")
+        todo_paths = [paths[i] for i in todo]
+        if len(todo) > 8:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                thumbs = list(pool.map(thumbnails, todo_paths, chunksize=16))
+        else:
+            thumbs = [thumbnails(p) for p in todo_paths]
+        d, p = hash_thumbnails(np.stack([t[0] for t in thumbs]), np.stack([t[1] for t in thumbs]))
+        dhash[todo], phash[todo] = d, p
+
+    index = {'paths': np.array(paths, dtype=str),
+             'sizes': np.array([st.st_size for st in stats], dtype=np.int64),
+             'mtimes': np.array([st.st_mtime_ns for st in stats], dtype=np.int64),
+             'dhash': dhash, 'phash': phash}
+    removed = len(set(known) - set(paths))
+    if todo or removed:
+        save_index(index)
+    if verbose:
+        print(f"Index: {len(paths)} assets ({len(todo)} hashed, {removed} removed)")
+    return index
+
+
+def distances(index, dhash, phash):
+    """Combined dHash + pHash distance from one hash pair to every indexed asset."""
+    return hamming(index['dhash'], np.uint64(dhash)) + hamming(index['phash'], np.uint64(phash))
+
+
+def nearest(index, path, k=5):
+    """Return [(distance, path)] for the k assets closest to path (itself excluded)."""
+    matches = np.flatnonzero(index['paths'] == path)
+    if len(matches):
+        d, p = index['dhash'][matches[0]], index['phash'][matches[0]]
+    else:
+        small, large = thumbnails(path)
+        d, p = (h[0] for h in hash_thumbnails(small[None], large[None]))
+    dist = distances(index, d, p)
+    order = np.argsort(dist, kind='stable')
+    result = [(int(dist[i]), str(index['paths'][i])) for i in order if index['paths'][i] != path]
+    return result[:k]
+
+
+def near_duplicates(index, threshold=DUPLICATE_THRESHOLD, block=1024):
+    """Return [(distance, path_a, path_b)] for every pair within threshold."""
+    dh, ph, paths = index['dhash'], index['phash'], index['paths']
+    pairs = []
+    for start in range(0, len(paths), block):
+        stop = min(start + block, len(paths))
+        dist = (hamming(dh[start:stop, None], dh[None, :])
+                + hamming(ph[start:stop, None], ph[None, :]))
+        rows, cols = np.nonzero(dist <= threshold)
+        for r, c in zip(rows, cols):
+            if start + r < c:
+                pairs.append((int(dist[r, c]), str(paths[start + r]), str(paths[c])))
+    return sorted(pairs)
+
+
+def snapshot_baseline(index):
+    """Record the hashes of the canonical deck as the drift baseline."""
+    deck = set(glob.glob(DECK_PATTERN))
+    baseline = {str(p): [int(d), int(h)] for p, d, h in zip(index['paths'], index['dhash'], index['phash'])
+                if p in deck}
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(BASELINE_PATH, 'w') as f:
+        json.dump(baseline, f, indent=1, sort_keys=True)
+    return baseline
+
+
+def check_drift(index, threshold=DRIFT_THRESHOLD):
+    """
+    Compare the canonical deck with the baseline.
+
+    Returns [(path, distance, closest_baseline_path)] for cards that drifted
+    beyond threshold. A closest baseline card other than the card itself
+    suggests the art was swapped.
+    """
+    with open(BASELINE_PATH) as f:
+        baseline = json.load(f)
+    base_paths = np.array(sorted(baseline), dtype=str)
+    base_d = np.array([baseline[p][0] for p in base_paths], dtype=np.uint64)
+    base_p = np.array([baseline[p][1] for p in base_paths], dtype=np.uint64)
+    drifted = []
+    for path, d, p in zip(index['paths'], index['dhash'], index['phash']):
+        if path not in baseline:
+            continue
+        dist = hamming(base_d, d) + hamming(base_p, p)
+        own = int(dist[np.flatnonzero(base_paths == path)[0]])
+        if own > threshold:
+            drifted.append((str(path), own, str(base_paths[np.argmin(dist)])))
+    return drifted
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    index = update_index()
+
+    if len(sys.argv) > 1 and sys.argv[1] == '--nearest':
+        target = sys.argv[2]
+        k = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+        t0 = time.perf_counter()
+        matches = nearest(index, target, k)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"\nClosest to {target} ({len(index['paths'])} candidates, {elapsed:.2f} ms):")
+        for dist, path in matches:
+            print(f"  {dist:>3}  {path}")
+    elif len(sys.argv) > 1 and sys.argv[1] == '--snapshot':
+        baseline = snapshot_baseline(index)
+        print(f"Baseline recorded for {len(baseline)} cards in {BASELINE_PATH}")
+    elif len(sys.argv) > 1 and sys.argv[1] == '--drift':
+        if not os.path.exists(BASELINE_PATH):
+            print("No baseline yet; run with --snapshot first")
+            sys.exit(1)
+        threshold = int(sys.argv[2]) if len(sys.argv) > 2 else DRIFT_THRESHOLD
+        drifted = check_drift(index, threshold)
+        if not drifted:
+            print(f"✅ No card drifted beyond {threshold}")
+        for path, dist, closest in drifted:
+            swap = f" — now closest to {os.path.basename(closest)} (swapped?)" if closest != path else ''
+            print(f"❌ {os.path.basename(path)}: distance {dist} from baseline{swap}")
+    else:
+        t0 = time.perf_counter()
+        pairs = near_duplicates(index)
+        elapsed = (time.perf_counter() - t0) * 1000
+        print(f"\nNear-duplicate pairs (distance <= {DUPLICATE_THRESHOLD}), found in {elapsed:.1f} ms:")
+        if not pairs:
+            print("  none")
+        for dist, a, b in pairs:
+            print(f"  {dist:>3}  {a}  <->  {b}")
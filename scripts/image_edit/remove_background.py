@@ -38,16 +38,20 @@ def remove_green_background(input_path, output_path, color_threshold=100):
 
 if __name__ == "__main__":
     import glob
+    from chroma_key import chroma_output_path, key_files
     
     # Process all chroma images
     chroma_files = glob.glob("generated_images/*_chroma_*.png")
     chroma_files.extend(glob.glob("images/*_chroma*.png"))
     
-    for input_file in chroma_files:
-        # Create output filename
-        output_file = input_file.replace("_chroma", "_transparent")
-        output_file = output_file.replace("generated_images/", "images/")
-        
-        remove_green_background(input_file, output_file)
+    if "--soft" in sys.argv:
+        # Soft matte with edge despill, spread over worker processes
+        pairs = [(f, chroma_output_path(f)) for f in chroma_files]
+        for input_file, output_file, _ in key_files(pairs):
+            print(f"Processed: {input_file} -> {output_file}")
+    else:
+        # Hard-threshold key, one image at a time
+        for input_file in chroma_files:
+            remove_green_background(input_file, chroma_output_path(input_file))
     
     print(f"Processed {len(chroma_files)} files")
\ No newline at end of file
@@ -0,0 +1,595 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+"""
+Batch reading runner for bulk and scheduled (e.g. nightly daily) readings.
+
+Each subscriber record ({"id", "question", "language", "spread"}, all but id
+optional) goes through the same steps as shuffleCards() in index.html: choose
+a spread, optionally have the model weight the card pool (--plan), shuffle
+and draw with the OS CSPRNG, and stream an interpretation for the buildPrompt
+prompt. Readings run concurrently on an asyncio worker pool. A token bucket
+caps requests per minute across all workers, and transient provider errors
+are retried with backoff.
+
+Results are appended to a JSONL file as each reading completes. The file
+doubles as the checkpoint: on restart, subscribers whose reading is already
+in it are skipped, so an interrupted run resumes where it stopped. Failed
+readings are not written and are retried on the next run. Each line is a
+saved-reading record ({question, cards, spread, reading, time} plus run
+metadata), so the output can go straight into reading_archive.py.
+
+The default provider is a local stand-in that streams generated text with
+simulated prefill and decode latency (and optionally a KV cache per worker),
+for testing and load runs without an API key. openai, openrouter and ollama use the OpenAI-compatible chat API,
+with the key taken from TAROT_API_KEY.
+
+Usage:
+    python batch_readings.py SUBSCRIBERS.jsonl OUTPUT.jsonl [options]
+    python batch_readings.py --demo COUNT OUTPUT.jsonl [options]
+
+Options:
+    --provider fake|openai|openrouter|ollama   (default: fake)
+    --model NAME            model name (provider default otherwise)
+    --workers N             concurrent readings (default: 16)
+    --rate N                requests per minute across workers (default: 600)
+    --plan                  let the model choose spread and card pool, as the app does
+    --speedup X             run the fake provider X times faster than real time
+    --failure-rate P        share of fake provider requests that fail (default: 0)
+    --prefix-cache          fake provider keeps one KV cache slot per worker, like Ollama's parallel slots
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import itertools
+import json
+import os
+import random
+import re
+import statistics
+import time
+import urllib.error
+import urllib.request
+
+from deck import ALL_CARDS, SPREADS, format_card_list
+from prompts import (build_weighted_pool, choose_spread_fallback, draw_cards,
+                     interpretation_messages, parse_spread_response, pool_messages, sanitize_pool_response,
+                     spread_messages)
+from tokens import DEFAULT_ENCODING, MESSAGE_OVERHEAD, count_tokens, message_tokens
+
+DEFAULT_WORKERS = 16
+DEFAULT_RATE = 600          # requests per minute
+MAX_ATTEMPTS = 4
+RETRY_DELAY = 1.0           # seconds, doubled per attempt
+
+ENDPOINTS = {
+    'openai': ('https://api.openai.com/v1/chat/completions', 'gpt-4o-mini'),
+    'openrouter': ('https://openrouter.ai/api/v1/chat/completions', 'openai/gpt-4o-mini'),
+    'ollama': ('http://localhost:11434/v1/chat/completions', 'llama3.2'),
+}
+
+
+class ProviderError(Exception):
+    def __init__(self, message, retryable=False):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def extract_usage(data):
+    """Token counts from a response or final stream chunk, as extractUsage() in index.html."""
+    usage = data.get('usage') if isinstance(data, dict) else None
+    if not usage or usage.get('prompt_tokens') is None:
+        return None
+    details = usage.get('prompt_tokens_details') or {}
+    return {'input': usage['prompt_tokens'], 'cached': details.get('cached_tokens') or 0,
+            'output': usage.get('completion_tokens') or 0}
+
+
+class FakeProvider:
+    """
+    Local stand-in for a streaming chat completion API.
+
+    Waits base_latency plus uncached prompt tokens / prefill_rate before the
+    first token, then streams at decode_rate tokens per second. With
+    cache_slots, the provider keeps the KV state of the last prompt run in
+    each of that many slots, as Ollama does per parallel slot: a request takes
+    the free slot sharing the longest run of leading messages with it (or the
+    least recently used one) and skips prefilling those messages; with every
+    slot busy, nothing is cached. Prefixes shorter than cache_min_tokens are
+    never cached, and hits are rounded down to whole cache_block tokens
+    (OpenAI caches prompts of 1,024 tokens or more, in steps of 128). Replies
+    to the spread and pool planning requests like a well-behaved model, and
+    composes an interpretation from the cards in the prompt. failure_rate
+    makes that share of requests fail with a retryable error.
+    """
+
+    name = 'fake'
+
+    def __init__(self, model='fake-tarot', base_latency=0.15, prefill_rate=2000, decode_rate=120,
+                 failure_rate=0.0, speedup=1.0, seed=None, cache_slots=0, cache_min_tokens=0, cache_block=1,
+                 encoding=DEFAULT_ENCODING, message_overhead=MESSAGE_OVERHEAD):
+        self.model = model
+        self.base_latency = base_latency / speedup
+        self.prefill_rate = prefill_rate * speedup
+        self.decode_rate = decode_rate * speedup
+        self.failure_rate = failure_rate
+        self.rng = random.Random(seed)
+        self.cache_slots = cache_slots
+        self.slots = [None] * cache_slots   # last prompt run in each slot
+        self.last_used = [0] * cache_slots
+        self.busy = set()
+        self.clock = itertools.count(1)
+        self.cache_min_tokens = cache_min_tokens
+        self.cache_block = cache_block
+        self.encoding = encoding
+        self.message_overhead = message_overhead
+
+    def _claim_slot(self, messages):
+        """Prompt usage for messages, and the KV cache slot it runs in (None without one)."""
+        total = message_tokens(messages, self.encoding, self.message_overhead)
+        free = [i for i in range(self.cache_slots) if i not in self.busy]
+        if not free:
+            return {'input': total, 'cached': 0}, None
+
+        def shared(i):
+            prompt, n = self.slots[i] or [], 0
+            while n < min(len(prompt), len(messages) - 1) and prompt[n] == messages[n]:
+                n += 1
+            return n
+
+        # Best prefix match; on a miss, the least recently used slot
+        slot = max(free, key=lambda i: (shared(i), -self.last_used[i]))
+        n = shared(slot)
+        self.slots[slot] = messages
+        self.last_used[slot] = next(self.clock)
+        self.busy.add(slot)
+        cached = message_tokens(messages[:n], self.encoding, self.message_overhead, reply=0) if n else 0
+        cached -= cached % self.cache_block
+        return {'input': total, 'cached': cached if cached >= self.cache_min_tokens else 0}, slot
+
+    def prompt_usage(self, messages):
+        """Prompt tokens, and how many of them a KV cache slot covers, for a request run to completion."""
+        usage, slot = self._claim_slot(messages)
+        self.busy.discard(slot)
+        return usage
+
+    def reply_for(self, messages):
+        task, _, prompt = messages[-1]['content'].partition('\n')
+        if task == 'Task: spread':
+            return choose_spread_fallback(prompt.strip('"'))['name']
+        if task == 'Task: language':
+            return 'English'
+        if task == 'Task: pool':
+            question = prompt.lower()
+            selection = {'pool_size': 35, 'include_cards': [], 'weights': {'suits': {}, 'arcana': {}}}
+            if re.search(r'love|relationship|partner', question):
+                selection['weights']['suits']['Cups'] = 1.8
+                selection['include_cards'] = ['The Lovers', 'Two of Cups']
+            elif re.search(r'career|job|work|money', question):
+                selection['weights']['suits']['Pentacles'] = 1.7
+                selection['include_cards'] = ['Three of Pentacles', 'The Emperor']
+            return json.dumps(selection)
+
+        # Card lines follow the Spread line
+        card_lines = prompt.split('\nSpread: ', 1)[-1].split('\n', 1)[-1]
+        cards = re.findall(r'^(.+?): (.+?)(?: - (.+))?$', card_lines, re.M)
+        paragraphs = [f"In the {position} position, {card} speaks of {meaning.lower() or 'its suit'}. "
+                      f"Consider how this shows up in your situation right now."
+                      for position, card, meaning in cards]
+        filler = ("Taken together, the cards suggest a period of reflection before action. "
+                  "Trust what you already know, and take one small, concrete step this week.")
+        text = '\n\n'.join(paragraphs + [filler])
+        while len(text.split()) < 200:
+            text += ' ' + self.rng.choice(["Stay patient with the process.", "Notice what gives you energy.",
+                                           "Let go of what no longer serves you.", "Ask for support where needed."])
+        return text
+
+    async def stream(self, messages, usage=None, **params):
+        """Yield text pieces; if given, the usage dict is filled with token counts."""
+        prompt, slot = self._claim_slot(messages)
+        try:
+            await asyncio.sleep(self.base_latency + (prompt['input'] - prompt['cached']) / self.prefill_rate)
+            if self.failure_rate and self.rng.random() < self.failure_rate:
+                raise ProviderError('503 simulated overload', retryable=True)
+            # Stream three words at a time
+            words = re.findall(r'\S+\s*', self.reply_for(messages))
+            output = 0
+            for i in range(0, len(words), 3):
+                piece = ''.join(words[i:i + 3])
+                tokens = count_tokens(piece, self.encoding)
+                output += tokens
+                yield piece
+                await asyncio.sleep(tokens / self.decode_rate)
+        finally:
+            self.busy.discard(slot)
+        if usage is not None:
+            usage.update(prompt, output=output)
+
+    async def complete(self, messages, usage=None, **params):
+        return ''.join([piece async for piece in self.stream(messages, usage, **params)])
+
+
+class OpenAICompatibleProvider:
+    """Streaming chat completions over HTTP (OpenAI, OpenRouter, Ollama's /v1 API)."""
+
+    def __init__(self, name, api_key=None, model=None, workers=DEFAULT_WORKERS, timeout=120):
+        self.name = name
+        self.url, default_model = ENDPOINTS[name]
+        self.model = model or default_model
+        self.api_key = api_key
+        self.timeout = timeout
+        # Requests block in threads; one per concurrent reading
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+
+    def _request(self, messages, stream, **params):
+        headers = {'Content-Type': 'application/json'}
+        if self.api_key:
+            headers['Authorization'] = 'Bearer ' + self.api_key
+        if self.name == 'openrouter':
+            headers['X-Title'] = 'Tarot Reading App'
+        body = {'model': self.model, 'messages': messages, 'stream': stream, **params}
+        if stream:
+            # Token counts in a last chunk before [DONE]
+            if self.name == 'openrouter':
+                body['usage'] = {'include': True}
+            else:
+                body['stream_options'] = {'include_usage': True}
+        return urllib.request.Request(self.url, json.dumps(body).encode('utf-8'), headers)
+
+    def _open(self, request):
+        try:
+            return urllib.request.urlopen(request, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            raise ProviderError(f'HTTP {e.code}', retryable=e.code == 429 or e.code >= 500) from e
+        except (urllib.error.URLError, TimeoutError) as e:
+            raise ProviderError(str(e), retryable=True) from e
+
+    async def stream(self, messages, usage=None, **params):
+        """Yield text pieces; if given, the usage dict is filled with token counts."""
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue()
+        request = self._request(messages, True, **params)
+
+        def read():
+            try:
+                with self._open(request) as response:
+                    for raw in response:
+                        line = raw.decode('utf-8').strip()
+                        if not line.startswith('data:'):
+                            continue
+                        data = line[5:].strip()
+                        if data == '[DONE]':
+                            break
+                        chunk = json.loads(data)
+                        counts = extract_usage(chunk)
+                        if counts and usage is not None:
+                            usage.update(counts)
+                        choices = chunk.get('choices') or [{}]
+                        piece = (choices[0].get('delta') or {}).get('content')
+                        if piece:
+                            loop.call_soon_threadsafe(queue.put_nowait, piece)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, None)
+
+        reader = loop.run_in_executor(self.executor, read)
+        while (item := await queue.get()) is not None:
+            if isinstance(item, Exception):
+                raise item if isinstance(item, ProviderError) else ProviderError(str(item), retryable=True)
+            yield item
+        await reader
+
+    async def complete(self, messages, usage=None, **params):
+        def call():
+            with self._open(self._request(messages, False, **params)) as response:
+                data = json.load(response)
+            if usage is not None:
+                usage.update(extract_usage(data) or {})
+            return data['choices'][0]['message']['content']
+        return await asyncio.get_running_loop().run_in_executor(self.executor, call)
+
+
+class RateLimiter:
+    """Token bucket shared by all workers: `per_minute` requests, bursts up to `burst`."""
+
+    def __init__(self, per_minute, burst=None):
+        self.rate = per_minute / 60
+        self.capacity = burst or max(1.0, self.rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class BatchRunner:
+    """Runs readings for many subscribers; see run()."""
+
+    def __init__(self, provider, workers=DEFAULT_WORKERS, rate_per_minute=DEFAULT_RATE, plan=False,
+                 retry_delay=RETRY_DELAY):
+        self.provider = provider
+        self.workers = workers
+        self.limiter = RateLimiter(rate_per_minute)
+        self.plan = plan
+        self.retry_delay = retry_delay
+        self.stats = {'written': 0, 'failed': 0, 'retries': 0, 'latency': [], 'ttft': [],
+                      'input_tokens': 0, 'cached_tokens': 0, 'output_tokens': 0}
+
+    async def _call(self, fn):
+        """Rate-limit and retry one provider request; fn() returns an awaitable."""
+        for attempt in range(MAX_ATTEMPTS):
+            await self.limiter.acquire()
+            try:
+                return await fn()
+            except ProviderError as e:
+                if not e.retryable or attempt == MAX_ATTEMPTS - 1:
+                    raise
+                self.stats['retries'] += 1
+                await asyncio.sleep(self.retry_delay * 2 ** attempt * (0.5 + random.random()))
+
+    def _count_usage(self, usage):
+        for key in ('input', 'cached', 'output'):
+            self.stats[key + '_tokens'] += usage.get(key) or 0
+
+    async def _complete(self, messages, **params):
+        usage = {}
+        text = await self._call(lambda: self.provider.complete(messages, usage, **params))
+        self._count_usage(usage)
+        return text
+
+    async def _stream_text(self, messages, usage):
+        start = time.perf_counter()
+        ttft = None
+        pieces = []
+        usage.clear()
+        async for piece in self.provider.stream(messages, usage, temperature=0.7):
+            if ttft is None:
+                ttft = time.perf_counter() - start
+            pieces.append(piece)
+        return ''.join(pieces), ttft
+
+    async def _plan(self, question):
+        """Spread and card pool from the model, falling back like the app on errors."""
+        try:
+            reply = await self._complete(spread_messages(question), temperature=0.3, max_tokens=20)
+            spread = parse_spread_response(reply, question)
+        except ProviderError:
+            spread = choose_spread_fallback(question)
+        try:
+            reply = await self._complete(pool_messages(question), temperature=0.3)
+            pool = build_weighted_pool(ALL_CARDS, sanitize_pool_response(reply))
+        except ProviderError:
+            pool = ALL_CARDS
+        return spread, pool
+
+    async def reading(self, subscriber):
+        """Produce one reading record for a subscriber."""
+        question = (subscriber.get('question') or '').strip()
+        language = subscriber.get('language') or 'English'
+        start = time.perf_counter()
+
+        if subscriber.get('spread') in SPREADS:
+            spread, pool = SPREADS[subscriber['spread']], ALL_CARDS
+        elif self.plan:
+            spread, pool = await self._plan(question)
+        else:
+            spread, pool = choose_spread_fallback(question), ALL_CARDS
+
+        cards = draw_cards(pool, spread)
+        messages = interpretation_messages(question, spread, cards, language)
+        usage = {}
+        text, ttft = await self._call(lambda: self._stream_text(messages, usage))
+        if not text.strip():
+            raise ProviderError('empty interpretation')
+        self._count_usage(usage)
+
+        return {
+            'id': subscriber['id'],
+            'question': question or 'General reading',
+            'cards': format_card_list((c['name'], c['reversed']) for c in cards),
+            'spread': spread['name'],
+            'reading': text,
+            'time': int(time.time() * 1000),
+            'language': language,
+            'provider': self.provider.name,
+            'model': self.provider.model,
+            'prompt_tokens': usage.get('input') or message_tokens(messages),
+            'cached_tokens': usage.get('cached'),
+            'latency_ms': round((time.perf_counter() - start) * 1000),
+            'ttft_ms': round(ttft * 1000) if ttft is not None else None,
+        }
+
+    async def run(self, subscribers, output_path, progress=True):
+        """
+        Write a reading for every subscriber not already in output_path.
+
+        Subscribers without an id, and repeats of an id earlier in the input,
+        are left out and counted. Returns the stats dict (written, skipped,
+        invalid, duplicates, failed, retries, elapsed, latency and ttft
+        samples in seconds).
+        """
+        done = load_checkpoint(output_path)
+        todo, queued = [], set()
+        invalid = duplicates = 0
+        for subscriber in subscribers:
+            key = subscriber_id(subscriber)
+            if key is None:
+                invalid += 1
+            elif key in queued:
+                duplicates += 1
+            elif key not in done:
+                queued.add(key)
+                todo.append(subscriber)
+        self.stats.update(skipped=len(subscribers) - len(todo) - invalid - duplicates,
+                          invalid=invalid, duplicates=duplicates)
+        queue = asyncio.Queue()
+        for subscriber in todo:
+            queue.put_nowait(subscriber)
+        step = max(1, len(todo) // 10)
+        start = time.perf_counter()
+
+        with open(output_path, 'a', encoding='utf-8') as out:
+            async def worker():
+                while not queue.empty():
+                    subscriber = queue.get_nowait()
+                    try:
+                        record = await self.reading(subscriber)
+                    except Exception as e:
+                        self.stats['failed'] += 1
+                        print(f"❌ {subscriber['id']}: {e}")
+                        continue
+                    out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                    out.flush()
+                    self.stats['written'] += 1
+                    self.stats['latency'].append(record['latency_ms'] / 1000)
+                    if record['ttft_ms'] is not None:
+                        self.stats['ttft'].append(record['ttft_ms'] / 1000)
+                    if progress and self.stats['written'] % step == 0:
+                        minutes = (time.perf_counter() - start) / 60
+                        print(f"   {self.stats['written']:,}/{len(todo):,} readings "
+                              f"({self.stats['written'] / minutes:,.0f}/min)")
+
+            await asyncio.gather(*(worker() for _ in range(min(self.workers, len(todo)) or 1)))
+        self.stats['elapsed'] = time.perf_counter() - start
+        return self.stats
+
+
+def subscriber_id(record):
+    """The record's id as a string, or None if it has none."""
+    if not isinstance(record, dict) or record.get('id') is None or not str(record['id']).strip():
+        return None
+    return str(record['id'])
+
+
+def load_checkpoint(output_path):
+    """
+    Ids already written to output_path.
+
+    A line torn by a crash mid-write is cut off so appending stays valid JSONL.
+    Other lines that are not JSON records with an id are skipped with a
+    warning; their subscribers get a new reading.
+    """
+    if not os.path.exists(output_path):
+        return set()
+    with open(output_path, 'rb+') as f:
+        data = f.read()
+        end = data.rfind(b'\n') + 1
+        if end < len(data):
+            f.truncate(end)
+    done = set()
+    for number, line in enumerate(data[:end].splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            key = subscriber_id(json.loads(line))
+        except ValueError:
+            key = None
+        if key is None:
+            print(f"⚠️  {output_path}:{number}: not a reading record with an id, skipped")
+        else:
+            done.add(key)
+    return done
+
+
+def load_subscribers(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def demo_subscribers(count, seed=0):
+    """Synthetic subscribers asking a mix of daily, love, career and open questions."""
+    rng = random.Random(seed)
+    questions = ['Daily guidance', 'What should I focus on today?', 'Will my relationship grow stronger?',
+                 'How can I move forward in my career?', 'What do I need to understand about my path?',
+                 '', 'I need advice about a difficult situation at work', 'What does the week ahead hold?']
+    return [{'id': f'sub-{i:06d}', 'question': rng.choice(questions)} for i in range(count)]
+
+
+def make_provider(name, model=None, workers=DEFAULT_WORKERS, speedup=1.0, failure_rate=0.0, prefix_cache=False):
+    if name == 'fake':
+        return FakeProvider(**({'model': model} if model else {}), speedup=speedup, failure_rate=failure_rate,
+                            cache_slots=workers if prefix_cache else 0)
+    if name not in ENDPOINTS:
+        raise ValueError(f"Unknown provider: {name}")
+    return OpenAICompatibleProvider(name, os.environ.get('TAROT_API_KEY'), model, workers)
+
+
+def print_report(stats):
+    elapsed = stats['elapsed']
+    print("\n" + "=" * 60)
+    print("BATCH REPORT")
+    print("=" * 60)
+    print(f"Written:       {stats['written']:,} readings")
+    print(f"Resumed over:  {stats['skipped']:,} already in the output")
+    if stats['duplicates']:
+        print(f"Duplicates:    {stats['duplicates']:,} repeated ids in the input, generated once")
+    if stats['invalid']:
+        print(f"Invalid:       {stats['invalid']:,} subscribers without an id, skipped")
+    print(f"Failed:        {stats['failed']:,} (retried on the next run)")
+    print(f"Retries:       {stats['retries']:,}")
+    if stats['input_tokens']:
+        print(f"Tokens:        {stats['input_tokens']:,} in ({stats['cached_tokens'] / stats['input_tokens']:.0%} "
+              f"cached), {stats['output_tokens']:,} out")
+    print(f"Elapsed:       {elapsed:.1f}s")
+    if elapsed and stats['written']:
+        print(f"Throughput:    {stats['written'] / elapsed * 60:,.0f} readings/min")
+    for label, key in (('Latency', 'latency'), ('First token', 'ttft')):
+        samples = sorted(stats[key])
+        if samples:
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            print(f"{label + ':':<14} p50 {statistics.median(samples) * 1000:,.0f} ms, p95 {p95 * 1000:,.0f} ms")
+
+
+if __name__ == "__main__":
+    import sys
+
+    args = sys.argv[1:]
+    flags = {'--plan', '--prefix-cache'}
+    options = {}
+    positional = []
+    while args:
+        arg = args.pop(0)
+        if arg in flags:
+            options[arg] = True
+        elif arg.startswith('--'):
+            options[arg] = args.pop(0)
+        else:
+            positional.append(arg)
+
+    if '--demo' in options and len(positional) == 1:
+        subscribers = demo_subscribers(int(options['--demo']))
+        output = positional[0]
+    elif len(positional) == 2:
+        subscribers = load_subscribers(positional[0])
+        output = positional[1]
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+    workers = int(options.get('--workers', DEFAULT_WORKERS))
+    provider = make_provider(options.get('--provider', 'fake'), options.get('--model'), workers,
+                             float(options.get('--speedup', 1)), float(options.get('--failure-rate', 0)),
+                             options.get('--prefix-cache', False))
+    runner = BatchRunner(provider, workers, float(options.get('--rate', DEFAULT_RATE)),
+                         plan=options.get('--plan', False))
+    print(f"Generating readings for {len(subscribers):,} subscribers with {provider.name} "
+          f"({provider.model}), {workers} workers, {runner.limiter.rate * 60:,.0f} requests/min")
+    try:
+        stats = asyncio.run(runner.run(subscribers, output))
+    except KeyboardInterrupt:
+        print(f"\n⚠️  Interrupted; completed readings are in {output}. Re-run to resume.")
+        sys.exit(130)
+    print_report(stats)
+    sys.exit(1 if stats['failed'] else 0)
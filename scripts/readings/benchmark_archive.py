@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+"""
+Load a reading archive with synthetic histories and time its queries.
+
+Generates `count` saved readings spread over two years, in the app's export
+format, imports them, and reports import throughput and the latency of
+typical queries: full-text search (common and rare words, with filters),
+card and spread listings, deep keyset pages and the card/spread statistics.
+
+Usage: python scripts/readings/benchmark_archive.py [count] [db_path]
+
+An existing db_path is reused as-is, so large archives only need loading once.
+"""
+
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from deck import CARD_NAMES, SPREADS
+from reading_archive import PAGE_SIZE, card_frequency, import_history, open_archive, search, spread_counts
+
+START_MS = 1_704_067_200_000          # 2024-01-01
+SPAN_MS = 2 * 365 * 24 * 3600 * 1000
+
+QUESTIONS = [
+    "What should I focus on at work this month?", "Will my relationship grow stronger?",
+    "How can I find more balance in my life?", "Should I move to a new city?",
+    "What is blocking my creativity?", "Daily guidance", "What does the year ahead hold?",
+    "How do I handle conflict with my sister?", "Is it time to change careers?",
+    "What am I not seeing about my finances?", "General reading",
+]
+WORDS = ("change growth patience courage balance renewal conflict trust intuition harvest journey "
+         "partnership release healing ambition caution abundance clarity transition foundation "
+         "reflection discipline surrender opportunity wisdom boundary resilience").split()
+FILLER = "the a your this that with and of in to for is as it you be on".split()
+
+
+def synthetic_readings(count, seed=0):
+    """Yield records in the app's saved-reading format."""
+    rng = random.Random(seed)
+    spreads = list(SPREADS.values())
+    weights = [30, 40, 12, 8, 10]
+    for _ in range(count):
+        spread = rng.choices(spreads, weights)[0]
+        drawn = rng.sample(CARD_NAMES, spread['size'])
+        cards = ', '.join(name + (' (R)' if rng.random() < 0.3 else '') for name in drawn)
+        sentences = []
+        for name in drawn:
+            words = rng.choices(FILLER, k=8) + rng.choices(WORDS, k=3)
+            rng.shuffle(words)
+            sentences.append(f"{name} speaks of " + ' '.join(words) + '.')
+        # A rare word in roughly one reading per 10,000
+        if rng.random() < 0.0001:
+            sentences.append("An unusual serendipity surrounds this reading.")
+        yield {
+            'question': rng.choice(QUESTIONS),
+            'cards': cards,
+            'spread': spread['name'],
+            'reading': ' '.join(sentences),
+            'time': START_MS + rng.randrange(SPAN_MS),
+        }
+
+
+def _median_ms(fn, repeat=7):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def run_benchmark(count=200_000, db_path=None):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = db_path or os.path.join(tmp, 'archive.db')
+        reuse = db_path is not None and os.path.exists(db_path)
+        conn = open_archive(path)
+
+        if reuse:
+            count = conn.execute('SELECT COUNT(*) FROM readings').fetchone()[0]
+            print(f"Reusing {path} ({count:,} readings)")
+        else:
+            print(f"Importing {count:,} synthetic readings...")
+            t0 = time.perf_counter()
+            batch = []
+            for record in synthetic_readings(count):
+                batch.append(record)
+                if len(batch) == 5000:
+                    import_history(conn, batch, 'synthetic')
+                    batch = []
+            if batch:
+                import_history(conn, batch, 'synthetic')
+            elapsed = time.perf_counter() - t0
+            conn.execute('PRAGMA optimize')
+            size = os.path.getsize(path) + (os.path.getsize(path + '-wal') if os.path.exists(path + '-wal') else 0)
+            print(f"Imported in {elapsed:.1f}s ({count / elapsed:,.0f} readings/s), "
+                  f"database {size / 1024 / 1024:.0f} MB")
+
+        deep_cursor = conn.execute('SELECT id FROM readings ORDER BY id DESC LIMIT 1 OFFSET ?',
+                                   (count // 2,)).fetchone()[0]
+        queries = {
+            'latest page': lambda: search(conn),
+            'page at depth 50%': lambda: search(conn, after=deep_cursor),
+            'search common word': lambda: search(conn, 'courage'),
+            'search two words': lambda: search(conn, 'career courage'),
+            'search rare word': lambda: search(conn, 'serendipity'),
+            'search + card filter': lambda: search(conn, 'courage', card='The Tower'),
+            'search + spread + dates': lambda: search(conn, 'balance', spread='Celtic Cross',
+                                                      since='2025-03-01', until='2025-04-01'),
+            'card listing': lambda: search(conn, card='Death', reversed=True),
+            'spread listing': lambda: search(conn, spread='Five Card'),
+            'card frequency (all)': lambda: card_frequency(conn),
+            'card frequency (position)': lambda: card_frequency(conn, 'Celtic Cross', 9,
+                                                                since='2025-01', until='2025-12'),
+            'spread counts': lambda: spread_counts(conn),
+        }
+        print(f"\nQUERY LATENCY ({count:,} readings, {PAGE_SIZE} per page, median of 7)")
+        print("=" * 60)
+        results = {}
+        for name, fn in queries.items():
+            results[name] = _median_ms(fn)
+            print(f"{name:<28} {results[name]:>8.2f} ms")
+        conn.close()
+    return results
+
+
+if __name__ == "__main__":
+    import sys
+
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+                  sys.argv[2] if len(sys.argv) > 2 else None)
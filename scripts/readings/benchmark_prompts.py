@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+"""
+Compare prompt size, prefix cache hits and time to first token before and
+after the prompt restructuring.
+
+Before, each request type had its own instructions: the interpretation was one
+long user message with the instructions, the question, every card with its
+meaning line and, for other languages, a free-text language instruction. Now
+every request starts with the same system message (TAROT_PROMPT: the deck
+reference, the spreads and the instructions for every task) and the user
+message names the task and holds only the per-request fields.
+
+Requests are sent in the app's order: each reading makes a spread choice, a
+card pool, a language detection (when there is a question) and an
+interpretation request. They run against one KV cache slot that holds only
+the previous prompt (see FakeProvider), the least a provider can offer, so a
+prefix is reused only if the request before shares it.
+
+Part 1 counts prompt tokens per spread and request type for each provider,
+averaged over random draws in English and Japanese. "Cached" is the share of
+requests whose prefix came from the cache, "Uncached" what the provider still
+prefills. OpenAI and OpenRouter only cache prompts of 1,024 tokens or more, in
+steps of 128. Each table ends with the hit rate over all requests.
+
+Part 2 runs the same requests against the fake provider from batch_readings.py,
+configured per provider with a prefill rate, and reports time to first token.
+Latencies are simulated and scaled back to real time; they show the shape of
+the saving, not a measurement of any provider.
+
+Usage: python scripts/readings/benchmark_prompts.py [draws_per_spread]
+
+Token counts are exact for OpenAI's encoding when tiktoken is installed and
+estimated otherwise (see tokens.py).
+"""
+
+from contextlib import aclosing
+import asyncio
+import random
+import statistics
+import time
+
+from batch_readings import FakeProvider
+from deck import ALL_CARDS, SPREADS, card_meaning
+from prompts import draw_cards, interpretation_messages, language_messages, pool_messages, spread_messages
+from tokens import is_exact, message_tokens
+
+# encoding: tokenizer (None = estimate); overhead: chat template tokens per message;
+# prefill_rate: prompt tokens/s; cache_min_tokens: shortest cacheable prefix;
+# cache_block: granularity of cache hits in tokens
+PROVIDERS = {
+    'openai': {'encoding': 'o200k_base', 'overhead': 3, 'base_latency': 0.30, 'prefill_rate': 8000,
+               'cache_min_tokens': 1024, 'cache_block': 128},
+    'openrouter': {'encoding': 'o200k_base', 'overhead': 3, 'base_latency': 0.45, 'prefill_rate': 8000,
+                   'cache_min_tokens': 1024, 'cache_block': 128},
+    'ollama': {'encoding': None, 'overhead': 5, 'base_latency': 0.05, 'prefill_rate': 250,
+               'cache_min_tokens': 0, 'cache_block': 1},
+}
+
+QUESTIONS = {
+    'English': ['What should I focus on at work this month?', 'Will my relationship grow stronger?',
+                'How can I find more balance in my life?', ''],
+    'Japanese': ['今月は仕事で何に集中すべきですか？', '私たちの関係はもっと強くなりますか？'],
+}
+SPEEDUP = 50
+
+
+# Prompts as sent before the restructuring, kept for comparison
+
+def legacy_spread_messages(question):
+    return [{'role': 'user', 'content': (
+        'Select ONE tarot spread for: "' + question + '"\n\nMATCH FIRST RULE THAT APPLIES:\n\n'
+        '1. Contains "past present future" or "timeline" → Three Card\n'
+        '2. Starts with "will I" or "should I" or "is it" or contains "yes or no" → Single Card  \n'
+        '3. Contains "daily" or "today" or "this week" → Single Card\n'
+        '4. Contains "quit job" or "career change" or "move country" or "marriage" or "divorce" → Celtic Cross\n'
+        '5. Contains "life purpose" or "year ahead" or "general reading" → Celtic Cross\n'
+        '6. Contains "advice" or "what should I do" or "how can I" or "next steps" → Five Card\n'
+        '7. Contains "hidden" or "influences" or "what am I not seeing" → Seven Card\n'
+        '8. DEFAULT if no match → Three Card\n\n'
+        'Respond with ONLY: Single Card OR Three Card OR Five Card OR Seven Card OR Celtic Cross')}]
+
+
+def legacy_pool_messages(question):
+    return [{'role': 'system', 'content': 'Return only JSON, no other text.'},
+            {'role': 'user', 'content': f"""You are a tarot deck curator. Based on the user's question, select 30-40 relevant cards from the 78-card Rider-Waite deck.
+
+Return ONLY this JSON structure, no other text:
+{{
+  "pool_size": 35,
+  "include_cards": ["card names that must be included"],
+  "weights": {{
+    "suits": {{"Cups": 1.0, "Pentacles": 1.0, "Swords": 1.0, "Wands": 1.0}},
+    "arcana": {{"Major": 1.0, "Minor": 1.0}}
+  }}
+}}
+
+Guidelines:
+- Love questions: boost Cups (1.8), include "The Lovers", "Two of Cups"
+- Career: boost Pentacles (1.7), include "Three of Pentacles", "The Emperor"
+- Spiritual: boost Major Arcana (1.8), include "The Hermit", "The High Priestess"
+- Conflict: boost Swords (1.6)
+- Creative: boost Wands (1.6)
+
+Question: {question}"""}]
+
+
+def legacy_language_messages(question):
+    return [{'role': 'system', 'content': 'You are a language detection system. Detect the language of the text and '
+                                          'respond with ONLY the language name in English (e.g., "Japanese", '
+                                          '"Chinese", "Spanish", "English").'},
+            {'role': 'user', 'content': question}]
+
+
+def legacy_interpretation_messages(question, spread, cards, language='English'):
+    prompt = f"Question: {question or 'General reading'}\nSpread: {spread['name']}\n\nCards drawn:\n"
+    for position, card in zip(spread['positions'], cards):
+        reversed_ = ' (Reversed)' if card['reversed'] else ''
+        prompt += f"{position}: {card['name']}{reversed_} - {card_meaning(card['name'], card['reversed'])}\n"
+    prompt += ('\nPlease provide a cohesive interpretation that connects these cards and addresses the '
+               'question. Keep it insightful but concise (200-300 words).')
+    if language != 'English':
+        prompt += (f'\n\nIMPORTANT: The question was asked in {language}. You MUST respond in '
+                   f'{language}. Do not respond in any other language.')
+        system = f'You are an experienced tarot reader. You MUST respond in {language}. Do not use any other language.'
+    else:
+        system = 'You are an experienced tarot reader. Provide insightful, balanced interpretations.'
+    return [{'role': 'system', 'content': system}, {'role': 'user', 'content': prompt}]
+
+
+def requests(draws, seed=0):
+    """Yield (kind, legacy_messages, compact_messages) for the same readings, in app order."""
+    rng = random.Random(seed)
+    for language, questions in QUESTIONS.items():
+        for spread in SPREADS.values():
+            for _ in range(draws):
+                question = rng.choice(questions)
+                cards = draw_cards(ALL_CARDS, spread, rng)
+                yield 'Spread choice', legacy_spread_messages(question), spread_messages(question)
+                yield 'Card pool', legacy_pool_messages(question), pool_messages(question)
+                if question:
+                    yield 'Language', legacy_language_messages(question), language_messages(question)
+                yield (spread['name'], legacy_interpretation_messages(question, spread, cards, language),
+                       interpretation_messages(question, spread, cards, language))
+
+
+def make_fake(profile, speedup=1.0):
+    return FakeProvider(base_latency=profile['base_latency'], prefill_rate=profile['prefill_rate'],
+                        speedup=speedup, cache_slots=1, cache_min_tokens=profile['cache_min_tokens'],
+                        cache_block=profile['cache_block'], encoding=profile['encoding'], message_overhead=profile['overhead'])
+
+
+def token_table(name, profile, draws):
+    counts = {}
+    provider = make_fake(profile)
+    for kind, legacy, compact in requests(draws):
+        usage = provider.prompt_usage(compact)
+        legacy_tokens = message_tokens(legacy, profile['encoding'], profile['overhead'])
+        counts.setdefault(kind, []).append((legacy_tokens, usage['input'], usage['cached'] > 0,
+                                            usage['input'] - usage['cached']))
+
+    method = 'tiktoken' if profile['encoding'] and is_exact(profile['encoding']) else 'estimated'
+    print(f"\n{name.upper()} PROMPT TOKENS ({method}, mean per request)")
+    print("=" * 60)
+    print(f"{'Request':<16} {'Before':>8} {'After':>8} {'Cached':>8} {'Uncached':>9} {'Saved':>8}")
+    for kind, rows in counts.items():
+        before, after, hits, uncached = (statistics.mean(col) for col in zip(*rows))
+        print(f"{kind:<16} {before:>8.0f} {after:>8.0f} {hits:>8.0%} {uncached:>9.0f} {1 - uncached / before:>8.0%}")
+    rows = [row for kind_rows in counts.values() for row in kind_rows]
+    input_tokens = sum(row[1] for row in rows)
+    uncached = sum(row[3] for row in rows)
+    print(f"Cache hits: {statistics.mean(row[2] for row in rows):.0%} of requests, "
+          f"{1 - uncached / input_tokens:.0%} of prompt tokens")
+
+
+async def _ttft(provider, messages):
+    start = time.perf_counter()
+    async with aclosing(provider.stream(messages)) as pieces:
+        async for _ in pieces:
+            break
+    return (time.perf_counter() - start) * SPEEDUP
+
+
+async def ttft_table(name, profile, draws):
+    samples = {}
+    for version in ('legacy', 'compact'):
+        provider = make_fake(profile, SPEEDUP)
+        for kind, legacy, compact in requests(draws):
+            messages = legacy if version == 'legacy' else compact
+            samples.setdefault(kind, {}).setdefault(version, []).append(await _ttft(provider, messages))
+
+    print(f"\n{name.upper()} TIME TO FIRST TOKEN (simulated, {profile['prefill_rate']} prompt tokens/s, median)")
+    print("=" * 60)
+    print(f"{'Request':<16} {'Before':>10} {'After':>10} {'Faster':>8}")
+    for kind, versions in samples.items():
+        before = statistics.median(versions['legacy']) * 1000
+        after = statistics.median(versions['compact']) * 1000
+        print(f"{kind:<16} {before:>8.0f}ms {after:>8.0f}ms {1 - after / before:>8.0%}")
+
+
+def run_benchmark(draws=20):
+    for name, profile in PROVIDERS.items():
+        token_table(name, profile, draws)
+    for name, profile in PROVIDERS.items():
+        asyncio.run(ttft_table(name, profile, draws))
+
+
+if __name__ == "__main__":
+    import sys
+
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+"""
+Deck and spread definitions shared by the Python reading tools.
+
+Mirrors the data module of index.html (majorArcana, minorArcana, SPREADS and
+the card meanings): card names and image paths are built the same way, and
+spreads list their positions in draw order. Keep both in sync when cards,
+spreads or meanings change.
+"""
+
+MAJOR_ARCANA = [
+    "The Fool", "The Magician", "The High Priestess", "The Empress", "The Emperor",
+    "The Hierophant", "The Lovers", "The Chariot", "Strength", "The Hermit",
+    "Wheel of Fortune", "Justice", "The Hanged Man", "Death", "Temperance",
+    "The Devil", "The Tower", "The Star", "The Moon", "The Sun", "Judgement", "The World",
+]
+
+SUITS = ["wands", "cups", "swords", "pentacles"]
+
+_NUMBERS = ["", "", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine", "Ten"]
+_COURT = [("Page", "11_page"), ("Knight", "12_knight"), ("Queen", "13_queen"), ("King", "14_king")]
+
+
+def _major_image(index, name):
+    slug = name.lower().replace(' ', '_')
+    return f"images/{index:02d}_{slug}.png"
+
+
+def build_deck():
+    """Return the 78 cards as dicts with name, img, arcana and suit, in index.html order."""
+    cards = [{'name': name, 'img': _major_image(i, name), 'arcana': 'major', 'suit': None}
+             for i, name in enumerate(MAJOR_ARCANA)]
+    for suit in SUITS:
+        title = suit.capitalize()
+        cards.append({'name': f"Ace of {title}", 'img': f"images/{suit}_01_ace.png",
+                      'arcana': 'minor', 'suit': suit})
+        for i in range(2, 11):
+            cards.append({'name': f"{_NUMBERS[i]} of {title}", 'img': f"images/{suit}_{i:02d}.png",
+                          'arcana': 'minor', 'suit': suit})
+        for rank, file in _COURT:
+            cards.append({'name': f"{rank} of {title}", 'img': f"images/{suit}_{file}.png",
+                          'arcana': 'minor', 'suit': suit})
+    return cards
+
+
+ALL_CARDS = build_deck()
+CARD_NAMES = [card['name'] for card in ALL_CARDS]
+
+SPREADS = {
+    'Single Card': {
+        'name': 'Single Card',
+        'size': 1,
+        'positions': ['Answer'],
+        'description': 'Quick insight or daily guidance',
+    },
+    'Three Card': {
+        'name': 'Three Card',
+        'size': 3,
+        'positions': ['Past', 'Present', 'Future'],
+        'description': 'Timeline perspective',
+    },
+    'Five Card': {
+        'name': 'Five Card',
+        'size': 5,
+        'positions': ['Present Situation', 'Influences', 'Challenges', 'Advice', 'Potential Outcome'],
+        'description': 'Detailed situation analysis',
+    },
+    'Seven Card': {
+        'name': 'Seven Card',
+        'size': 7,
+        'positions': ['Past', 'Present', 'Hidden Influences', 'Advice', 'External Influences',
+                      'Hopes & Fears', 'Outcome'],
+        'description': 'Comprehensive reading',
+    },
+    'Celtic Cross': {
+        'name': 'Celtic Cross',
+        'size': 10,
+        'positions': ['Present Situation', 'Challenge/Cross', 'Foundation', 'Recent Past',
+                      'Crown/Best Outcome', 'Near Future', 'Self/Attitude', 'Environment',
+                      'Hopes & Fears', 'Final Outcome'],
+        'description': 'Most comprehensive for complex situations',
+    },
+}
+
+
+# Upright (u) and reversed (r) meanings; minor arcana fall back to SUIT_MEANINGS
+CARD_MEANINGS = {
+    'The Fool': {'u': 'New beginnings, innocence, spontaneity', 'r': 'Recklessness, risk-taking, foolishness'},
+    'The Magician': {'u': 'Manifestation, resourcefulness, power', 'r': 'Manipulation, poor planning, untapped talents'},
+    'The High Priestess': {'u': 'Intuition, sacred knowledge, divine feminine', 'r': 'Secrets, disconnected from intuition, withdrawal'},
+    'The Empress': {'u': 'Femininity, beauty, nature, abundance', 'r': 'Creative block, dependence on others'},
+    'The Emperor': {'u': 'Authority, structure, control, father figure', 'r': 'Tyranny, rigidity, coldness'},
+    'The Hierophant': {'u': 'Tradition, conformity, morality, ethics', 'r': 'Rebellion, subversiveness, new approaches'},
+    'The Lovers': {'u': 'Love, harmony, relationships, values', 'r': 'Disharmony, imbalance, misalignment'},
+    'The Chariot': {'u': 'Control, willpower, success, determination', 'r': 'Lack of control, lack of direction, aggression'},
+    'Strength': {'u': 'Inner strength, courage, patience, control', 'r': 'Self doubt, weakness, insecurity'},
+    'The Hermit': {'u': 'Soul searching, introspection, inner guidance', 'r': 'Isolation, loneliness, withdrawal'},
+    'Wheel of Fortune': {'u': 'Good luck, karma, life cycles, destiny', 'r': 'Bad luck, lack of control, clinging to control'},
+    'Justice': {'u': 'Justice, fairness, truth, cause and effect', 'r': 'Unfairness, lack of accountability, dishonesty'},
+    'The Hanged Man': {'u': 'Suspension, restriction, letting go', 'r': 'Martyrdom, indecision, delay'},
+    'Death': {'u': 'Endings, transformation, transition', 'r': 'Resistance to change, unable to move on'},
+    'Temperance': {'u': 'Balance, moderation, patience, purpose', 'r': 'Imbalance, excess, lack of long-term vision'},
+    'The Devil': {'u': 'Bondage, addiction, sexuality, materialism', 'r': 'Detachment, breaking free, power reclaimed'},
+    'The Tower': {'u': 'Sudden change, upheaval, chaos, revelation', 'r': 'Personal transformation, fear of change'},
+    'The Star': {'u': 'Hope, faith, purpose, renewal, spirituality', 'r': 'Lack of faith, despair, self-trust issues'},
+    'The Moon': {'u': 'Illusion, fear, anxiety, intuition, dreams', 'r': 'Release of fear, repressed emotion, clarity'},
+    'The Sun': {'u': 'Joy, success, celebration, positivity', 'r': 'Inner child, feeling down, overly optimistic'},
+    'Judgement': {'u': 'Reflection, reckoning, inner calling', 'r': 'Self doubt, inability to forgive, harsh judgment'},
+    'The World': {'u': 'Completion, accomplishment, travel, unity', 'r': 'Incomplete, no closure, seeking closure'},
+}
+
+SUIT_MEANINGS = {
+    'Wands': 'Creativity, action, inspiration',
+    'Cups': 'Emotions, relationships, intuition',
+    'Swords': 'Thoughts, communication, conflict',
+    'Pentacles': 'Material, career, manifestation',
+}
+
+# Number and court card meanings, combined with the suit's
+RANK_MEANINGS = {
+    'Ace': 'New beginnings, potential, a gift',
+    'Two': 'Balance, partnership, choices',
+    'Three': 'Growth, collaboration, expression',
+    'Four': 'Stability, rest, consolidation',
+    'Five': 'Conflict, loss, challenge',
+    'Six': 'Harmony, recovery, generosity',
+    'Seven': 'Reflection, perseverance, assessment',
+    'Eight': 'Movement, effort, mastery',
+    'Nine': 'Near completion, resilience, fulfilment',
+    'Ten': 'Completion, culmination, burden',
+    'Page': 'Curiosity, messages, a student',
+    'Knight': 'Action, pursuit, restlessness',
+    'Queen': 'Nurturing, inner mastery, intuition',
+    'King': 'Authority, outer mastery, leadership',
+}
+
+
+def card_meaning(name, reversed_=False):
+    """Meaning line for a card, as getCardMeaning() in index.html."""
+    if name in CARD_MEANINGS:
+        return CARD_MEANINGS[name]['r' if reversed_ else 'u']
+    if ' of ' in name:
+        meaning = SUIT_MEANINGS.get(name.rsplit(' of ', 1)[1], 'General insight')
+        return 'Blocked ' + meaning.lower() if reversed_ else meaning
+    return 'Challenges and obstacles' if reversed_ else 'Opportunities and growth'
+
+
+def parse_card_list(text):
+    """
+    Parse the saved-reading card string ("The Star, Death (R)") into
+    [(name, reversed)] in draw order.
+    """
+    cards = []
+    for part in (text or '').split(','):
+        name = part.strip()
+        if not name:
+            continue
+        reversed_ = name.endswith('(R)')
+        if reversed_:
+            name = name[:-3].rstrip()
+        cards.append((name, reversed_))
+    return cards
+
+
+def format_card_list(cards):
+    """Inverse of parse_card_list."""
+    return ', '.join(name + (' (R)' if reversed_ else '') for name, reversed_ in cards)
+
+
+if __name__ == "__main__":
+    import os
+
+    missing = [card['img'] for card in ALL_CARDS if not os.path.exists(card['img'])]
+    print(f"{len(ALL_CARDS)} cards, {len(SPREADS)} spreads")
+    if missing:
+        print(f"❌ {len(missing)} card images missing (run from the repository root):")
+        for path in missing:
+            print(f"  {path}")
+    else:
+        print("✅ All card images present")
